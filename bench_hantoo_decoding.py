@@ -0,0 +1,156 @@
+"""한투 API 응답 디코딩 마이크로 벤치마크
+
+기존 방식(response.text → json.loads → 전체 행 모델 생성 후 필터링)과
+hantoo_decoder 방식(bytes → orjson/json 파싱 → 행 필터링 후 검증 없이 모델 생성)을
+기록된 응답 본문으로 비교한다.
+
+- --record-dir 를 주면 해당 폴더의 <tr_id>.json 파일(실서버 응답 기록)을 사용
+- 없으면 fake_kis_server 대역 서버에 주문을 넣어 응답을 기록한 뒤 측정
+
+실행: python bench_hantoo_decoding.py [--symbols 40] [--orders 200] [--repeat 200] [--record-dir payloads/]
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+import urllib.parse
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from data.external.hantoo import hantoo_decoder
+from data.external.hantoo.hantoo_decoder import build, build_rows, loads
+from data.external.hantoo.hantoo_models import (
+    Balance1, Balance2, BalanceForTickerOutput1, BalanceForTickerOutput2, BalanceForTickerOutput3, OrderDetail
+)
+from fake_kis_server import FakeKisConfig, FakeKisServer
+
+# 대역 서버에서 기록할 조회 API (tr_id -> (경로, 파라미터))
+RECORD_TARGETS = {
+    "TTTS3035R": ("/uapi/overseas-stock/v1/trading/inquire-ccnl", {"PDNO": "%", "OVRS_EXCG_CD": "%"}),
+    "TTTS3012R": ("/uapi/overseas-stock/v1/trading/inquire-balance", {"OVRS_EXCG_CD": "NASD"}),
+    "CTRP6010R": ("/uapi/overseas-stock/v1/trading/inquire-paymt-stdr-balance", {}),
+}
+
+
+def _record_from_fake_server(symbols: int, orders: int):
+    """대역 서버에 주문을 넣고 조회 응답 본문(bytes)을 기록"""
+    names = [f"SYM{i:03d}" for i in range(symbols)]
+    server = FakeKisServer(FakeKisConfig(
+        latency=0.0, jitter=0.0, fill_delay=0.0, page_size=orders,
+        prices={name: 10.0 + i for i, name in enumerate(names)}
+    )).start()
+
+    def call(method, path, headers=None, body=None, params=None):
+        url = server.url + path
+        if params:
+            url += "?" + "&".join(f"{k}={urllib.parse.quote(v)}" for k, v in params.items())
+        data = json.dumps(body).encode() if body is not None else None
+        request = urllib.request.Request(url, data=data, method=method, headers=headers or {})
+        with urllib.request.urlopen(request) as response:
+            return response.read()
+
+    try:
+        token = json.loads(call("POST", "/oauth2/tokenP", body={"grant_type": "client_credentials"}))["access_token"]
+        auth = {"authorization": f"Bearer {token}", "content-type": "application/json"}
+        for n in range(orders):
+            call("POST", "/uapi/overseas-stock/v1/trading/order", headers=dict(auth, tr_id="TTTT1002U"), body={
+                "PDNO": names[n % symbols], "ORD_QTY": "1", "OVRS_ORD_UNPR": "100.0", "OVRS_EXCG_CD": "NASD"
+            })
+        return {
+            tr_id: call("GET", path, headers=dict(auth, tr_id=tr_id), params=params)
+            for tr_id, (path, params) in RECORD_TARGETS.items()
+        }
+    finally:
+        server.stop()
+
+
+def _load_recorded(record_dir: str):
+    """기록된 응답 파일 로드 (<tr_id>.json)"""
+    payloads = {}
+    for tr_id in RECORD_TARGETS:
+        path = os.path.join(record_dir, f"{tr_id}.json")
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                payloads[tr_id] = f.read()
+    return payloads
+
+
+# ===== 기존 방식 =====
+
+def legacy_fills(content: bytes, odnos: set):
+    data = json.loads(content.decode("utf-8"))
+    return [row for row in (OrderDetail(**row) for row in data["output"]) if row.odno in odnos]
+
+
+def legacy_balance(content: bytes):
+    data = json.loads(content.decode("utf-8"))
+    return [Balance1(**row) for row in data["output1"]], Balance2(**data["output2"])
+
+
+def legacy_ticker_balance(content: bytes, tickers: set):
+    data = json.loads(content.decode("utf-8"))
+    output1 = [BalanceForTickerOutput1(**row) for row in data["output1"]]
+    [BalanceForTickerOutput2(**row) for row in data["output2"]]
+    BalanceForTickerOutput3(**data["output3"])
+    return [row for row in output1 if row.pdno in tickers]
+
+
+# ===== 디코딩 레이어 =====
+
+def fast_fills(content: bytes, odnos: set):
+    return build_rows(OrderDetail, loads(content)["output"], where=lambda row: row.get("odno") in odnos)
+
+
+def fast_balance(content: bytes):
+    data = loads(content)
+    return build_rows(Balance1, data["output1"]), build(Balance2, data["output2"])
+
+
+def fast_ticker_balance(content: bytes, tickers: set):
+    data = loads(content)
+    build_rows(BalanceForTickerOutput2, data["output2"])
+    build(BalanceForTickerOutput3, data["output3"])
+    return build_rows(BalanceForTickerOutput1, data["output1"], where=lambda row: row.get("pdno") in tickers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="한투 API 응답 디코딩 벤치마크")
+    parser.add_argument("--symbols", type=int, default=40, help="보유 종목 수 (대역 서버 기록 시)")
+    parser.add_argument("--orders", type=int, default=200, help="체결 내역 행 수 (대역 서버 기록 시)")
+    parser.add_argument("--repeat", type=int, default=200, help="측정 반복 횟수")
+    parser.add_argument("--record-dir", default=None, help="기록된 응답 폴더 (<tr_id>.json)")
+    args = parser.parse_args()
+
+    payloads = _load_recorded(args.record_dir) if args.record_dir else _record_from_fake_server(args.symbols, args.orders)
+
+    # 실제 사용 패턴: 대기 중인 주문 몇 건, 봇이 관심 있는 종목 몇 개만 필요
+    fills = json.loads(payloads["TTTS3035R"])["output"] if "TTTS3035R" in payloads else []
+    odnos = {row["odno"] for row in fills[:4]}
+    holdings = json.loads(payloads["CTRP6010R"])["output1"] if "CTRP6010R" in payloads else []
+    tickers = {row["pdno"] for row in holdings[:3]}
+
+    cases = [
+        ("체결 내역", "TTTS3035R", lambda c: legacy_fills(c, odnos), lambda c: fast_fills(c, odnos)),
+        ("잔고", "TTTS3012R", legacy_balance, fast_balance),
+        ("결제기준 잔고", "CTRP6010R", lambda c: legacy_ticker_balance(c, tickers),
+         lambda c: fast_ticker_balance(c, tickers)),
+    ]
+
+    parser_name = "orjson" if hantoo_decoder.orjson is not None else "json (orjson 미설치)"
+    print(f"\n한투 응답 디코딩 벤치마크 (파서: {parser_name}, 반복 {args.repeat}회)\n" + "=" * 80)
+    for label, tr_id, legacy, fast in cases:
+        content = payloads.get(tr_id)
+        if content is None:
+            print(f"{label:<12} 기록 없음 ({tr_id}.json)")
+            continue
+        legacy_sec = min(timeit.repeat(lambda: legacy(content), number=args.repeat, repeat=3)) / args.repeat
+        fast_sec = min(timeit.repeat(lambda: fast(content), number=args.repeat, repeat=3)) / args.repeat
+        print(f"{label:<12} {len(content) / 1024:7.1f}KB  기존 {legacy_sec * 1e6:9.1f}µs  "
+              f"디코더 {fast_sec * 1e6:9.1f}µs  ({legacy_sec / fast_sec:4.1f}x)")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
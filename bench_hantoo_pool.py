@@ -0,0 +1,98 @@
+"""한투 API 커넥션 풀 지연시간 비교 스크립트
+
+로컬 대역 서버(HTTP/1.1 keep-alive)를 띄우고
+- 매 요청마다 requests.get 호출 (기존 방식, 연결 재수립)
+- HantooDataSource 공유 세션 (커넥션 풀 재사용)
+두 방식의 요청 지연시간을 비교한다.
+
+실행: python bench_hantoo_pool.py [요청 수] [스레드 수]
+"""
+import json
+import statistics
+import sys
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import requests
+
+from data.external.hantoo.hantoo_data_source import HantooDataSource
+
+PRICE_PATH = "/uapi/overseas-price/v1/quotations/price"
+PRICE_BODY = json.dumps({
+    "rt_cd": "0",
+    "msg_cd": "MCA00000",
+    "msg1": "정상처리 되었습니다.",
+    "output": {
+        "rsym": "DNASTQQQ", "zdiv": "4", "base": "52.10", "pvol": "0", "last": "52.33",
+        "sign": "2", "diff": "0.23", "rate": "0.44", "tvol": "0", "tamt": "0", "ordy": "매도불가"
+    }
+}).encode("utf-8")
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """현재가 엔드포인트만 흉내내는 대역 핸들러"""
+    protocol_version = "HTTP/1.1"  # keep-alive 지원
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(PRICE_BODY)))
+        self.end_headers()
+        self.wfile.write(PRICE_BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _run(label: str, call, count: int, workers: int) -> None:
+    latencies = []
+    lock = threading.Lock()
+
+    def one():
+        start = time.perf_counter()
+        call()
+        elapsed = (time.perf_counter() - start) * 1000
+        with lock:
+            latencies.append(elapsed)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for _ in range(count):
+            executor.submit(one)
+    total = time.perf_counter() - started
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(f"{label:<22}  평균 {statistics.mean(latencies):7.3f}ms  "
+          f"p50 {statistics.median(latencies):7.3f}ms  p95 {p95:7.3f}ms  "
+          f"총 {total:6.2f}s")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}{PRICE_PATH}"
+    params = {"AUTH": "", "EXCD": "NAS", "SYMB": "TQQQ"}
+
+    session = HantooDataSource.get_session(pool_size=workers)
+
+    print(f"\n커넥션 풀 지연시간 비교 (요청 {count}회, 스레드 {workers}개)\n" + "=" * 80)
+    _run("requests.get (풀 없음)", lambda: requests.get(url, params=params).json(), count, workers)
+    _run("공유 세션 (keep-alive)", lambda: session.get(url, params=params).json(), count, workers)
+    print("=" * 80)
+    print("※ 로컬 HTTP 기준이며, 실서버는 TLS 핸드셰이크 비용이 추가되어 차이가 더 커집니다.")
+
+    HantooDataSource.close_session()
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
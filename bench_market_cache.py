@@ -0,0 +1,75 @@
+"""시세 캐시 읽기 지연 벤치마크
+
+기존 방식(CSV → pd.read_csv + pd.to_datetime)과 컬럼 저장소(MarketBarStore) 방식의
+캐시 적중 시 읽기 시간을 합성 일봉 데이터로 비교한다.
+
+- 전체 컬럼 / Close만 / Close 마지막 60행 (이평선) / High·Low·Close 마지막 15행 (ATR)
+
+실행: python bench_market_cache.py [--rows 252] [--repeat 200]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from data.external.market_data.market_bar_store import MarketBarStore
+
+
+def _make_bars(rows: int) -> pd.DataFrame:
+    """yf.download 형태의 합성 일봉 데이터"""
+    rng = np.random.default_rng(0)
+    close = 50 * np.exp(np.cumsum(rng.normal(0, 0.02, rows)))
+    index = pd.bdate_range(end=pd.Timestamp.now().normalize(), periods=rows, name="Date")
+    return pd.DataFrame({
+        "Close": close,
+        "High": close * 1.01,
+        "Low": close * 0.99,
+        "Open": close * 1.001,
+        "Volume": rng.integers(1_000_000, 50_000_000, rows),
+    }, index=index)
+
+
+def legacy_read(csv_path: str) -> pd.DataFrame:
+    df = pd.read_csv(csv_path, index_col=0)
+    df.index = pd.to_datetime(df.index)
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시세 캐시 읽기 지연 벤치마크")
+    parser.add_argument("--rows", type=int, default=252, help="일봉 행 수 (기본 1년)")
+    parser.add_argument("--repeat", type=int, default=200, help="측정 반복 횟수")
+    args = parser.parse_args()
+
+    df = _make_bars(args.rows)
+    with tempfile.TemporaryDirectory() as root:
+        csv_path = os.path.join(root, "TEST.csv")
+        df.to_csv(csv_path)
+        store = MarketBarStore(root)
+        store.write("TEST", df)
+
+        cases = [
+            ("CSV 전체", lambda: legacy_read(csv_path)),
+            ("저장소 전체", lambda: store.read("TEST")),
+            ("저장소 Close", lambda: store.read("TEST", columns=["Close"])),
+            ("저장소 Close 60행", lambda: store.read("TEST", columns=["Close"], tail=60)),
+            ("저장소 HLC 15행", lambda: store.read("TEST", columns=["High", "Low", "Close"], tail=15)),
+        ]
+
+        print(f"\n시세 캐시 읽기 벤치마크 ({args.rows}행, 반복 {args.repeat}회)\n" + "=" * 60)
+        baseline = None
+        for label, func in cases:
+            sec = min(timeit.repeat(func, number=args.repeat, repeat=3)) / args.repeat
+            baseline = baseline or sec
+            print(f"{label:<16} {sec * 1e6:9.1f}µs  ({baseline / sec:4.1f}x)")
+        print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+"""TWAP 주문 파이프라인 종단 간 벤치마크 (KIS 대역 서버 사용)
+
+fake_kis_server의 대역 서버를 띄우고 실제 HantooExchangeRepositoryImpl(test_mode=False)로
+봇별 TWAP 슬라이스(주문가 조회 → 주문 전송 → 체결 확인)를 동시에 실행하여
+단계별 지연시간과 API 호출 통계를 측정한다.
+
+- 토큰 발급/갱신, 속도 제한, 체결 일괄 확인, 서킷 브레이커까지 실서버와 같은 경로를 탄다
+- 실제 key_store(토큰 파일)를 건드리지 않도록 임시 파일을 사용한다
+
+실행: python bench_twap_pipeline.py [--bots 4] [--slices 5] [--latency 0.05] [--fill-delay 0.3] ...
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_kis_server import FakeKisConfig, FakeKisServer
+
+SYMBOLS = ["TQQQ", "SOXL", "LABU", "QQQ", "UPRO"]
+
+
+def _prepare_env(api_url: str) -> None:
+    """대역 서버를 바라보도록 환경 설정 (config.item import 이후에 덮어씀)"""
+    # config.item은 import 시 .env를 override=True로 로드하므로 먼저 import한 뒤 환경변수를 설정
+    from config import item, key_store  # noqa: F401
+
+    os.environ.update({
+        "HANTOO_API_URL": api_url,
+        "HANTOO_CANO": "00000000",
+        "HANTOO_ACNT_PRDT_CD": "01",
+        "HANTOO_APP_KEY": "bench-app-key",
+        "HANTOO_APP_SECRET": "bench-app-secret",
+    })
+    bench_dir = tempfile.mkdtemp(prefix="egg_bench_")
+    key_store.KEY_STORE_DB_PATH = os.path.join(bench_dir, "key_store.db")
+    key_store.KEY_STORE_PATH = os.path.join(bench_dir, "key_store.json")
+
+
+def _summary(label: str, values) -> str:
+    if not values:
+        return f"{label:<10} -"
+    ordered = sorted(values)
+    p95 = ordered[max(0, int(len(ordered) * 0.95) - 1)]
+    return (f"{label:<10} 평균 {statistics.mean(ordered) * 1000:8.1f}ms  "
+            f"p50 {statistics.median(ordered) * 1000:8.1f}ms  "
+            f"p95 {p95 * 1000:8.1f}ms  최대 {ordered[-1] * 1000:8.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TWAP 주문 파이프라인 벤치마크")
+    parser.add_argument("--bots", type=int, default=4, help="동시에 실행할 봇 수")
+    parser.add_argument("--slices", type=int, default=5, help="봇당 TWAP 슬라이스 수")
+    parser.add_argument("--amount", type=int, default=3, help="슬라이스당 주문 수량")
+    parser.add_argument("--latency", type=float, default=0.05, help="서버 응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.02, help="추가 무작위 지연 상한 (초)")
+    parser.add_argument("--fill-delay", type=float, default=0.3, help="체결 지연 (초)")
+    parser.add_argument("--partial-ratio", type=float, default=1.0, help="첫 체결 비율 (0~1)")
+    parser.add_argument("--rate-limit", type=int, default=0, help="서버 초당 요청 한도 (0이면 제한 없음)")
+    parser.add_argument("--token-ttl", type=float, default=0.0, help="서버 측 토큰 유효 시간 (초, 갱신 경로 측정용)")
+    args = parser.parse_args()
+
+    server = FakeKisServer(FakeKisConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        fill_delay=args.fill_delay,
+        partial_ratio=args.partial_ratio,
+        rate_limit=args.rate_limit,
+        token_ttl=args.token_ttl,
+    )).start()
+    _prepare_env(server.url)
+
+    from data.external.hantoo.hantoo_exchange_repository_impl import HantooExchangeRepositoryImpl
+    repo = HantooExchangeRepositoryImpl(test_mode=False)
+
+    timings = {"quote": [], "order": [], "confirm": [], "slice": []}
+    failures = []
+    lock = threading.Lock()
+
+    def run_bot(index: int) -> None:
+        symbol = SYMBOLS[index % len(SYMBOLS)]
+        for n in range(args.slices):
+            is_buy = n % 2 == 0
+            t0 = time.perf_counter()
+            try:
+                price = repo.get_available_buy(symbol) if is_buy else repo.get_available_sell(symbol)
+                t1 = time.perf_counter()
+                submit = repo.submit_buy if is_buy else repo.submit_sell
+                future = submit(symbol, args.amount, price)
+                t2 = time.perf_counter()
+                result = future.result()
+                t3 = time.perf_counter()
+            except Exception as e:
+                with lock:
+                    failures.append(f"bot{index}/{n}: {e}")
+                continue
+            with lock:
+                if not result:
+                    failures.append(f"bot{index}/{n}: 주문 거부 또는 체결 확인 실패")
+                timings["quote"].append(t1 - t0)
+                timings["order"].append(t2 - t1)
+                timings["confirm"].append(t3 - t2)
+                timings["slice"].append(t3 - t0)
+
+    print(f"\nTWAP 파이프라인 벤치마크 (봇 {args.bots}개 × 슬라이스 {args.slices}회, "
+          f"지연 {args.latency * 1000:.0f}ms, 체결 {args.fill_delay * 1000:.0f}ms)\n" + "=" * 80)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.bots) as executor:
+        list(executor.map(run_bot, range(args.bots)))
+    elapsed = time.perf_counter() - started
+
+    for label in ("quote", "order", "confirm", "slice"):
+        print(_summary(label, timings[label]))
+    print("-" * 80)
+    print(f"총 소요: {elapsed:.2f}s, 완료 슬라이스: {len(timings['slice'])}, 실패: {len(failures)}")
+    for failure in failures[:10]:
+        print(f"  ❌ {failure}")
+    print(f"서버 요청 통계: {server.stats()}")
+    print(f"속도 제한 대기: {repo.data_source.get_rate_limit_stats()}")
+    print(f"종목별 체결 확인 시간: {repo.fill_tracker.fill_time_stats()}")
+    print(f"서킷 상태: {repo.data_source.get_circuit_breaker().snapshot()}")
+    print("=" * 80)
+
+    server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -13,6 +13,7 @@ from domain.repositories import (
     TradeRepository,
     HistoryRepository,
     OrderRepository,
+    FillLedgerRepository,
     ExchangeRepository,
     MessageRepository,
 )
@@ -28,6 +29,7 @@ class Dependencies:
     trade_repo: TradeRepository
     history_repo: HistoryRepository
     order_repo: OrderRepository
+    fill_ledger_repo: FillLedgerRepository
 
     # === External Repositories ===
     market_indicator_repo: MarketIndicatorRepository
@@ -62,6 +64,7 @@ def init_dependencies(test_mode: bool = False) -> Dependencies:
         SQLAlchemyTradeRepositoryImpl,
         SQLAlchemyHistoryRepositoryImpl,
         SQLAlchemyOrderRepositoryImpl,
+        SQLAlchemyFillLedgerRepositoryImpl,
     )
 
     # External Repository Implementations
@@ -70,7 +73,11 @@ def init_dependencies(test_mode: bool = False) -> Dependencies:
     from data.external.telegram import TelegramMessageRepositoryImpl
 
     # 세션 생성
-    session = SessionFactory().create_session()
+    session_factory = SessionFactory()
+    session = session_factory.create_session()
+
+    # 체결 원장은 체결 확인 폴러 스레드에서 기록하므로 스레드별 세션(scoped_session) 사용
+    fill_ledger_repo = SQLAlchemyFillLedgerRepositoryImpl(session_factory.Session)
 
     _dependencies = Dependencies(
         # Internal Repositories
@@ -78,9 +85,10 @@ def init_dependencies(test_mode: bool = False) -> Dependencies:
         trade_repo=SQLAlchemyTradeRepositoryImpl(session),
         history_repo=SQLAlchemyHistoryRepositoryImpl(session),
         order_repo=SQLAlchemyOrderRepositoryImpl(session),
+        fill_ledger_repo=fill_ledger_repo,
         # External Repositories
         market_indicator_repo=MarketIndicatorRepositoryImpl(),
-        exchange_repo=HantooExchangeRepositoryImpl(test_mode=test_mode),
+        exchange_repo=HantooExchangeRepositoryImpl(test_mode=test_mode, fill_ledger_repo=fill_ledger_repo),
         message_repo=TelegramMessageRepositoryImpl(),
     )
 
@@ -86,6 +86,47 @@ test_price = 300
 test_sell_price = test_price
 
 
+# === 시세 캐시 설정 ===
+# 매매 판단용 기본 TTL (초): 같은 스케줄 사이클 안에서 같은 종목 시세를 공유
+QUOTE_CACHE_TTL = float(os.getenv('QUOTE_CACHE_TTL', '1.5'))
+# 대시보드/외부 조회용 허용 캐시 나이 (초)
+DASHBOARD_QUOTE_MAX_AGE = float(os.getenv('DASHBOARD_QUOTE_MAX_AGE', '30'))
+
+
+# === 체결 확인 설정 ===
+# 주문 후 체결 확인 간격 (초, 쉼표 구분). 시장가를 가로지르는 지정가라 대부분 1초 안에 체결됨
+FILL_POLL_SCHEDULE = tuple(
+    float(delay) for delay in os.getenv('FILL_POLL_SCHEDULE', '0.5,1,2').split(',') if delay.strip()
+)
+# 확인 간격 상한 (초) - schedule 소진 후 간격을 2배씩 늘리다가 이 값에서 멈춤
+FILL_POLL_MAX_INTERVAL = float(os.getenv('FILL_POLL_MAX_INTERVAL', '10'))
+# 주문별 체결 확인 최대 대기 시간 (초)
+FILL_TIMEOUT = float(os.getenv('FILL_TIMEOUT', '300'))
+
+
+# === 계좌 스냅샷 설정 ===
+# 잔고/주문 가능 금액 스냅샷 유효 시간 (초) - 자체 주문/체결 시 즉시 폐기
+ACCOUNT_SNAPSHOT_TTL = float(os.getenv('ACCOUNT_SNAPSHOT_TTL', '10'))
+
+
+# === TWAP 동시 실행 설정 ===
+# 봇별 TWAP 회차를 동시에 실행할 워커 수 (같은 종목은 순서대로 실행)
+TWAP_MAX_WORKERS = int(os.getenv('TWAP_MAX_WORKERS', '8'))
+# TWAP 작업이 회차 완료를 기다리는 최대 시간 (초) - 넘긴 회차는 끝난 뒤 다음 작업에서 저장
+TWAP_JOB_DEADLINE = float(os.getenv('TWAP_JOB_DEADLINE', '150'))
+# 같은 종목/같은 방향 회차를 증권사 주문 1건으로 묶을지 (체결은 요청 수량 비율로 배분)
+TWAP_AGGREGATE = os.getenv('TWAP_AGGREGATE', 'true').lower() != 'false'
+
+
+# === 사전 준비 설정 ===
+# TRADE_TIME 몇 분 전에 토큰/커넥션/시세/DB 사전 준비를 실행할지 (0이면 사전 준비 안 함)
+WARMUP_LEAD_MINUTES = int(os.getenv('WARMUP_LEAD_MINUTES', '5'))
+# 사전 준비 단계가 이 시간(ms)을 넘으면 느린 단계로 보고 메시지 전송 (그 외에는 콘솔 출력만)
+WARMUP_SLOW_STEP_MS = float(os.getenv('WARMUP_SLOW_STEP_MS', '3000'))
+# TRADE_TIME 몇 분 전에 활성 종목 시세(yfinance)를 일괄 갱신할지 (0이면 갱신 작업 안 함)
+MARKET_PREFETCH_LEAD_MINUTES = int(os.getenv('MARKET_PREFETCH_LEAD_MINUTES', '10'))
+
+
 # === 티커별 하락률 인터벌 설정 ===
 # TQQQ: 변동성 낮음 → 3%
 # 그 외 (SOXL 등): 변동성 높음 → 5%
@@ -1,7 +1,19 @@
-"""설정값 저장/조회를 위한 Key-Value Store (JSON 기반)"""
-import os
+"""설정값 저장/조회를 위한 Key-Value Store (SQLite 기반)
+
+- 키마다 한 행(namespace, key)으로 저장하므로 저장소가 커져도 키당 조회/저장 비용이 일정함
+- 값은 타입(str/int/float/bool/json/null)과 함께 저장하고, 만료 시각(expires_at)을 둘 수 있음
+- WAL 모드 + busy_timeout으로 여러 프로세스(스케줄러, 웹)가 동시에 접근해도 안전
+- 스레드별 읽기 캐시를 두고 PRAGMA data_version이 바뀌었을 때(다른 연결/프로세스가 커밋)만 비우므로
+  변경이 없으면 토큰/타임스탬프/스케줄 조회가 SQLite 조회 없이 응답
+- 기존 key_store.json은 최초 실행 시 자동으로 옮기고 key_store.json.migrated로 보관
+"""
 import json
-from threading import Lock
+import os
+import sqlite3
+import threading
+import time
+from datetime import date
+from typing import Any, Dict, List, Optional
 
 # === 프로젝트 루트 기준 경로 설정 ===
 # __file__: .../config/key_store.py
@@ -9,11 +21,32 @@ from threading import Lock
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 BASE_DIR = os.path.join(PROJECT_ROOT, "data", "persistence", "sqlalchemy", "db")
 os.makedirs(BASE_DIR, exist_ok=True)
+KEY_STORE_DB_PATH = os.path.join(BASE_DIR, "key_store.db")
+# 이전 JSON 저장소 (존재하면 최초 실행 시 SQLite로 이관)
 KEY_STORE_PATH = os.path.join(BASE_DIR, "key_store.json")
 
-
-# 파일 락 (동시 접근 방지)
-_lock = Lock()
+# 다른 프로세스가 쓰는 중일 때 대기할 최대 시간 (초)
+BUSY_TIMEOUT = 5.0
+
+# 초기화(테이블 생성/이관) 직렬화용 락
+_lock = threading.Lock()
+_initialized_paths = set()
+# 스레드별 SQLite 연결 (DB 경로 → 연결) 및 읽기 캐시 (DB 경로 → {"version", "rows"})
+_local = threading.local()
+
+# 기본값 캐시 (날짜가 바뀔 때만 다시 계산)
+_defaults = None
+_defaults_date = None
+
+# === Namespace 정의 ===
+NS_TOKENS = "tokens"        # 한투 액세스 토큰
+NS_SCHEDULE = "schedule"    # 스케줄 시간 설정
+NS_FX = "fx"                # 환율 (현재/월별)
+NS_CACHE = "cache"          # 시세 데이터/거래소 코드 등 캐시 메타데이터
+NS_ORDERS = "orders"        # 주문/체결 동기화 상태
+NS_ORDER_INTENTS = "order_intents"  # client key별 주문 의도 (키마다 1행, 보관 기간 TTL)
+NS_SETTINGS = "settings"    # 그 외 사용자 설정
+NS_META = "meta"            # 저장소 자체 정보 (이관 여부 등)
 
 # === Key 상수 정의 ===
 AT_KEY = "AT_KEY"
@@ -30,138 +63,375 @@ TOTAL_BUDGET = "TOTAL_BUDGET"  # 사용자 지정 총 예산
 AUTO_START = "AUTO_START"  # 다음 봇 자동 출발 여부
 AUTO_START_THRESHOLD = "AUTO_START_THRESHOLD"  # 자동 출발 T값 임계 비율 (예: 0.3 = max_tier의 30%)
 
+EXCHANGE_CODES = "EXCHANGE_CODES"  # EXCHANGE_TABLE 밖 종목의 거래소 코드 캐시 {symbol: {...}}
+ORDER_INTENTS = "ORDER_INTENTS"  # (이전 형식) 주문 의도 전체 dict - NS_ORDER_INTENTS로 이관 후 삭제
+FILL_SYNC_OPEN_FLOOR = "FILL_SYNC_OPEN_FLOOR"  # 마지막 체결 동기화 때 미체결이던 가장 오래된 주문 [주문일, 주문번호]
+
+_JSON_MIGRATED = "JSON_MIGRATED"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS kv (
+    namespace  TEXT NOT NULL,
+    key        TEXT NOT NULL,
+    value_type TEXT NOT NULL,
+    value      TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    expires_at REAL,
+    PRIMARY KEY (namespace, key)
+) WITHOUT ROWID
+"""
+
+_UPSERT = """
+INSERT INTO kv (namespace, key, value_type, value, updated_at, expires_at)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (namespace, key) DO UPDATE SET
+    value_type = excluded.value_type,
+    value = excluded.value,
+    updated_at = excluded.updated_at,
+    expires_at = excluded.expires_at
+"""
+
+_INSERT_IF_MISSING = """
+INSERT OR IGNORE INTO kv (namespace, key, value_type, value, updated_at, expires_at)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
 
-def _get_default_values():
-    """기본값 딕셔너리 반환"""
-    # 서머타임을 고려한 TWAP_TIME 기본값 가져오기
-    from config.util import get_twap_times, get_closing_buy_times
-
-    return {
-        TRADE_TIME: "00:05",
-        TWAP_TIME: get_twap_times(),
-        TWAP_COUNT: 5,
-        CLOSING_BUY_TIME: get_closing_buy_times(),
-        AUTO_START: False,  # 기본값: 자동 출발 비활성화
-        AUTO_START_THRESHOLD: 0.5  # 기본값: max_tier의 50%
-    }
-
-
-def _load_db():
-    """JSON 파일에서 데이터 로드"""
-    if not os.path.exists(KEY_STORE_PATH):
-        print(f"[key_store] File not found, creating with default values: {KEY_STORE_PATH}")
-        # 기본값으로 JSON 파일 생성
-        default_data = _get_default_values()
-        _save_db(default_data)
-        return default_data
 
+def _get_default_values():
+    """기본값 딕셔너리 반환 (날짜별 1회 계산 - 서머타임 전환일에만 값이 바뀜)"""
+    global _defaults, _defaults_date
+
+    today = date.today()
+    if _defaults is None or _defaults_date != today:
+        # 서머타임을 고려한 TWAP_TIME 기본값 가져오기
+        from config.util import get_twap_times, get_closing_buy_times
+
+        _defaults = {
+            TRADE_TIME: "00:05",
+            TWAP_TIME: get_twap_times(),
+            TWAP_COUNT: 5,
+            CLOSING_BUY_TIME: get_closing_buy_times(),
+            AUTO_START: False,  # 기본값: 자동 출발 비활성화
+            AUTO_START_THRESHOLD: 0.5  # 기본값: max_tier의 50%
+        }
+        _defaults_date = today
+    return _defaults
+
+
+def _namespace_of(key: str) -> str:
+    """기존 단일 키 → namespace 매핑"""
+    if key in (AT_KEY, AT_EX_DATE):
+        return NS_TOKENS
+    if key in (TRADE_TIME, TWAP_TIME, TWAP_COUNT, CLOSING_BUY_TIME):
+        return NS_SCHEDULE
+    if key.startswith("EXCHANGE_RATE"):
+        return NS_FX
+    if key.endswith("_YF_DATA_TIMESTAMP") or key.endswith("_YF_DATA_DATE") or key == EXCHANGE_CODES:
+        return NS_CACHE
+    if key in (ORDER_INTENTS, FILL_SYNC_OPEN_FLOOR):
+        return NS_ORDERS
+    return NS_SETTINGS
+
+
+# === 값 인코딩 ===
+
+def _encode(value):
+    """값 → (value_type, 저장 문자열)"""
+    if value is None:
+        return "null", ""
+    if isinstance(value, bool):
+        return "bool", "1" if value else "0"
+    if isinstance(value, int):
+        return "int", str(value)
+    if isinstance(value, float):
+        return "float", repr(value)
+    if isinstance(value, str):
+        return "str", value
+    return "json", json.dumps(value, ensure_ascii=False)
+
+
+def _decode(value_type: str, text: str):
+    """(value_type, 저장 문자열) → 값"""
+    if value_type == "str":
+        return text
+    if value_type == "int":
+        return int(text)
+    if value_type == "float":
+        return float(text)
+    if value_type == "bool":
+        return text == "1"
+    if value_type == "null":
+        return None
+    return json.loads(text)
+
+
+def _to_row(namespace: str, key: str, value, ttl: Optional[float], now: float) -> tuple:
+    value_type, text = _encode(value)
+    expires_at = now + ttl if ttl is not None else None
+    return namespace, key, value_type, text, now, expires_at
+
+
+# === 연결/초기화 ===
+
+def _connect(path: str) -> sqlite3.Connection:
+    # isolation_level=None: 단일 문장은 자동 커밋, 여러 문장은 BEGIN IMMEDIATE로 명시
+    conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT, isolation_level=None)
+    conn.execute(f"PRAGMA busy_timeout = {int(BUSY_TIMEOUT * 1000)}")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    return conn
+
+
+def _get_conn() -> sqlite3.Connection:
+    """현재 스레드의 연결 조회 (DB 경로별 최초 1회 테이블 생성/이관)"""
+    path = KEY_STORE_DB_PATH
+    conns = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+
+    conn = conns.get(path)
+    if conn is None:
+        if path not in _initialized_paths:
+            with _lock:
+                if path not in _initialized_paths:
+                    _initialize(path)
+                    _initialized_paths.add(path)
+        conn = conns[path] = _connect(path)
+    return conn
+
+
+def _cached_rows() -> Dict[tuple, Optional[tuple]]:
+    """
+    현재 스레드의 읽기 캐시 조회 ((namespace, key) → (value_type, value, expires_at), 없는 키는 None)
+
+    data_version은 같은 연결의 쓰기에는 바뀌지 않고 다른 연결(다른 스레드/프로세스)의 커밋에만 바뀌므로,
+    바뀌었으면 캐시를 비우고 이 연결의 쓰기는 쓰는 쪽에서 캐시에 직접 반영한다.
+    """
+    conn = _get_conn()
+    caches = getattr(_local, "caches", None)
+    if caches is None:
+        caches = _local.caches = {}
+    cache = caches.get(KEY_STORE_DB_PATH)
+    if cache is None:
+        cache = caches[KEY_STORE_DB_PATH] = {"version": None, "rows": {}}
+
+    version = conn.execute("PRAGMA data_version").fetchone()[0]
+    if version != cache["version"]:
+        cache["rows"].clear()
+        cache["version"] = version
+    return cache["rows"]
+
+
+def _initialize(path: str) -> None:
+    """테이블 생성 + key_store.json 이관 + 기본값/만료 항목 정리"""
+    conn = _connect(path)
     try:
-        with open(KEY_STORE_PATH, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        # 기존 파일이 있더라도 없는 키는 기본값으로 추가
-        default_data = _get_default_values()
-        updated = False
-        for key, value in default_data.items():
-            if key not in data:
-                print(f"[key_store] Adding missing key '{key}' with default value: {value}")
-                data[key] = value
-                updated = True
-
-        # 추가된 키가 있으면 파일 저장
-        if updated:
-            _save_db(data)
-
-        return data
-    except Exception as e:
-        print(f"[key_store] Warning: Failed to load {KEY_STORE_PATH}: {e}")
-        return {}
-
-
-def _save_db(data):
-    """JSON 파일에 데이터 저장"""
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute(_SCHEMA)
+        _migrate_from_json(conn)
+
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # 없는 키만 기본값으로 추가 (사용자가 바꾼 값은 유지)
+            conn.executemany(_INSERT_IF_MISSING, [
+                _to_row(_namespace_of(key), key, value, None, now)
+                for key, value in _get_default_values().items()
+            ])
+            conn.execute("DELETE FROM kv WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    finally:
+        conn.close()
+
+
+def _migrate_from_json(conn: sqlite3.Connection) -> None:
+    """기존 key_store.json 내용을 한 번의 트랜잭션으로 이관 (여러 프로세스가 동시에 시작해도 1회만)"""
+    legacy_path = KEY_STORE_PATH
+    migrated = 0
+
+    conn.execute("BEGIN IMMEDIATE")
     try:
-        with open(KEY_STORE_PATH, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-    except Exception as e:
-        print(f"[key_store] Error: Failed to save {KEY_STORE_PATH}: {e}")
-
+        done = conn.execute(
+            "SELECT 1 FROM kv WHERE namespace = ? AND key = ?", (NS_META, _JSON_MIGRATED)
+        ).fetchone()
+        if done:
+            conn.execute("COMMIT")
+            return
 
-def write(key, value):
-    """키와 값을 JSON 파일에 저장합니다."""
-    print(f"[key_store] write({key}, {value}) to {KEY_STORE_PATH}")
-    with _lock:
-        db = _load_db()
-        db[key] = value
-        _save_db(db)
-        print(f"[key_store] write successful, file exists: {os.path.exists(KEY_STORE_PATH)}")
+        now = time.time()
+        if os.path.exists(legacy_path):
+            with open(legacy_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            conn.executemany(_INSERT_IF_MISSING, [
+                _to_row(_namespace_of(key), key, value, None, now) for key, value in data.items()
+            ])
+            migrated = len(data)
+        conn.execute(_UPSERT, _to_row(NS_META, _JSON_MIGRATED, legacy_path if migrated else None, None, now))
+        conn.execute("COMMIT")
+    except Exception as e:
+        conn.execute("ROLLBACK")
+        # 이관 실패 시 다음 실행에서 다시 시도 (JSON 파일은 그대로 둠)
+        print(f"[key_store] Warning: Failed to migrate {legacy_path}: {e}")
+        return
+
+    if migrated:
+        os.replace(legacy_path, f"{legacy_path}.migrated")
+        print(f"[key_store] Migrated {migrated} keys from {legacy_path} to {KEY_STORE_DB_PATH}")
+
+
+# === Namespace API ===
+
+class Namespace:
+    """
+    namespace 단위 Key-Value 접근
+
+    사용 예:
+        tokens = key_store.namespace(key_store.NS_TOKENS)
+        tokens.set(key_store.AT_KEY, token)
+        cache.set("TQQQ_YF_DATA_TIMESTAMP", now, ttl=6 * 3600)
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        값 조회
+
+        Args:
+            key: 키
+            default: 키가 없거나 만료되었을 때 반환할 값
+
+        Returns:
+            저장된 값 (타입 유지)
+        """
+        rows = _cached_rows()
+        cache_key = (self.name, key)
+        if cache_key in rows:
+            row = rows[cache_key]
+        else:
+            row = rows[cache_key] = _get_conn().execute(
+                "SELECT value_type, value, expires_at FROM kv WHERE namespace = ? AND key = ?", (self.name, key)
+            ).fetchone()
+        if row is None:
+            return default
+        value_type, text, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            return default
+        return _decode(value_type, text)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        값 저장 (키 단위 upsert)
+
+        Args:
+            key: 키
+            value: 값 (str/int/float/bool/None 또는 JSON 직렬화 가능한 값)
+            ttl: 유효 시간 (초, None이면 만료 없음)
+        """
+        row = _to_row(self.name, key, value, ttl, time.time())
+        _get_conn().execute(_UPSERT, row)
+        _cached_rows()[(self.name, key)] = (row[2], row[3], row[5])
+
+    def delete(self, key: str) -> bool:
+        """키 삭제 (삭제되었으면 True)"""
+        cursor = _get_conn().execute("DELETE FROM kv WHERE namespace = ? AND key = ?", (self.name, key))
+        _cached_rows()[(self.name, key)] = None
+        return cursor.rowcount > 0
+
+    def items(self) -> Dict[str, Any]:
+        """만료되지 않은 전체 항목 조회"""
+        rows = _get_conn().execute(
+            "SELECT key, value_type, value FROM kv "
+            "WHERE namespace = ? AND (expires_at IS NULL OR expires_at > ?) ORDER BY key",
+            (self.name, time.time())
+        ).fetchall()
+        return {key: _decode(value_type, text) for key, value_type, text in rows}
+
+    def keys(self) -> List[str]:
+        """만료되지 않은 키 목록"""
+        rows = _get_conn().execute(
+            "SELECT key FROM kv WHERE namespace = ? AND (expires_at IS NULL OR expires_at > ?) ORDER BY key",
+            (self.name, time.time())
+        ).fetchall()
+        return [key for key, in rows]
+
+    def purge_expired(self) -> int:
+        """만료된 항목 삭제, 삭제 건수 반환"""
+        cursor = _get_conn().execute(
+            "DELETE FROM kv WHERE namespace = ? AND expires_at IS NOT NULL AND expires_at <= ?",
+            (self.name, time.time())
+        )
+        # 만료 항목은 조회 시에도 걸러지지만 캐시와 DB를 맞추기 위해 비움
+        _cached_rows().clear()
+        return cursor.rowcount
+
+
+def namespace(name: str) -> Namespace:
+    """namespace 접근 객체 반환"""
+    return Namespace(name)
+
+
+# === 단일 키 API (기존 호환) ===
+
+def write(key, value, ttl: Optional[float] = None):
+    """키와 값을 저장합니다. (키가 속한 namespace에 upsert)"""
+    # 토큰/주문 의도 등 민감하거나 큰 값이 있으므로 키만 기록
+    print(f"[key_store] write({key}) to {KEY_STORE_DB_PATH}")
+    namespace(_namespace_of(key)).set(key, value, ttl=ttl)
 
 
 def read(key):
-    """주어진 키에 해당하는 값을 JSON 파일에서 읽어 반환합니다."""
-    with _lock:
-        db = _load_db()
-        if key == "TRADE_TIME":
-            trade_time = db.get(key)
-            return trade_time if trade_time else "00:05"
-        elif key == "TWAP_TIME":
-            twap_time = db.get(key)
-            if twap_time:
-                return twap_time
-            # 서머타임을 고려한 기본값 반환 (circular import 방지를 위해 함수 내부에서 import)
-            from config.util import get_twap_times
-            return get_twap_times()
-        elif key == "TWAP_COUNT":
-            twap_count = db.get(key)
-            return twap_count if twap_count else 5
-        elif key == "IS_DYNAMIC_SEED_APPLY_TODAY":
-            is_apply = db.get(key)
-            return is_apply if is_apply else False
-        elif key == "TOTAL_BUDGET":
-            total_budget = db.get(key)
-            return total_budget if total_budget is not None else None
-        elif key == "AUTO_START":
-            auto_start = db.get(key)
-            return auto_start if auto_start is not None else False
-        elif key == "AUTO_START_THRESHOLD":
-            threshold = db.get(key)
-            return threshold if threshold is not None else 0.5
-        elif key == "CLOSING_BUY_TIME":
-            closing_buy_time = db.get(key)
-            if closing_buy_time:
-                return closing_buy_time
-            from config.util import get_closing_buy_times
-            return get_closing_buy_times()
-        return db.get(key, None)
+    """주어진 키에 해당하는 값을 반환합니다."""
+    value = namespace(_namespace_of(key)).get(key)
+    if key == "TRADE_TIME":
+        return value if value else "00:05"
+    elif key == "TWAP_TIME":
+        if value:
+            return value
+        # 서머타임을 고려한 기본값 반환
+        return list(_get_default_values()[TWAP_TIME])
+    elif key == "TWAP_COUNT":
+        return value if value else 5
+    elif key == "IS_DYNAMIC_SEED_APPLY_TODAY":
+        return value if value else False
+    elif key == "AUTO_START":
+        return value if value is not None else False
+    elif key == "AUTO_START_THRESHOLD":
+        return value if value is not None else 0.5
+    elif key == "CLOSING_BUY_TIME":
+        if value:
+            return value
+        return _get_default_values()[CLOSING_BUY_TIME]
+    return value
 
 
 def print_all_keys():
     """현재 key_store에 저장된 모든 키와 값을 출력합니다."""
-    with _lock:
-        db = _load_db()
-        if not db:
-            print("📂 key_store에 저장된 데이터가 없습니다.")
-            return
+    rows = _get_conn().execute(
+        "SELECT namespace, key, value_type, value FROM kv WHERE namespace != ? ORDER BY namespace, key",
+        (NS_META,)
+    ).fetchall()
+    if not rows:
+        print("📂 key_store에 저장된 데이터가 없습니다.")
+        return
 
-        print(f"📋 총 {len(db)}개의 항목이 있습니다:")
-        for key, value in db.items():
-            print(f"🔑 {key} → {value}")
+    print(f"📋 총 {len(rows)}개의 항목이 있습니다:")
+    for name, key, value_type, text in rows:
+        print(f"🔑 [{name}] {key} → {_decode(value_type, text)}")
 
 
 def get_all_keys():
-    """JSON 파일에 저장된 모든 키를 반환합니다."""
-    with _lock:
-        db = _load_db()
-        return list(db.keys())
+    """저장된 모든 키를 반환합니다. (만료 항목 제외)"""
+    rows = _get_conn().execute(
+        "SELECT key FROM kv WHERE namespace != ? AND (expires_at IS NULL OR expires_at > ?)",
+        (NS_META, time.time())
+    ).fetchall()
+    return [key for key, in rows]
 
 
 def delete(key):
-    """주어진 키를 JSON 파일에서 삭제합니다."""
-    with _lock:
-        db = _load_db()
-        if key in db:
-            del db[key]
-            _save_db(db)
-
-
-
+    """주어진 키를 삭제합니다."""
+    namespace(_namespace_of(key)).delete(key)
@@ -2,7 +2,7 @@
 import json
 import time
 from datetime import datetime, timedelta
-from typing import List
+from typing import Iterable, List
 
 import pytz
 import requests
@@ -330,6 +330,44 @@ def get_schedule_times() -> tuple:
     return job_times, msg_times, twap_times, closing_buy_times
 
 
+def get_warmup_times(job_times: List[str], lead_minutes: int, avoid_times: Iterable[str] = ()) -> List[str]:
+    """
+    사전 준비 실행 시간 계산 (메인 거래 시간 lead_minutes분 전)
+
+    Args:
+        job_times: 메인 거래 시간 리스트 (예: ['04:35'])
+        lead_minutes: 거래 시간보다 앞당길 분 (0 이하이면 사전 준비 안 함)
+        avoid_times: 겹치면 안 되는 다른 사전 준비 시간 (겹치면 거래 시간 전까지 1분씩 뒤로 미룸)
+
+    Returns:
+        시간 문자열 리스트 (예: ['04:30']), 자정을 넘어 전날로 넘어가면 00:00으로 당김
+        (거래 시간이 00:00이거나 거래 시간 전에 빈 시간이 없으면 제외)
+    """
+    if lead_minutes <= 0:
+        return []
+
+    avoid = set(avoid_times)
+    warmup_times = []
+    for time_str in job_times:
+        try:
+            job_dt = datetime.strptime(time_str, "%H:%M")
+        except (TypeError, ValueError):
+            continue
+        warmup_dt = job_dt - timedelta(minutes=lead_minutes)
+        if warmup_dt.date() != job_dt.date():
+            # 전날 23시대로 넘어가면 거래일 판단/체결 조회 기준일이 하루 어긋나므로 당일 00:00으로 당김
+            warmup_dt = job_dt.replace(hour=0, minute=0)
+        # 00:00으로 당겨진 시간끼리 겹치면 한쪽이 건너뛰어지므로 뒤로 미룸
+        while warmup_dt < job_dt and warmup_dt.strftime("%H:%M") in avoid:
+            warmup_dt += timedelta(minutes=1)
+        if warmup_dt >= job_dt:
+            continue
+        warmup_time = warmup_dt.strftime("%H:%M")
+        if warmup_time not in warmup_times:
+            warmup_times.append(warmup_time)
+    return warmup_times
+
+
 # === 월별 환율 조회 ===
 def _fetch_monthly_rate_from_yf(year: int, month: int):
     """
@@ -14,6 +14,13 @@ from data.external.hantoo.hantoo_models import (
     TickerItem
 )
 from data.external.hantoo.hantoo_data_source import HantooDataSource, HantooAccountInfo
+from data.external.hantoo.hantoo_token_holder import HantooTokenHolder
+from data.external.hantoo.hantoo_rate_limiter import HantooRateLimiter, HantooApiPriority
+from data.external.hantoo.hantoo_fill_tracker import HantooFillTracker
+from data.external.hantoo.hantoo_account_snapshot import AccountSnapshot, HantooAccountSnapshotCache
+from data.external.hantoo.hantoo_circuit_breaker import HantooCircuitBreaker, HantooCircuitOpenError
+from data.external.hantoo.hantoo_exchange_codes import HantooExchangeCodeCache
+from data.external.hantoo.hantoo_order_intents import HantooOrderIntentStore
 from data.external.hantoo.hantoo_exchange_repository_impl import HantooExchangeRepositoryImpl
 
 # 하위 호환성을 위한 별칭 (deprecated, 추후 제거 예정)
@@ -37,6 +44,16 @@ __all__ = [
     # DataSource
     'HantooDataSource',
     'HantooAccountInfo',
+    'HantooTokenHolder',
+    'HantooRateLimiter',
+    'HantooApiPriority',
+    'HantooFillTracker',
+    'AccountSnapshot',
+    'HantooAccountSnapshotCache',
+    'HantooCircuitBreaker',
+    'HantooCircuitOpenError',
+    'HantooExchangeCodeCache',
+    'HantooOrderIntentStore',
     # Repository
     'HantooExchangeRepositoryImpl',
     # Deprecated aliases
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""계좌 스냅샷 (사이클 단위 잔고/보유 조회 캐시)"""
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from data.external.hantoo.hantoo_models import BalanceResult
+
+
+@dataclass
+class AccountSnapshot:
+    """
+    한 사이클 동안 재사용하는 계좌 조회 결과
+
+    구간별로 처음 필요할 때 한 번만 조회하여 채우고,
+    같은 스냅샷 안의 구간들은 함께 만료된다.
+
+    Attributes:
+        orderable_cash: "종목:가격"별 주문 가능 금액 (TTTS3007R, 종목/주문 단가에 따라 달라짐)
+        balances: 거래소 코드별 잔고 (TTTS3012R)
+        settlement: 결제기준 잔고 응답 원본 (CTRP6010R, 요청 종목별로 필요한 행만 변환)
+    """
+    orderable_cash: Dict[str, float] = field(default_factory=dict)
+    balances: Dict[str, BalanceResult] = field(default_factory=dict)
+    settlement: Optional[Dict[str, Any]] = None
+
+
+class HantooAccountSnapshotCache:
+    """
+    계좌 스냅샷 TTL 캐시
+
+    - 스냅샷 생성 후 ttl 동안 잔고/보유 조회는 메모리에서 응답
+    - 같은 구간을 동시에 조회하면 진행 중인 1회 호출 결과를 함께 기다림
+    - 자체 주문/체결 직후에는 invalidate()로 스냅샷 전체를 폐기
+    """
+
+    CASH = "orderable_cash"
+    BALANCES = "balances"
+    SETTLEMENT = "settlement"
+
+    def __init__(self, ttl: float):
+        """
+        Args:
+            ttl: 기본 스냅샷 유효 시간 (초)
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._snapshot: Optional[AccountSnapshot] = None
+        self._created_at = 0.0
+        # (section, key) -> 진행 중인 조회 (스냅샷이 바뀌면 초기화)
+        self._in_flight: Dict[Tuple[str, Optional[str]], Future] = {}
+
+    def get(
+        self,
+        section: str,
+        fetch: Callable[[], Any],
+        key: Optional[str] = None,
+        max_age: Optional[float] = None
+    ) -> Any:
+        """
+        스냅샷 구간 조회 (비어 있으면 fetch 호출, 동시 요청은 1회로 합침)
+
+        Args:
+            section: 구간 이름 (CASH, BALANCES, SETTLEMENT)
+            fetch: 실제 조회 함수
+            key: 딕셔너리 구간의 키 (CASH는 cash_key(), BALANCES는 거래소 코드)
+            max_age: 허용 스냅샷 나이 (초, None이면 기본 TTL)
+
+        Returns:
+            구간 값, 조회 실패 시 None
+        """
+        max_age = self.ttl if max_age is None else max_age
+
+        with self._lock:
+            if self._snapshot is None or time.monotonic() - self._created_at >= max_age:
+                self._snapshot = AccountSnapshot()
+                self._created_at = time.monotonic()
+                self._in_flight = {}
+            snapshot = self._snapshot
+
+            value = self._read(snapshot, section, key)
+            if value is not None:
+                return value
+
+            flight_key = (section, key)
+            future = self._in_flight.get(flight_key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._in_flight[flight_key] = future
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            value = fetch()
+        except BaseException as e:
+            with self._lock:
+                if self._in_flight.get(flight_key) is future:
+                    self._in_flight.pop(flight_key)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            # 조회 중 무효화되었으면 폐기된 스냅샷에만 기록됨 (다음 조회에서 새로 받음)
+            if value is not None:
+                self._write(snapshot, section, key, value)
+            if self._in_flight.get(flight_key) is future:
+                self._in_flight.pop(flight_key)
+        future.set_result(value)
+        return value
+
+    @staticmethod
+    def cash_key(symbol: str, price: float) -> str:
+        """CASH 구간 키 (주문 가능 금액은 종목과 주문 단가별로 다름)"""
+        return f"{symbol}:{price}"
+
+    def invalidate(self) -> None:
+        """스냅샷 폐기 (자체 주문/체결 직후 호출)"""
+        with self._lock:
+            self._snapshot = None
+            self._in_flight = {}
+
+    # ===== Private Methods =====
+
+    @staticmethod
+    def _read(snapshot: AccountSnapshot, section: str, key: Optional[str]) -> Any:
+        value = getattr(snapshot, section)
+        return value.get(key) if key is not None else value
+
+    @staticmethod
+    def _write(snapshot: AccountSnapshot, section: str, key: Optional[str], value: Any) -> None:
+        if key is not None:
+            getattr(snapshot, section)[key] = value
+        else:
+            setattr(snapshot, section, value)
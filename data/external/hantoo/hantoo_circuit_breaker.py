@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""한국투자증권 API 서킷 브레이커"""
+import logging
+import threading
+import time
+from enum import Enum
+from typing import Any, Dict
+
+
+class HantooCircuitOpenError(RuntimeError):
+    """서킷이 열려 있어 API 호출을 거부한 경우"""
+    pass
+
+
+class CircuitState(Enum):
+    """서킷 상태"""
+    CLOSED = "closed"        # 정상 (호출 허용)
+    OPEN = "open"            # 차단 (호출 즉시 거부)
+    HALF_OPEN = "half_open"  # 복구 확인 중 (시험 호출 1건만 허용)
+
+
+class HantooCircuitBreaker:
+    """
+    연속 실패 시 API 호출을 차단하는 서킷 브레이커
+
+    - 연속 failure_threshold회 실패하면 OPEN → 이후 호출은 네트워크 대기 없이 즉시 거부
+    - reset_timeout이 지나면 HALF_OPEN → 시험 호출 1건만 허용
+    - 시험 호출 성공 시 CLOSED, 실패 시 다시 OPEN
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        """
+        Args:
+            failure_threshold: 서킷을 여는 연속 실패 횟수
+            reset_timeout: OPEN 유지 시간 (초), 이후 시험 호출 허용
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """현재 서킷 상태 (OPEN 유지 시간이 지났으면 HALF_OPEN)"""
+        with self._lock:
+            return self._current_state()
+
+    def is_available(self) -> bool:
+        """
+        호출 가능 여부 (스케줄러가 작업 실행 전 확인용)
+
+        Returns:
+            bool: OPEN이 아니면 True
+        """
+        return self.state != CircuitState.OPEN
+
+    def allow(self) -> bool:
+        """
+        호출 1건 허용 여부 확인 (HALF_OPEN이면 시험 호출 1건만 허용)
+
+        Returns:
+            bool: 호출 가능 여부
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.CLOSED:
+                return True
+            if state == CircuitState.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """호출 성공 기록"""
+        with self._lock:
+            if self._state != CircuitState.CLOSED:
+                print("✅ 한투 API 서킷 복구 (CLOSED)")
+                logging.info("한투 API 서킷 복구 (CLOSED)")
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """호출 실패 기록 (연속 실패가 임계치에 도달하면 OPEN)"""
+        with self._lock:
+            self._failures += 1
+            was_trial = self._trial_in_flight
+            self._trial_in_flight = False
+            if was_trial or self._failures >= self.failure_threshold:
+                if self._state != CircuitState.OPEN:
+                    print(f"🚫 한투 API 서킷 OPEN (연속 실패 {self._failures}회, {self.reset_timeout:.0f}초 차단)")
+                    logging.warning(f"한투 API 서킷 OPEN (연속 실패 {self._failures}회)")
+                self._state = CircuitState.OPEN
+                self._opened_at = time.monotonic()
+
+    def record_inconclusive(self) -> None:
+        """성공/실패로 판정할 수 없는 호출 기록 (시험 호출이었으면 다음 호출에 시험 기회를 넘김)"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        서킷 상태 조회
+
+        Returns:
+            Dict: {"state": "closed", "failures": 0, "retry_in": 0.0}
+        """
+        with self._lock:
+            state = self._current_state()
+            retry_in = 0.0
+            if state == CircuitState.OPEN:
+                retry_in = max(0.0, self._opened_at + self.reset_timeout - time.monotonic())
+            return {"state": state.value, "failures": self._failures, "retry_in": round(retry_in, 1)}
+
+    # ===== Private Methods =====
+
+    def _current_state(self) -> CircuitState:
+        """lock 보유 상태에서 호출"""
+        if self._state == CircuitState.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = CircuitState.HALF_OPEN
+        return self._state
@@ -4,13 +4,18 @@ import json
 import logging
 import os
 import time
-from datetime import datetime
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from config import key_store
+from data.external.hantoo.hantoo_circuit_breaker import HantooCircuitBreaker, HantooCircuitOpenError
+from data.external.hantoo.hantoo_exchange_codes import HantooExchangeCodeCache
 from data.external.hantoo.hantoo_models import HantooExd
+from data.external.hantoo.hantoo_rate_limiter import HantooApiPriority, HantooRateLimiter
+from data.external.hantoo.hantoo_token_holder import HantooTokenHolder
 
 # 로거 설정
 logging.basicConfig(
@@ -31,6 +36,20 @@ class HantooAccountInfo:
         self.api_url = os.getenv('HANTOO_API_URL', 'https://openapi.koreainvestment.com:9443')
         self.app_key = os.getenv('HANTOO_APP_KEY')
         self.app_secret = os.getenv('HANTOO_APP_SECRET')
+        # 커넥션 풀 크기 (호스트당 유지할 keep-alive 연결 수)
+        self.pool_size = int(os.getenv('HANTOO_POOL_SIZE', '10'))
+        # 초당 호출 한도 (실전 계좌 초당 20건 기준, 여유분 확보)
+        self.rate_limit = float(os.getenv('HANTOO_RATE_LIMIT', '18'))
+        self.rate_burst = int(os.getenv('HANTOO_RATE_BURST', '5'))
+        # 연결/응답 타임아웃 (초) - 엔드포인트별 응답 타임아웃은 TR_READ_TIMEOUT 우선
+        self.connect_timeout = float(os.getenv('HANTOO_CONNECT_TIMEOUT', '3.05'))
+        self.read_timeout = float(os.getenv('HANTOO_READ_TIMEOUT', '10'))
+        # 서킷 브레이커 (연속 실패 횟수, 차단 유지 시간)
+        self.breaker_threshold = int(os.getenv('HANTOO_BREAKER_THRESHOLD', '3'))
+        self.breaker_reset = float(os.getenv('HANTOO_BREAKER_RESET', '30'))
+        # EXCHANGE_TABLE 밖 종목의 거래소 코드 재확인 주기 (일) / 찾지 못한 종목 재조회 간격 (시간)
+        self.exchange_refresh_days = float(os.getenv('HANTOO_EXCHANGE_REFRESH_DAYS', '30'))
+        self.exchange_miss_retry_hours = float(os.getenv('HANTOO_EXCHANGE_MISS_RETRY_HOURS', '24'))
 
         if not self.cano or not self.app_key or not self.app_secret:
             raise ValueError("HANTOO_CANO, HANTOO_APP_KEY, HANTOO_APP_SECRET 환경변수가 필요합니다.")
@@ -39,6 +58,41 @@ class HantooAccountInfo:
 class HantooDataSource:
     """한국투자증권 API 호출 및 토큰 관리 DataSource"""
 
+    # 프로세스 전역 공유 세션 (keep-alive 커넥션 풀 재사용)
+    _session: Optional[requests.Session] = None
+    _session_lock = Lock()
+    # 프로세스 전역 토큰 보관소 (요청 경로에서 파일 I/O 없이 토큰 조회)
+    _token_holder: Optional[HantooTokenHolder] = None
+    # 프로세스 전역 호출 속도 제한기 (모든 봇/웹 요청이 같은 한도를 공유)
+    _rate_limiter: Optional[HantooRateLimiter] = None
+    # 프로세스 전역 서킷 브레이커 (장애 시 호출 즉시 거부)
+    _circuit_breaker: Optional[HantooCircuitBreaker] = None
+    # 프로세스 전역 거래소 코드 캐시 (EXCHANGE_TABLE 밖 종목, key_store에 영구 저장)
+    _exchange_codes: Optional[HantooExchangeCodeCache] = None
+
+    # 토큰 발급 횟수 초과(EGW00133) 시 최대 재시도 횟수
+    TOKEN_ISSUE_MAX_RETRY = 3
+    # 초당 거래건수 초과(EGW00201) 시 최대 재시도 횟수 / 재시도 간격 (초, 회차마다 증가)
+    RATE_LIMIT_MAX_RETRY = 2
+    RATE_LIMIT_BACKOFF = 0.5
+
+    # tr_id별 우선순위 레인 (없으면 ACCOUNT)
+    TR_PRIORITY = {
+        "TTTT1002U": HantooApiPriority.ORDER,   # 매수 주문
+        "TTTT1006U": HantooApiPriority.ORDER,   # 매도 주문
+        "TTTS3035R": HantooApiPriority.FILL,    # 체결 내역
+        "HHDFS00000300": HantooApiPriority.QUOTE,  # 현재가
+        "CTPF1702R": HantooApiPriority.QUOTE,      # 상품기본정보 (거래소 코드 확인)
+    }
+
+    # tr_id별 응답 타임아웃 (초, 없으면 account_info.read_timeout)
+    TR_READ_TIMEOUT = {
+        "TTTT1002U": 10.0,
+        "TTTT1006U": 10.0,
+        "TTTS3035R": 5.0,
+        "HHDFS00000300": 3.0,
+    }
+
     # 거래소 코드 매핑 테이블
     EXCHANGE_TABLE = {
         "SOXL": ("AMEX", "AMS"),
@@ -60,10 +114,98 @@ class HantooDataSource:
         "BITU": ("AMEX", "AMS"),
     }
 
+    # 상품기본정보 조회용 상품유형코드 → 거래소 코드 (조회 순서대로 시도)
+    PRODUCT_TYPE_EXCHANGES = {
+        "512": ("NASD", "NAS"),  # 나스닥
+        "513": ("NYSE", "NYS"),  # 뉴욕
+        "529": ("AMEX", "AMS"),  # 아멕스
+    }
+
     def __init__(self):
         """한국투자증권 클라이언트 초기화"""
         self.account_info = HantooAccountInfo()
 
+    @property
+    def session(self) -> requests.Session:
+        """이 DataSource가 사용하는 공유 HTTP 세션"""
+        return self.get_session(self.account_info.pool_size)
+
+    @classmethod
+    def get_session(cls, pool_size: int = 10) -> requests.Session:
+        """
+        공유 HTTP 세션 조회 (최초 호출 시 생성)
+
+        모든 토큰/시세/주문/체결 요청이 같은 커넥션 풀을 사용하므로
+        요청마다 TCP/TLS 핸드셰이크를 다시 하지 않는다.
+
+        Args:
+            pool_size: 호스트당 유지할 커넥션 수 (최초 생성 시에만 적용)
+
+        Returns:
+            requests.Session: 공유 세션
+        """
+        if cls._session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    cls._session = cls._create_session(pool_size)
+        return cls._session
+
+    @staticmethod
+    def _create_session(pool_size: int) -> requests.Session:
+        """
+        커넥션 풀이 설정된 세션 생성
+
+        Args:
+            pool_size: 호스트당 유지할 커넥션 수
+
+        Returns:
+            requests.Session: 새 세션
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            pool_block=True  # 풀이 가득 차면 새 연결 대신 대기 (연결 수 상한 유지)
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"Connection": "keep-alive"})
+        return session
+
+    @classmethod
+    def close_session(cls) -> None:
+        """공유 세션 종료 (커넥션 풀 정리)"""
+        with cls._session_lock:
+            if cls._session is not None:
+                cls._session.close()
+                cls._session = None
+
+    def warm_up_connections(self, count: int = 1) -> int:
+        """
+        공유 커넥션 풀에 keep-alive 연결을 미리 열어둠 (DNS 조회 + TCP/TLS 핸드셰이크를 거래 전에 수행)
+
+        TR 호출이 아닌 API 호스트 루트로 HEAD 요청만 보내므로 초당 호출 한도를 사용하지 않는다.
+
+        Args:
+            count: 동시에 열 연결 수 (pool_size 이하로 제한)
+
+        Returns:
+            int: 연결에 성공한 요청 수
+        """
+        count = max(1, min(count, self.account_info.pool_size))
+        timeout = (self.account_info.connect_timeout, self.account_info.connect_timeout)
+
+        def open_connection(_) -> bool:
+            try:
+                self.session.head(self.account_info.api_url, timeout=timeout)
+                return True
+            except requests.RequestException as e:
+                logging.warning(f"커넥션 사전 연결 실패: {e}")
+                return False
+
+        with ThreadPoolExecutor(max_workers=count, thread_name_prefix="hantoo-warmup") as executor:
+            return sum(executor.map(open_connection, range(count)))
+
     def get_hantoo_exd(self, symbol: str) -> HantooExd:
         """
         종목 심볼을 기준으로 한투 거래소 코드 조회
@@ -73,13 +215,58 @@ class HantooDataSource:
 
         Returns:
             HantooExd: 거래소 정보 (기본값: AMEX/AMS)
+
+        Note:
+            EXCHANGE_TABLE에 없는 종목은 상품기본정보 API로 1회 확인 후 영구 캐시에서 응답
         """
         if symbol in self.EXCHANGE_TABLE:
             trading_exd, price_exd = self.EXCHANGE_TABLE[symbol]
             return HantooExd(trading_exd=trading_exd, price_exd=price_exd)
+
+        exd = self.get_exchange_codes().resolve(symbol, self._lookup_hantoo_exd)
+        if exd is not None:
+            return exd
         # 기본값: AMEX/AMS
         return HantooExd(trading_exd="AMEX", price_exd="AMS")
 
+    def get_exchange_codes(self) -> HantooExchangeCodeCache:
+        """프로세스 전역 거래소 코드 캐시 조회 (최초 호출 시 생성)"""
+        cls = type(self)
+        if cls._exchange_codes is None:
+            with cls._session_lock:
+                if cls._exchange_codes is None:
+                    cls._exchange_codes = HantooExchangeCodeCache(
+                        refresh_days=self.account_info.exchange_refresh_days,
+                        miss_retry_hours=self.account_info.exchange_miss_retry_hours
+                    )
+        return cls._exchange_codes
+
+    def _lookup_hantoo_exd(self, symbol: str) -> Optional[HantooExd]:
+        """
+        상품기본정보(CTPF1702R)로 종목의 상장 거래소 확인
+
+        Args:
+            symbol: 종목 심볼
+
+        Returns:
+            HantooExd: 거래소 정보, 어느 거래소에서도 찾지 못하면 None
+        """
+        for product_type, (trading_exd, price_exd) in self.PRODUCT_TYPE_EXCHANGES.items():
+            response = self.get_request(
+                "/uapi/overseas-price/v1/quotations/search-info",
+                {"tr_id": "CTPF1702R", "custtype": "P"},
+                {"PRDT_TYPE_CD": product_type, "PDNO": symbol}
+            )
+            # 서버 오류는 예외로 올려 '찾지 못함'으로 기록되지 않게 함
+            response.raise_for_status()
+            data = response.json()
+            output = data.get("output") or {}
+            if data.get("rt_cd") == "0" and output.get("ovrs_excg_cd"):
+                listed_exd = output["ovrs_excg_cd"]
+                price_codes = dict(self.PRODUCT_TYPE_EXCHANGES.values())
+                return HantooExd(trading_exd=listed_exd, price_exd=price_codes.get(listed_exd, price_exd))
+        return None
+
     def _request_token(self) -> requests.Response:
         """
         토큰 발급 요청
@@ -97,7 +284,9 @@ class HantooDataSource:
             "appsecret": self.account_info.app_secret
         }
         try:
-            response = requests.post(url, headers=headers, data=json.dumps(body))
+            response = self.session.post(
+                url, headers=headers, data=json.dumps(body), timeout=self._get_timeout(None)
+            )
             msg = f"POST {url} - Status: {response.status_code}"
             logging.debug(msg)
             print(msg)
@@ -107,50 +296,50 @@ class HantooDataSource:
             logging.error(msg)
             raise
 
-    def _update_token(self) -> Optional[str]:
+    def _issue_token(self) -> Optional[Tuple[str, str]]:
         """
-        토큰 갱신 (새로운 토큰 발급)
+        새로운 토큰 발급 (HantooTokenHolder가 단일 갱신으로 호출)
 
         Returns:
-            Optional[str]: 발급된 토큰, 실패 시 None
+            Optional[Tuple[str, str]]: (발급된 토큰, 만료일 문자열), 실패 시 None
         """
-        response = self._request_token()
-
-        if response.status_code == 200:
-            try:
-                response_data = response.json()
-                access_token = response_data.get('access_token')
-                expiration = response_data.get('access_token_token_expired')
-
-                # key_store에 저장
-                key_store.write(key_store.AT_KEY, access_token)
-                key_store.write(key_store.AT_EX_DATE, expiration)
-
-                print(f"✅ 새로운 토큰 발급 완료 (만료일: {expiration})")
-                logging.info(f"새로운 토큰 발급 완료 (만료일: {expiration})")
-
-                return access_token
-            except json.JSONDecodeError:
-                logging.error("JSON 응답 파싱 실패")
-                return None
-
-        elif response.status_code == 403:
-            try:
-                response_data = response.json()
-                error_code = response_data.get('error_code')
-                if error_code == "EGW00133":
-                    print("토큰 발급 횟수 초과, 65초 대기 후 재시도합니다")
-                    logging.info("토큰 발급 횟수 초과, 65초 대기 후 재시도합니다")
-                    time.sleep(65)
-                    return self._update_token()
-                else:
-                    logging.error("알 수 없는 403 에러: 응답 내용 확인 필요")
-            except json.JSONDecodeError:
-                logging.error("JSON 응답 파싱 실패")
-        else:
-            logging.error(f"HTTP Error: {response.status_code}")
-            logging.error(response.text)
-
+        for _ in range(self.TOKEN_ISSUE_MAX_RETRY):
+            response = self._request_token()
+
+            if response.status_code == 200:
+                try:
+                    response_data = response.json()
+                    access_token = response_data.get('access_token')
+                    expiration = response_data.get('access_token_token_expired')
+
+                    print(f"✅ 새로운 토큰 발급 완료 (만료일: {expiration})")
+                    logging.info(f"새로운 토큰 발급 완료 (만료일: {expiration})")
+
+                    return access_token, expiration
+                except json.JSONDecodeError:
+                    logging.error("JSON 응답 파싱 실패")
+                    return None
+
+            elif response.status_code == 403:
+                try:
+                    response_data = response.json()
+                    error_code = response_data.get('error_code')
+                    if error_code == "EGW00133":
+                        print("토큰 발급 횟수 초과, 65초 대기 후 재시도합니다")
+                        logging.info("토큰 발급 횟수 초과, 65초 대기 후 재시도합니다")
+                        time.sleep(65)
+                        continue
+                    else:
+                        logging.error("알 수 없는 403 에러: 응답 내용 확인 필요")
+                except json.JSONDecodeError:
+                    logging.error("JSON 응답 파싱 실패")
+            else:
+                logging.error(f"HTTP Error: {response.status_code}")
+                logging.error(response.text)
+
+            return None
+
+        logging.error("토큰 발급 재시도 횟수 초과")
         return None
 
     def _is_token_expired_error(self, response: requests.Response) -> bool:
@@ -164,61 +353,166 @@ class HantooDataSource:
                 pass
         return False
 
+    def _is_rate_limit_error(self, response: requests.Response) -> bool:
+        """초당 거래건수 초과 에러인지 확인 (EGW00201)"""
+        if response.status_code == 500:
+            try:
+                return response.json().get("msg_cd") == "EGW00201"
+            except json.JSONDecodeError:
+                pass
+        return False
+
     def _get_token(self) -> str:
         """
         유효한 토큰 조회 (만료 시 갱신)
-        - 매번 key_store에서 읽어서 최신 토큰 사용
+        - 메모리에 보관된 토큰 사용 (파일 I/O 없음)
 
         Returns:
             str: 유효한 토큰
         """
-        # 매번 key_store에서 토큰과 만료일 읽기 (egg 프로젝트 방식)
-        token = key_store.read(key_store.AT_KEY)
-        token_expiration = key_store.read(key_store.AT_EX_DATE)
+        return self.get_token_holder().get_token()
 
-        # [DEBUG] 토큰 상태 로깅
-        token_preview = token[:20] + "..." if token else None
+    def get_token_holder(self) -> HantooTokenHolder:
+        """
+        프로세스 전역 토큰 보관소 조회 (최초 호출 시 생성)
 
-        # 토큰이 없으면 새로 발급
-        if token is None:
-            logging.info("토큰이 없습니다. 토큰을 발급합니다.")
-            print("[DEBUG] ❌ 토큰이 없습니다. 토큰을 발급합니다.")
-            return self._update_token()
+        Returns:
+            HantooTokenHolder: 공유 토큰 보관소
+        """
+        cls = type(self)
+        if cls._token_holder is None:
+            with cls._session_lock:
+                if cls._token_holder is None:
+                    cls._token_holder = HantooTokenHolder(issue_func=self._issue_token)
+        return cls._token_holder
+
+    def get_rate_limiter(self) -> HantooRateLimiter:
+        """
+        프로세스 전역 속도 제한기 조회 (최초 호출 시 생성)
 
-        # 토큰 만료 여부 체크
-        if token_expiration:
-            try:
-                expiration_datetime = datetime.strptime(token_expiration, "%Y-%m-%d %H:%M:%S")
-                current_time = datetime.now()
-
-                # 만료 1시간 전에 갱신 (egg 프로젝트 방식)
-                from datetime import timedelta
-                expiration_with_buffer = expiration_datetime - timedelta(hours=1)
-
-                # [DEBUG] 시간 비교 로깅
-                logging.info(f"[DEBUG] 현재={current_time}, 만료={expiration_datetime}, 유효={current_time < expiration_with_buffer}")
-
-                if current_time < expiration_with_buffer:
-                    return token
-                else:
-                    logging.info("토큰이 만료되었습니다. 새로운 토큰을 발급합니다.")
-                    print(f"[DEBUG] ⏰ 토큰이 만료 1시간 전입니다. 새로운 토큰을 발급합니다.")
-                    return self._update_token()
-            except ValueError as e:
-                logging.error(f"유효하지 않은 만료일 형식입니다: {e}")
-                print(f"[DEBUG] ❌ 유효하지 않은 만료일 형식입니다: {e}")
-                return self._update_token()
+        Returns:
+            HantooRateLimiter: 공유 속도 제한기
+        """
+        cls = type(self)
+        if cls._rate_limiter is None:
+            with cls._session_lock:
+                if cls._rate_limiter is None:
+                    cls._rate_limiter = HantooRateLimiter(
+                        rate=self.account_info.rate_limit,
+                        burst=self.account_info.rate_burst
+                    )
+        return cls._rate_limiter
+
+    def get_rate_limit_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        우선순위 레인별 대기 시간 통계 조회
+
+        Returns:
+            Dict: 레인 이름 → 호출 수/평균/최대/누적 대기 시간(ms)
+        """
+        return self.get_rate_limiter().stats()
+
+    def get_circuit_breaker(self) -> HantooCircuitBreaker:
+        """
+        프로세스 전역 서킷 브레이커 조회 (최초 호출 시 생성)
+
+        Returns:
+            HantooCircuitBreaker: 공유 서킷 브레이커
+        """
+        cls = type(self)
+        if cls._circuit_breaker is None:
+            with cls._session_lock:
+                if cls._circuit_breaker is None:
+                    cls._circuit_breaker = HantooCircuitBreaker(
+                        failure_threshold=self.account_info.breaker_threshold,
+                        reset_timeout=self.account_info.breaker_reset
+                    )
+        return cls._circuit_breaker
+
+    def _get_timeout(self, tr_id: Optional[str]) -> Tuple[float, float]:
+        """tr_id별 (연결, 응답) 타임아웃"""
+        read_timeout = self.TR_READ_TIMEOUT.get(tr_id, self.account_info.read_timeout)
+        return self.account_info.connect_timeout, read_timeout
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        priority: HantooApiPriority,
+        **kwargs
+    ) -> requests.Response:
+        """
+        서킷 브레이커/속도 제한/타임아웃을 적용해 요청 전송
+
+        Args:
+            method: HTTP 메서드
+            url: 요청 URL
+            headers: 요청 헤더 (tr_id로 타임아웃 결정)
+            priority: 우선순위 레인
+            **kwargs: requests 추가 인자 (params, data)
+
+        Returns:
+            requests.Response: API 응답
+
+        Raises:
+            HantooCircuitOpenError: 서킷이 열려 있어 호출을 거부한 경우
+        """
+        tr_id = headers.get("tr_id")
+        breaker = self.get_circuit_breaker()
+        if not breaker.allow():
+            msg = f"한투 API 서킷 OPEN 상태로 호출을 거부합니다 ({tr_id or url})"
+            logging.warning(msg)
+            raise HantooCircuitOpenError(msg)
+
+        try:
+            for attempt in range(self.RATE_LIMIT_MAX_RETRY + 1):
+                self.get_rate_limiter().acquire(priority)
+                response = self.session.request(
+                    method, url, headers=headers, timeout=self._get_timeout(tr_id), **kwargs
+                )
+                # 초당 거래건수 초과는 장애가 아니므로 잠시 후 재시도
+                if not self._is_rate_limit_error(response) or attempt == self.RATE_LIMIT_MAX_RETRY:
+                    break
+                logging.warning(f"초당 거래건수 초과 (EGW00201), 재시도 {attempt + 1}/{self.RATE_LIMIT_MAX_RETRY}")
+                time.sleep(self.RATE_LIMIT_BACKOFF * (attempt + 1))
+        except requests.RequestException:
+            # 타임아웃/연결 실패
+            breaker.record_failure()
+            raise
+        except BaseException:
+            # 네트워크 장애가 아닌 예외/중단은 판정 보류 (시험 호출이 묶여 서킷이 멈추지 않도록)
+            breaker.record_inconclusive()
+            raise
+
+        if self._is_rate_limit_error(response):
+            # 재시도 후에도 초당 건수 초과면 장애도 정상 응답도 아님
+            breaker.record_inconclusive()
+        elif response.status_code >= 500 and not self._is_token_expired_error(response):
+            # 서버 장애(5xx)만 실패로 간주 (토큰 만료는 제외)
+            breaker.record_failure()
         else:
-            logging.warning("유효하지 않은 만료일 정보입니다. 새로운 토큰을 발급합니다.")
-            print("[DEBUG] ❌ 유효하지 않은 만료일 정보입니다. 새로운 토큰을 발급합니다.")
-            return self._update_token()
+            breaker.record_success()
+        return response
+
+    def _resolve_priority(
+        self,
+        headers: Optional[Dict[str, str]],
+        priority: Optional[HantooApiPriority]
+    ) -> HantooApiPriority:
+        """명시된 우선순위가 없으면 tr_id로 레인 결정"""
+        if priority is not None:
+            return priority
+        tr_id = (headers or {}).get("tr_id")
+        return self.TR_PRIORITY.get(tr_id, HantooApiPriority.ACCOUNT)
 
     def post_request(
         self,
         end_point_url: str,
         extra_headers: Optional[Dict[str, str]] = None,
         extra_body: Optional[Dict[str, str]] = None,
-        _retry: bool = False
+        _retry: bool = False,
+        priority: Optional[HantooApiPriority] = None
     ) -> requests.Response:
         """
         POST 요청 전송
@@ -228,14 +522,16 @@ class HantooDataSource:
             extra_headers: 추가 헤더
             extra_body: 추가 바디
             _retry: 재시도 여부 (내부 사용)
+            priority: 우선순위 레인 (None이면 tr_id로 결정)
 
         Returns:
             requests.Response: API 응답
         """
         url = self.account_info.api_url + end_point_url
+        token = self._get_token()
         headers = {
             "Content-Type": "application/json; charset=UTF-8",
-            "authorization": "Bearer " + self._get_token(),
+            "authorization": "Bearer " + token,
             "appkey": self.account_info.app_key,
             "appsecret": self.account_info.app_secret
         }
@@ -250,7 +546,10 @@ class HantooDataSource:
             body.update(extra_body)
 
         try:
-            response = requests.post(url, headers=headers, data=json.dumps(body))
+            response = self._send(
+                "POST", url, headers, self._resolve_priority(extra_headers, priority),
+                data=json.dumps(body)
+            )
             msg = f"POST {url} - Status: {response.status_code}"
             logging.debug(msg)
             print(msg)
@@ -259,8 +558,8 @@ class HantooDataSource:
             if not _retry and self._is_token_expired_error(response):
                 print("🔄 토큰 만료 감지, 갱신 후 재시도...")
                 logging.info("토큰 만료 감지, 갱신 후 재시도")
-                self._update_token()
-                return self.post_request(end_point_url, extra_headers, extra_body, _retry=True)
+                self.get_token_holder().refresh(stale_token=token)
+                return self.post_request(end_point_url, extra_headers, extra_body, _retry=True, priority=priority)
 
             # 에러 응답 시 본문 출력
             if response.status_code >= 400:
@@ -277,7 +576,8 @@ class HantooDataSource:
         end_point: str,
         extra_header: Optional[Dict[str, str]] = None,
         extra_param: Optional[Dict[str, str]] = None,
-        _retry: bool = False
+        _retry: bool = False,
+        priority: Optional[HantooApiPriority] = None
     ) -> requests.Response:
         """
         GET 요청 전송
@@ -287,14 +587,16 @@ class HantooDataSource:
             extra_header: 추가 헤더
             extra_param: URL 쿼리 파라미터
             _retry: 재시도 여부 (내부 사용)
+            priority: 우선순위 레인 (None이면 tr_id로 결정)
 
         Returns:
             requests.Response: API 응답
         """
         url = self.account_info.api_url + end_point
+        token = self._get_token()
         headers = {
             "Content-Type": "application/json; charset=UTF-8",
-            "authorization": "Bearer " + self._get_token(),
+            "authorization": "Bearer " + token,
             "appkey": self.account_info.app_key,
             "appsecret": self.account_info.app_secret
         }
@@ -311,7 +613,10 @@ class HantooDataSource:
             default_query_params.update(extra_param)
 
         try:
-            response = requests.get(url, headers=headers, params=default_query_params)
+            response = self._send(
+                "GET", url, headers, self._resolve_priority(extra_header, priority),
+                params=default_query_params
+            )
             msg = f"GET {url} - Status: {response.status_code}"
             logging.debug(msg)
             print(msg)
@@ -320,8 +625,8 @@ class HantooDataSource:
             if not _retry and self._is_token_expired_error(response):
                 print("🔄 토큰 만료 감지, 갱신 후 재시도...")
                 logging.info("토큰 만료 감지, 갱신 후 재시도")
-                self._update_token()
-                return self.get_request(end_point, extra_header, extra_param, _retry=True)
+                self.get_token_holder().refresh(stale_token=token)
+                return self.get_request(end_point, extra_header, extra_param, _retry=True, priority=priority)
 
             # 에러 응답 시 본문 출력
             if response.status_code >= 400:
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""한국투자증권 API 응답 디코딩 (빠른 JSON 파싱 + 검증 없는 모델 생성)"""
+import json
+from dataclasses import fields
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, TypeVar
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경에서는 표준 json으로 동작
+    orjson = None
+
+T = TypeVar("T")
+
+
+def loads(content: bytes) -> Dict[str, Any]:
+    """
+    응답 본문(bytes) 파싱 (orjson 사용 가능 시 orjson, 아니면 json)
+
+    Args:
+        content: 응답 본문 (response.content)
+
+    Returns:
+        Dict: 파싱된 응답
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def decode(response) -> Dict[str, Any]:
+    """
+    requests 응답 디코딩 (response.text 문자열 변환 없이 bytes에서 바로 파싱)
+
+    Args:
+        response: requests.Response
+
+    Returns:
+        Dict: 파싱된 응답
+    """
+    return loads(response.content)
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+def build(cls: Type[T], row: Dict[str, Any]) -> T:
+    """
+    신뢰하는 응답 행으로 dataclass 생성 (__init__ 검증 생략)
+
+    - 모델에 선언된 필드만 복사하므로 API에 필드가 추가되어도 실패하지 않음
+    - 응답에 없는 필드는 빈 문자열 (KIS 응답 필드는 모두 문자열)
+
+    Args:
+        cls: 생성할 dataclass (hantoo_models)
+        row: 응답 행 딕셔너리
+
+    Returns:
+        cls 인스턴스
+    """
+    obj = cls.__new__(cls)
+    obj.__dict__.update({name: row.get(name, "") for name in _field_names(cls)})
+    return obj
+
+
+def build_rows(
+    cls: Type[T],
+    rows: Optional[Iterable[Dict[str, Any]]],
+    where: Optional[Callable[[Dict[str, Any]], bool]] = None
+) -> List[T]:
+    """
+    응답 행 목록을 필터링한 뒤 필요한 행만 dataclass로 생성
+
+    Args:
+        cls: 생성할 dataclass
+        rows: 응답 행 목록 (None이면 빈 목록)
+        where: 원본 딕셔너리 기준 필터 (None이면 전체)
+
+    Returns:
+        List[cls]: 생성된 모델 목록
+    """
+    if not rows:
+        return []
+    if where is None:
+        return [build(cls, row) for row in rows]
+    return [build(cls, row) for row in rows if where(row)]
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+"""종목별 거래소 코드 영구 캐시 (EXCHANGE_TABLE에 없는 종목용)"""
+import logging
+import threading
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional
+
+from config import key_store
+from data.external.hantoo.hantoo_models import HantooExd
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class HantooExchangeCodeCache:
+    """
+    상품기본정보 API로 찾은 거래소 코드를 key_store에 영구 저장하는 캐시
+
+    - 종목당 최초 1회만 조회하고 이후에는 메모리/파일에서 응답
+    - 조회는 lock 밖에서 수행하고 같은 종목 동시 조회는 1회로 합침 (다른 종목 조회를 막지 않음)
+    - 찾은 코드는 refresh_days가 지나면 다시 조회 (상장 거래소 이전 대비)
+    - 찾지 못한 종목도 기록하여 miss_retry_hours 동안은 다시 조회하지 않음
+    - 네트워크 오류 등 조회 자체가 실패하면 기록하지 않고 기존 값(만료되었더라도)을 사용
+    """
+
+    def __init__(self, refresh_days: float, miss_retry_hours: float):
+        """
+        Args:
+            refresh_days: 찾은 거래소 코드 재확인 주기 (일)
+            miss_retry_hours: 찾지 못한 종목 재조회 간격 (시간)
+        """
+        self.refresh_after = timedelta(days=refresh_days)
+        self.miss_retry_after = timedelta(hours=miss_retry_hours)
+        self._lock = threading.Lock()
+        # symbol -> {"trading_exd", "price_exd", "resolved_at"} (찾지 못한 종목은 코드가 None)
+        self._entries: Optional[Dict[str, dict]] = None
+        # symbol -> 진행 중인 조회
+        self._in_flight: Dict[str, Future] = {}
+
+    def resolve(self, symbol: str, lookup: Callable[[str], Optional[HantooExd]]) -> Optional[HantooExd]:
+        """
+        거래소 코드 조회 (캐시가 없거나 만료되었으면 lookup 호출)
+
+        Args:
+            symbol: 종목 심볼
+            lookup: 상품기본정보 조회 함수 (찾지 못하면 None, 조회 실패 시 예외)
+
+        Returns:
+            HantooExd: 거래소 정보, 찾지 못한 종목이면 None
+        """
+        with self._lock:
+            entry = self._load().get(symbol)
+            if entry is not None and not self._is_expired(entry):
+                return self._to_exd(entry)
+
+            # 조회는 lock 밖에서 수행하고, 같은 종목 동시 조회는 진행 중인 1회 결과를 함께 기다림
+            future = self._in_flight.get(symbol)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._in_flight[symbol] = future
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            exd = lookup(symbol)
+        except Exception as e:
+            logging.warning(f"{symbol} 거래소 코드 조회 실패: {e}")
+            exd = self._to_exd(entry) if entry is not None else None
+            self._finish(symbol, future, result=exd)
+            return exd
+        except BaseException as e:
+            self._finish(symbol, future, error=e)
+            raise
+
+        try:
+            with self._lock:
+                entries = self._load()
+                entries[symbol] = {
+                    "trading_exd": exd.trading_exd if exd else None,
+                    "price_exd": exd.price_exd if exd else None,
+                    "resolved_at": datetime.now().strftime(DATE_FORMAT),
+                }
+                key_store.write(key_store.EXCHANGE_CODES, entries)
+        finally:
+            # 기록에 실패해도 찾은 코드는 기다리는 스레드에 전달
+            self._finish(symbol, future, result=exd)
+
+        if exd:
+            print(f"🔎 {symbol} 거래소 코드 확인: {exd.trading_exd}/{exd.price_exd}")
+        else:
+            print(f"⚠️ {symbol} 거래소 코드를 찾지 못했습니다 (기본값 사용)")
+        return exd
+
+    def invalidate(self, symbol: str) -> None:
+        """종목 캐시 삭제 (다음 조회 시 다시 확인)"""
+        with self._lock:
+            entries = self._load()
+            if entries.pop(symbol, None) is not None:
+                key_store.write(key_store.EXCHANGE_CODES, entries)
+
+    # ===== Private Methods =====
+
+    def _finish(
+        self,
+        symbol: str,
+        future: Future,
+        result: Optional[HantooExd] = None,
+        error: Optional[BaseException] = None
+    ) -> None:
+        """진행 중인 조회 정리 후 기다리는 스레드에 결과(또는 예외) 전달"""
+        with self._lock:
+            if self._in_flight.get(symbol) is future:
+                self._in_flight.pop(symbol)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def _load(self) -> Dict[str, dict]:
+        """lock 보유 상태에서 호출 (최초 1회 key_store에서 로드)"""
+        if self._entries is None:
+            self._entries = dict(key_store.read(key_store.EXCHANGE_CODES) or {})
+        return self._entries
+
+    def _is_expired(self, entry: dict) -> bool:
+        try:
+            resolved_at = datetime.strptime(entry["resolved_at"], DATE_FORMAT)
+        except (KeyError, TypeError, ValueError):
+            return True
+        ttl = self.refresh_after if entry.get("trading_exd") else self.miss_retry_after
+        return datetime.now() - resolved_at >= ttl
+
+    @staticmethod
+    def _to_exd(entry: dict) -> Optional[HantooExd]:
+        if not entry.get("trading_exd"):
+            return None
+        return HantooExd(trading_exd=entry["trading_exd"], price_exd=entry["price_exd"])
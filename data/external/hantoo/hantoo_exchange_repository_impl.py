@@ -1,24 +1,32 @@
 # -*- coding: utf-8 -*-
 """한국투자증권 ExchangeRepository 구현체"""
-import json
+import threading
 import time
-from datetime import datetime
-from typing import Optional, List
-
-from config import util
-from domain.repositories import ExchangeRepository
+import uuid
+from datetime import datetime, timedelta
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, List, Dict, Iterable
+
+import requests
+
+from config import util, item, key_store
+from domain.entities.fill import Fill
+from domain.repositories import ExchangeRepository, FillLedgerRepository
+from domain.value_objects.quote_snapshot import QuoteSnapshot
+from data.external.hantoo.hantoo_circuit_breaker import HantooCircuitOpenError
 from data.external.hantoo.hantoo_data_source import HantooDataSource
+from data.external.hantoo.hantoo_decoder import decode, build, build_rows
+from data.external.hantoo.hantoo_quote_cache import HantooQuoteCache
+from data.external.hantoo.hantoo_fill_tracker import HantooFillTracker
+from data.external.hantoo.hantoo_account_snapshot import HantooAccountSnapshotCache
+from data.external.hantoo.hantoo_order_intents import HantooOrderIntentStore, DATE_FORMAT as INTENT_DATE_FORMAT, PLACED_AT_FORMAT
 from data.external.hantoo.hantoo_models import (
     PriceOutput,
     Balance1,
     Balance2,
     BalanceResult,
-    OrderDetail,
     AvailableAmount,
-    BalanceForTickers,
     BalanceForTickerOutput1,
-    BalanceForTickerOutput2,
-    BalanceForTickerOutput3,
     TickerItem
 )
 
@@ -26,38 +34,182 @@ from data.external.hantoo.hantoo_models import (
 class HantooExchangeRepositoryImpl(ExchangeRepository):
     """한국투자증권 ExchangeRepository 구현체"""
 
-    def __init__(self, test_mode: bool = False):
+    # 시장가를 가로지르는 지정가 주문 마진 (매수 +2%, 매도 -2%)
+    ORDER_PRICE_MARGIN = 0.02
+
+    # 일괄 시세 조회 동시 요청 수 (한투 초당 요청 제한 이내로 유지)
+    QUOTE_BATCH_WORKERS = 4
+
+    # 체결 내역 연속 조회 최대 페이지 수
+    FILL_HISTORY_MAX_PAGES = 10
+
+    # 응답 유실 주문의 주문 내역 대조 간격 (초, 합계 약 10초 동안 반복 조회)
+    ORDER_RECONCILE_DELAYS = (1.0, 2.0, 3.0, 4.0)
+    # 접수 여부 불명 주문을 '미접수'로 확정하기 전 최소 경과 시간 (주문 내역 반영 지연 대비)
+    ORDER_RECONCILE_MIN_AGE = timedelta(seconds=60)
+    # 주문 내역 시각과 의도 기록 시각 비교 시 허용 오차 (서버 간 시계 차이)
+    ORDER_TIME_TOLERANCE = timedelta(seconds=60)
+
+    # 사전 준비 시 토큰이 최소한 남겨둬야 할 유효 시간 (거래 시간대 중 재발급 방지)
+    WARMUP_TOKEN_MIN_REMAINING = timedelta(hours=3)
+
+    # 테스트 모드 현재가
+    TEST_PRICES = {
+        "TQQQ": 52.33,  # %지점가(54.82) < 56 < 익절가(58.82)
+        "SOXL": 40.46,
+        "LABU": 15.0,
+        "SPY": 550.0,
+        "QQQ": 400.0,
+        "VTI": 250.0
+    }
+
+    # 테스트 모드 전일 종가
+    TEST_PREV_PRICES = {
+        "TQQQ": 65.0,  # 전일 종가 (현재가: 60.0)
+        "SOXL": 27.0,
+        "LABU": 16.0,
+        "SPY": 545.0,
+        "QQQ": 395.0,
+        "VTI": 248.0
+    }
+
+    def __init__(self, test_mode: bool = False, fill_ledger_repo: Optional[FillLedgerRepository] = None):
         """
         한투 서비스 초기화
 
         Args:
             test_mode: 테스트 모드 활성화 여부
+            fill_ledger_repo: 체결 원장 저장소 (없으면 체결 확인 시마다 전체 체결 내역 조회)
         """
         self.data_source = HantooDataSource()
         self.test_mode = test_mode
+        self.fill_ledger_repo = fill_ledger_repo
+        # 폴러 스레드와 리포트가 동시에 동기화하지 않도록 직렬화
+        self._fill_sync_lock = threading.Lock()
+        self.quote_cache = HantooQuoteCache(ttl=item.QUOTE_CACHE_TTL)
+        self.fill_tracker = HantooFillTracker(
+            fetch_fills=self._get_fills,
+            schedule=item.FILL_POLL_SCHEDULE,
+            max_interval=item.FILL_POLL_MAX_INTERVAL,
+            timeout=item.FILL_TIMEOUT
+        )
+        self.account_cache = HantooAccountSnapshotCache(ttl=item.ACCOUNT_SNAPSHOT_TTL)
+        self.order_intents = HantooOrderIntentStore()
 
-    def get_price(self, symbol: str) -> Optional[float]:
+    def get_quote(self, symbol: str, max_age: Optional[float] = None) -> Optional[QuoteSnapshot]:
         """
-        현재 가격 조회
+        시세 스냅샷 조회 (HHDFS00000300 1회 호출로 현재가 + 전일 종가)
 
         Args:
             symbol: 종목 심볼
+            max_age: 허용 캐시 나이 (초, None이면 QUOTE_CACHE_TTL)
 
         Returns:
-            float: 현재 가격, 조회 실패 시 None
+            QuoteSnapshot: 시세 스냅샷, 조회 실패 시 None
+
+        Note:
+            HHDFS00000300 응답에는 호가가 없으므로 bid/ask는 None
+            서킷이 열려 있으면 API 호출 없이 마지막 캐시 시세를 반환 (timestamp로 나이 확인 가능)
         """
         # 테스트 모드일 경우 테스트 가격 반환
         if self.test_mode:
-            test_prices = {
-                "TQQQ": 52.33,  # %지점가(54.82) < 56 < 익절가(58.82)
-                "SOXL": 40.46,
-                "LABU": 15.0,
-                "SPY": 550.0,
-                "QQQ": 400.0,
-                "VTI": 250.0
-            }
-            return test_prices.get(symbol, 100.0)
+            return QuoteSnapshot(
+                symbol=symbol,
+                last=self.TEST_PRICES.get(symbol, 100.0),
+                base=self.TEST_PREV_PRICES.get(symbol, 99.0)
+            )
+
+        try:
+            return self.quote_cache.get(symbol, lambda: self._fetch_quote(symbol), max_age=max_age)
+        except HantooCircuitOpenError:
+            stale = self.quote_cache.peek(symbol)
+            print(f"⚠️ 한투 API 차단 중 - {symbol} 마지막 캐시 시세 사용: {stale}")
+            return stale
+
+    def is_available(self) -> bool:
+        """
+        증권사 API 호출 가능 여부 (서킷 브레이커 상태)
+
+        Returns:
+            bool: 서킷이 열려 있으면 False
+        """
+        if self.test_mode:
+            return True
+        return self.data_source.get_circuit_breaker().is_available()
+
+    def warm_up(self, symbols: Iterable[str]) -> Dict[str, Optional[float]]:
+        """
+        거래 시작 전 사전 준비
+
+        - token: 남은 유효 시간이 짧으면 미리 재발급
+        - connection: 공유 커넥션 풀에 시세 동시 조회 수만큼 연결을 열어둠
+        - quotes: 종목별 거래소 코드 확인 + 현재가 조회 (첫 시세 요청 경로 적재)
+        - fills: 체결 원장 증분 동기화 (원장 테이블 + 체결 내역 조회 경로 적재)
+
+        Args:
+            symbols: 시세를 미리 조회할 종목 목록
+
+        Returns:
+            Dict[str, Optional[float]]: 단계 이름 → 소요 시간 (ms, 실패한 단계는 None)
+        """
+        if self.test_mode:
+            return {}
+
+        timings = {}
+
+        def timed(step: str, func) -> None:
+            started = time.perf_counter()
+            try:
+                func()
+            except Exception as e:
+                print(f"⚠️ 사전 준비 실패 ({step}): {e}")
+                timings[step] = None
+                return
+            timings[step] = round((time.perf_counter() - started) * 1000, 1)
+
+        timed("token", lambda: self.data_source.get_token_holder().ensure_valid_for(self.WARMUP_TOKEN_MIN_REMAINING))
+        timed("connection", lambda: self.data_source.warm_up_connections(self.QUOTE_BATCH_WORKERS))
+        timed("quotes", lambda: self._warm_up_quotes(symbols))
+        if self.fill_ledger_repo is not None:
+            timed("fills", self.sync_fills)
+        return timings
+
+    def _warm_up_quotes(self, symbols: Iterable[str]) -> None:
+        """
+        사전 준비용 시세 조회 (조회 실패 종목이 있으면 예외)
+
+        get_prices는 종목별 실패를 None으로 삼키므로 결과를 확인해 실패를 드러낸다.
+
+        Args:
+            symbols: 시세를 미리 조회할 종목 목록
+
+        Raises:
+            RuntimeError: 현재가를 받지 못한 종목이 있을 때
+        """
+        prices = self.get_prices(symbols)
+        missing = [symbol for symbol, price in prices.items() if price is None]
+        if missing:
+            raise RuntimeError(f"현재가 조회 실패 {len(missing)}/{len(prices)}종목: {', '.join(missing)}")
+
+    def invalidate_quote(self, symbol: Optional[str] = None) -> None:
+        """
+        시세 캐시 무효화 (자체 체결 직후 호출)
+
+        Args:
+            symbol: 무효화할 종목 (None이면 전체)
+        """
+        self.quote_cache.invalidate(symbol)
+
+    def _fetch_quote(self, symbol: str) -> Optional[QuoteSnapshot]:
+        """
+        시세 스냅샷 API 조회 (private, 캐시 미사용)
+
+        Args:
+            symbol: 종목 심볼
 
+        Returns:
+            QuoteSnapshot: 시세 스냅샷
+        """
         end_point = "/uapi/overseas-price/v1/quotations/price"
         extra_header = {"tr_id": "HHDFS00000300"}
         extra_param = {
@@ -69,58 +221,82 @@ class HantooExchangeRepositoryImpl(ExchangeRepository):
         response = self.data_source.get_request(end_point=end_point, extra_header=extra_header, extra_param=extra_param)
 
         # 응답을 파싱하여 반환
-        data_dict = json.loads(response.text)
-        stock_data = PriceOutput(**data_dict['output'])
+        stock_data = build(PriceOutput, decode(response)['output'])
 
-        if stock_data.last:
-            return round(float(stock_data.last), 2)
-        else:
-            return None
+        return QuoteSnapshot(
+            symbol=symbol,
+            last=round(float(stock_data.last), 2) if stock_data.last else None,
+            base=round(float(stock_data.base), 2) if stock_data.base else None
+        )
 
-    def get_prev_price(self, symbol: str) -> Optional[float]:
+    def get_price(self, symbol: str, max_age: Optional[float] = None) -> Optional[float]:
         """
-        전일 종가 조회
+        현재 가격 조회 (시세 스냅샷의 last)
 
         Args:
             symbol: 종목 심볼
+            max_age: 허용 캐시 나이 (초, None이면 QUOTE_CACHE_TTL)
 
         Returns:
-            float: 전일 종가, 조회 실패 시 None
+            float: 현재 가격, 조회 실패 시 None
         """
+        quote = self.get_quote(symbol, max_age=max_age)
+        return quote.last if quote else None
+
+    def get_prices(self, symbols: Iterable[str], max_age: Optional[float] = None) -> Dict[str, Optional[float]]:
+        """
+        여러 종목 현재가 일괄 조회
+
+        중복 제거 후 QUOTE_BATCH_WORKERS개 이하의 스레드로 동시에 조회한다.
+        (종목별 조회는 시세 캐시를 거치므로 TTL 이내 종목은 API 호출 없음)
+
+        Args:
+            symbols: 종목 심볼 목록
+            max_age: 허용 캐시 나이 (초, None이면 QUOTE_CACHE_TTL)
+
+        Returns:
+            Dict[str, Optional[float]]: {심볼: 현재가}, 조회 실패한 종목은 None
+        """
+        unique_symbols = list(dict.fromkeys(symbol for symbol in symbols if symbol))
+        if not unique_symbols:
+            return {}
+
         # 테스트 모드일 경우 테스트 가격 반환
         if self.test_mode:
-            test_prices = {
-                "TQQQ": 65.0,  # 전일 종가 (현재가: 60.0)
-                "SOXL": 27.0,
-                "LABU": 16.0,
-                "SPY": 545.0,
-                "QQQ": 395.0,
-                "VTI": 248.0
-            }
-            return test_prices.get(symbol, 99.0)
+            return {symbol: self.TEST_PRICES.get(symbol, 100.0) for symbol in unique_symbols}
 
-        end_point = "/uapi/overseas-price/v1/quotations/price"
-        extra_header = {"tr_id": "HHDFS00000300"}
-        extra_param = {
-            "AUTH": "",
-            "EXCD": self.data_source.get_hantoo_exd(symbol).price_exd,
-            "SYMB": symbol
-        }
+        def fetch_price(symbol: str) -> Optional[float]:
+            try:
+                return self.get_price(symbol, max_age=max_age)
+            except Exception as e:
+                print(f"❌ [{symbol}] 현재가 조회 실패: {e}")
+                return None
 
-        response = self.data_source.get_request(end_point=end_point, extra_header=extra_header, extra_param=extra_param)
+        if len(unique_symbols) == 1:
+            return {unique_symbols[0]: fetch_price(unique_symbols[0])}
 
-        # 응답을 파싱하여 반환
-        data_dict = json.loads(response.text)
-        stock_data = PriceOutput(**data_dict['output'])
+        workers = min(self.QUOTE_BATCH_WORKERS, len(unique_symbols))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hantoo-quote") as executor:
+            prices = list(executor.map(fetch_price, unique_symbols))
 
-        if stock_data.base:
-            return round(float(stock_data.base), 2)
-        else:
-            return None
+        return dict(zip(unique_symbols, prices))
+
+    def get_prev_price(self, symbol: str) -> Optional[float]:
+        """
+        전일 종가 조회 (시세 스냅샷의 base)
+
+        Args:
+            symbol: 종목 심볼
+
+        Returns:
+            float: 전일 종가, 조회 실패 시 None
+        """
+        quote = self.get_quote(symbol)
+        return quote.base if quote else None
 
     def get_available_buy(self, symbol: str) -> Optional[float]:
         """
-        매수 주문 가능 가격 조회 (현재가 + 0.5% 마진)
+        매수 주문 가능 가격 조회 (현재가 + 2% 마진)
 
         Args:
             symbol: 종목 심볼
@@ -128,13 +304,15 @@ class HantooExchangeRepositoryImpl(ExchangeRepository):
         Returns:
             float: 매수 주문 가능 가격
         """
+        origin_price = self.get_price(symbol)
+        if not origin_price:
+            return None
+
         # 테스트 모드일 경우 현재 가격 그대로 반환
         if self.test_mode:
-            return self.get_price(symbol)
+            return origin_price
 
-        origin_price = self.get_price(symbol)
-        request_price = round(origin_price * (1 + 0.02), 2)
-        return request_price
+        return round(origin_price * (1 + self.ORDER_PRICE_MARGIN), 2)
 
     def get_available_sell(self, symbol: str) -> Optional[float]:
         """
@@ -146,15 +324,19 @@ class HantooExchangeRepositoryImpl(ExchangeRepository):
         Returns:
             float: 매도 주문 가능 가격
         """
+        origin_price = self.get_price(symbol)
+        if not origin_price:
+            return None
+
         # 테스트 모드일 경우 현재 가격 그대로 반환
         if self.test_mode:
-            return self.get_price(symbol)
+            return origin_price
 
-        origin_price = self.get_price(symbol)
-        request_price = round(origin_price * (1 - 0.02), 2)
-        return request_price
+        return round(origin_price * (1 - self.ORDER_PRICE_MARGIN), 2)
 
-    def buy(self, symbol: str, amount: float, request_price: float) -> Optional['TradeResult']:
+    def buy(
+        self, symbol: str, amount: float, request_price: float, client_key: Optional[str] = None
+    ) -> Optional['TradeResult']:
         """
         즉시 매수 (주문 후 체결 확인까지 대기)
 
@@ -162,10 +344,45 @@ class HantooExchangeRepositoryImpl(ExchangeRepository):
             symbol: 종목 심볼
             amount: 매수 수량
             request_price: 주문 가격
+            client_key: 클라이언트 주문 키 (같은 키는 한 번만 접수, None이면 호출마다 새 키)
 
         Returns:
             TradeResult: 거래 결과, 실패 시 None
         """
+        return self.submit_buy(symbol, amount, request_price, client_key).result()
+
+    def sell(
+        self, symbol: str, amount: float, request_price: float, client_key: Optional[str] = None
+    ) -> Optional['TradeResult']:
+        """
+        즉시 매도 (주문 후 체결 확인까지 대기)
+
+        Args:
+            symbol: 종목 심볼
+            amount: 매도 수량
+            request_price: 주문 가격
+            client_key: 클라이언트 주문 키 (같은 키는 한 번만 접수, None이면 호출마다 새 키)
+
+        Returns:
+            TradeResult: 거래 결과, 실패 시 None
+        """
+        return self.submit_sell(symbol, amount, request_price, client_key).result()
+
+    def submit_buy(
+        self, symbol: str, amount: float, request_price: float, client_key: Optional[str] = None
+    ) -> Future:
+        """
+        매수 주문 전송 후 즉시 반환 (체결 확인은 FillTracker가 일괄 처리)
+
+        Args:
+            symbol: 종목 심볼
+            amount: 매수 수량
+            request_price: 주문 가격
+            client_key: 클라이언트 주문 키 (같은 키는 한 번만 접수, None이면 호출마다 새 키)
+
+        Returns:
+            Future: 체결 시 TradeResult, 주문/체결 확인 실패 시 None으로 완료
+        """
         from domain.value_objects.trade_type import TradeType
         from domain.value_objects.trade_result import TradeResult
 
@@ -178,40 +395,25 @@ class HantooExchangeRepositoryImpl(ExchangeRepository):
                 total_price=round(amount * request_price, 2)
             )
             print(f"✅ [TEST MODE] 매수 완료: {amount} @ ${request_price:,.2f} = ${trade_result.total_price:,.2f}")
-            return trade_result
-
-        end_point = "/uapi/overseas-stock/v1/trading/order"
-        extra_header = {"tr_id": "TTTT1002U"}
-        body = {
-            "OVRS_EXCG_CD": self.data_source.get_hantoo_exd(symbol).trading_exd,
-            "PDNO": str(symbol),
-            "ORD_QTY": str(int(amount)),
-            "OVRS_ORD_UNPR": str(request_price),
-            "ORD_SVR_DVSN_CD": "0",
-            "ORD_DVSN": "00"
-        }
-        buy_response = json.loads(self.data_source.post_request(end_point, extra_header, body).text)
-        odno = buy_response["output"]["ODNO"] if buy_response["rt_cd"] == "0" else None
-
-        if odno is not None:
-            return self._perform_periodic_task(
-                task_func=lambda: self._find_trade_history(odno=odno, symbol=symbol),
-                fail_msg=f"{symbol} 거래 내역이 찾을 수 없습니다"
-            )
+            return self._completed_future(trade_result)
 
-        return None
+        odno = self.buy_request_only_odno(symbol, amount, request_price, client_key)
+        return self._track_fill(odno, symbol)
 
-    def sell(self, symbol: str, amount: float, request_price: float) -> Optional['TradeResult']:
+    def submit_sell(
+        self, symbol: str, amount: float, request_price: float, client_key: Optional[str] = None
+    ) -> Future:
         """
-        즉시 매도 (주문 후 체결 확인까지 대기)
+        매도 주문 전송 후 즉시 반환 (체결 확인은 FillTracker가 일괄 처리)
 
         Args:
             symbol: 종목 심볼
             amount: 매도 수량
             request_price: 주문 가격
+            client_key: 클라이언트 주문 키 (같은 키는 한 번만 접수, None이면 호출마다 새 키)
 
         Returns:
-            TradeResult: 거래 결과, 실패 시 None
+            Future: 체결 시 TradeResult, 주문/체결 확인 실패 시 None으로 완료
         """
         from domain.value_objects.trade_type import TradeType
         from domain.value_objects.trade_result import TradeResult
@@ -225,31 +427,14 @@ class HantooExchangeRepositoryImpl(ExchangeRepository):
                 total_price=round(amount * request_price, 2)
             )
             print(f"✅ [TEST MODE] 매도 완료: {amount} @ ${request_price:,.2f} = ${trade_result.total_price:,.2f}")
-            return trade_result
+            return self._completed_future(trade_result)
 
-        end_point = "/uapi/overseas-stock/v1/trading/order"
-        extra_header = {"tr_id": "TTTT1006U"}
-        body = {
-            "OVRS_EXCG_CD": self.data_source.get_hantoo_exd(symbol).trading_exd,
-            "PDNO": str(symbol),
-            "ORD_QTY": str(int(amount)),
-            "OVRS_ORD_UNPR": str(request_price),
-            "ORD_SVR_DVSN_CD": "0",
-            "SLL_TYPE": "00",
-            "ORD_DVSN": "00"
-        }
-        sell_response = json.loads(self.data_source.post_request(end_point, extra_header, body).text)
-        odno = sell_response["output"]["ODNO"] if sell_response["rt_cd"] == "0" else None
+        odno = self.sell_request_only_odno(symbol, amount, request_price, client_key)
+        return self._track_fill(odno, symbol)
 
-        if odno is not None:
-            return self._perform_periodic_task(
-                task_func=lambda: self._find_trade_history(odno=odno, symbol=symbol),
-                fail_msg=f"{symbol} 거래 내역이 찾을 수 없습니다"
-            )
-
-        return None
-
-    def buy_request_only_odno(self, symbol: str, amount: float, request_price: float) -> Optional[str]:
+    def buy_request_only_odno(
+        self, symbol: str, amount: float, request_price: float, client_key: Optional[str] = None
+    ) -> Optional[str]:
         """
         매수 주문만 (주문번호만 반환, TWAP용)
 
@@ -257,6 +442,7 @@ class HantooExchangeRepositoryImpl(ExchangeRepository):
             symbol: 종목 심볼
             amount: 매수 수량
             request_price: 주문 가격
+            client_key: 클라이언트 주문 키 (같은 키는 한 번만 접수, None이면 호출마다 새 키)
 
         Returns:
             str: 주문번호 (ODNO), 실패 시 None
@@ -266,22 +452,11 @@ class HantooExchangeRepositoryImpl(ExchangeRepository):
             print(f"📝 [TEST MODE] 매수 주문: {amount} @ ${request_price:,.2f}")
             return "TEST_ODNO_BUY"
 
-        end_point = "/uapi/overseas-stock/v1/trading/order"
-        extra_header = {"tr_id": "TTTT1002U"}
-        body = {
-            "OVRS_EXCG_CD": self.data_source.get_hantoo_exd(symbol).trading_exd,
-            "PDNO": str(symbol),
-            "ORD_QTY": str(int(amount)),
-            "OVRS_ORD_UNPR": str(request_price),
-            "ORD_SVR_DVSN_CD": "0",
-            "ORD_DVSN": "00"
-        }
-        buy_response = json.loads(self.data_source.post_request(end_point, extra_header, body).text)
-        odno = buy_response["output"]["ODNO"] if buy_response["rt_cd"] == "0" else None
-
-        return odno
+        return self._place_order("buy", symbol, amount, request_price, client_key)
 
-    def sell_request_only_odno(self, symbol: str, amount: float, request_price: float) -> Optional[str]:
+    def sell_request_only_odno(
+        self, symbol: str, amount: float, request_price: float, client_key: Optional[str] = None
+    ) -> Optional[str]:
         """
         매도 주문만 (주문번호만 반환, TWAP용)
 
@@ -289,6 +464,7 @@ class HantooExchangeRepositoryImpl(ExchangeRepository):
             symbol: 종목 심볼
             amount: 매도 수량
             request_price: 주문 가격
+            client_key: 클라이언트 주문 키 (같은 키는 한 번만 접수, None이면 호출마다 새 키)
 
         Returns:
             str: 주문번호 (ODNO), 실패 시 None
@@ -298,69 +474,173 @@ class HantooExchangeRepositoryImpl(ExchangeRepository):
             print(f"📝 [TEST MODE] 매도 주문: {amount} @ ${request_price:,.2f}")
             return "TEST_ODNO_SELL"
 
+        return self._place_order("sell", symbol, amount, request_price, client_key)
+
+    def _place_order(
+        self, side: str, symbol: str, amount: float, request_price: float, client_key: Optional[str]
+    ) -> Optional[str]:
+        """
+        client key 기준 중복 없는 주문 전송 (private)
+
+        주문 전에 의도를 기록하고, 응답을 받지 못한 경우(타임아웃/연결 끊김/5xx)에는
+        주문 내역을 간격을 늘려가며 대조한다. 찾지 못해도 같은 호출에서는 재전송하지 않고
+        의도를 '접수 불명'으로 남겨 둔다 (주문 내역 반영이 늦은 주문의 중복 전송 방지).
+        같은 key로 다시 호출되면 이미 접수된 주문번호를 반환하고, 불명 의도는
+        ORDER_RECONCILE_MIN_AGE가 지난 뒤에도 주문 내역에 없을 때만 재전송한다.
+
+        TWAP 회차 키는 None을 받으면 다음 회차로 넘어가 다시 쓰이지 않으므로, 그 회차는
+        재전송되지 않고 결과 없음으로 처리된다 (늦게 접수된 주문의 체결도 봇에 반영되지 않음).
+        호출하는 쪽은 is_order_unconfirmed()로 이 경우를 구분해 알린다.
+
+        Args:
+            side: "buy" 또는 "sell"
+            symbol: 종목 심볼
+            amount: 주문 수량
+            request_price: 주문 가격
+            client_key: 클라이언트 주문 키 (None이면 새 키)
+
+        Returns:
+            str: 주문번호 (ODNO), 거부/접수 불명 시 None
+        """
+        client_key = client_key or uuid.uuid4().hex
+
+        intent = self.order_intents.get(client_key)
+        if intent is not None:
+            if intent["odno"]:
+                print(f"♻️ 이미 접수된 주문입니다 ({client_key} → {intent['odno']})")
+                return intent["odno"]
+            # 이전 전송의 접수 여부가 불명 → 주문 내역 대조, 충분히 지난 뒤에도 없을 때만 재전송
+            found, odno = self._reconcile_order(client_key, intent)
+            if found is not False:
+                return odno
+            if not self._is_reconcile_expired(intent):
+                print(f"⏳ 접수 여부 확인 대기 중인 주문입니다 ({client_key}) - 재전송하지 않습니다")
+                return None
+            print(f"🔁 주문 미접수 확인, 재전송합니다 ({client_key})")
+
+        self.order_intents.record(client_key, symbol, side, int(amount), request_price)
+        try:
+            response = self._post_order(side, symbol, amount, request_price)
+        except HantooCircuitOpenError:
+            # 서킷 차단으로 전송 자체를 하지 않음
+            self.order_intents.discard(client_key)
+            raise
+        except requests.RequestException as e:
+            print(f"⚠️ 주문 응답 없음 ({symbol} {side} {int(amount)}주): {e}")
+            response = None
+
+        if response is not None and not self._is_ambiguous_order_response(response):
+            return self._accept_order_response(client_key, response)
+
+        # 접수 여부 불명 → 간격을 늘려가며 주문 내역 대조 (찾지 못해도 재전송하지 않음)
+        for delay in self.ORDER_RECONCILE_DELAYS:
+            time.sleep(delay)
+            found, odno = self._reconcile_order(client_key, self.order_intents.get(client_key))
+            if found:
+                return odno
+
+        print(f"❌ 주문 접수 확인 실패 ({client_key}) - 같은 키로 다시 호출할 때만 대조/재전송합니다")
+        return None
+
+    def is_order_unconfirmed(self, client_key: str) -> bool:
+        """
+        client key 주문이 접수 여부 불명 상태로 남아 있는지 확인
+
+        Args:
+            client_key: 클라이언트 주문 키
+
+        Returns:
+            bool: 응답을 받지 못했고 주문 내역에서도 아직 확인되지 않았으면 True
+        """
+        if self.test_mode:
+            return False
+        intent = self.order_intents.get(client_key)
+        return intent is not None and not intent["odno"]
+
+    def _is_reconcile_expired(self, intent: dict) -> bool:
+        """접수 불명 의도가 '미접수'로 확정할 만큼 오래되었는지 (private)"""
+        try:
+            created_at = datetime.strptime(intent["created_at"], INTENT_DATE_FORMAT)
+        except (KeyError, TypeError, ValueError):
+            return True
+        return datetime.now() - created_at >= self.ORDER_RECONCILE_MIN_AGE
+
+    def _post_order(self, side: str, symbol: str, amount: float, request_price: float):
+        """주문 API 호출 (private)"""
         end_point = "/uapi/overseas-stock/v1/trading/order"
-        extra_header = {"tr_id": "TTTT1006U"}
+        extra_header = {"tr_id": "TTTT1002U" if side == "buy" else "TTTT1006U"}
         body = {
             "OVRS_EXCG_CD": self.data_source.get_hantoo_exd(symbol).trading_exd,
             "PDNO": str(symbol),
             "ORD_QTY": str(int(amount)),
             "OVRS_ORD_UNPR": str(request_price),
             "ORD_SVR_DVSN_CD": "0",
-            "SLL_TYPE": "00",
             "ORD_DVSN": "00"
         }
-        sell_response = json.loads(self.data_source.post_request(end_point, extra_header, body).text)
-        odno = sell_response["output"]["ODNO"] if sell_response["rt_cd"] == "0" else None
+        if side == "sell":
+            body["SLL_TYPE"] = "00"
+        return self.data_source.post_request(end_point, extra_header, body)
 
-        return odno
-
-    def _find_trade_history(self, odno: str, symbol: str):
-        """
-        거래 내역 찾기 (private)
-
-        Args:
-            odno: 주문 번호
-            symbol: 종목 심볼
-
-        Returns:
-            TradeResult or None
-        """
-        print("거래내역을 조회중입니다.")
-        trade_history = self._get_trade_history(symbol=symbol)
-        order_detail = self._find_output_by_odno(trade_history, odno)
+    @staticmethod
+    def _is_ambiguous_order_response(response) -> bool:
+        """서버 오류(5xx)로 접수 여부를 알 수 없는 응답인지 (초당 건수 초과는 게이트웨이 거부) (private)"""
+        if response.status_code < 500:
+            return False
+        try:
+            return decode(response).get("msg_cd") != "EGW00201"
+        except ValueError:
+            return True
+
+    def _accept_order_response(self, client_key: str, response) -> Optional[str]:
+        """정상 응답 처리: 접수 시 주문번호 연결, 거부 시 의도 삭제 (private)"""
+        data = decode(response)
+        if data.get("rt_cd") != "0":
+            print(f"❌ 주문 거부: {data.get('msg_cd')} {data.get('msg1')}")
+            self.order_intents.discard(client_key)
+            return None
 
-        if order_detail is not None:
-            print("거래내역을 찾았습니다")
-            # TradeResult 객체로 변환하여 반환
-            from domain.value_objects.trade_result import TradeResult
-            trade_result = TradeResult(
-                trade_type=None,
-                amount=float(order_detail.ft_ccld_qty),
-                unit_price=float(order_detail.ft_ccld_unpr3),
-                total_price=float(order_detail.ft_ccld_amt3)
-            )
-            return trade_result
-        return None
+        odno = data["output"]["ODNO"]
+        self.order_intents.complete(client_key, odno)
+        # 주문 접수로 주문 가능 금액/수량이 바뀌므로 계좌 스냅샷 폐기
+        self.account_cache.invalidate()
+        return odno
 
-    def _get_trade_history(self, symbol: str) -> dict:
+    def _reconcile_order(self, client_key: str, intent: Optional[dict]) -> tuple:
         """
-        거래 내역 조회 (private)
+        접수 여부 불명 주문을 주문 내역(미체결 포함)과 대조 (private)
 
-        Args:
-            symbol: 종목 심볼
+        아직 어떤 client key에도 연결되지 않은 주문 중 의도 기록 이후에 접수된,
+        종목/방향/수량/가격이 같은 최신 주문을 찾는다.
 
         Returns:
-            dict: 거래 내역 데이터
+            tuple: (True, 주문번호) 접수 확인 / (False, None) 미접수 확인 / (None, None) 대조 실패
         """
+        if intent is None:
+            return False, None
+        try:
+            odno = self._find_unclaimed_order(intent)
+        except Exception as e:
+            print(f"⚠️ 주문 내역 대조 실패 ({client_key}): {e} - 중복 방지를 위해 재전송하지 않습니다")
+            return None, None
+
+        if odno is None:
+            return False, None
+        print(f"🔗 응답 유실 주문 확인 ({client_key} → {odno})")
+        self.order_intents.complete(client_key, odno)
+        self.account_cache.invalidate()
+        return True, odno
+
+    def _find_unclaimed_order(self, intent: dict) -> Optional[str]:
+        """주문 내역(미체결 포함, 최신순 1페이지)에서 의도와 일치하는 미연결 주문번호 조회 (private)"""
         end_point = "/uapi/overseas-stock/v1/trading/inquire-ccnl"
         extra_header = {"tr_id": "TTTS3035R"}
         extra_param = {
-            "PDNO": symbol,
+            "PDNO": intent["symbol"],
             "ORD_STRT_DT": util.get_previous_date(1),
             "ORD_END_DT": util.get_previous_date(0),
-            "SLL_BUY_DVSN": "00",
-            "CCLD_NCCS_DVSN": "01",
-            "OVRS_EXCG_CD": self.data_source.get_hantoo_exd(symbol).trading_exd,
+            "SLL_BUY_DVSN": "02" if intent["side"] == "buy" else "01",
+            "CCLD_NCCS_DVSN": "00",
+            "OVRS_EXCG_CD": "%",
             "SORT_SQN": "DS",
             "ORD_DT": "",
             "ORD_GNO_BRNO": "",
@@ -368,48 +648,248 @@ class HantooExchangeRepositoryImpl(ExchangeRepository):
             "CTX_AREA_NK200": "",
             "CTX_AREA_FK200": "",
         }
-        return json.loads(self.data_source.get_request(end_point, extra_header, extra_param).text)
+        data = decode(self.data_source.get_request(end_point, extra_header, extra_param))
+        if data.get("rt_cd") != "0":
+            raise RuntimeError(f"{data.get('msg_cd')} {data.get('msg1')}")
+
+        claimed = self.order_intents.claimed_odnos()
+        placed_after = self._intent_placed_after(intent)
+        for row in data.get("output") or []:
+            if row.get("odno") in claimed or row.get("pdno") != intent["symbol"]:
+                continue
+            # 의도 기록 이전 주문(수동 주문 등)은 같은 조건이어도 제외
+            ordered_at = f"{row.get('dmst_ord_dt') or ''}{row.get('thco_ord_tmd') or ''}"
+            if placed_after and len(ordered_at) == 14 and ordered_at < placed_after:
+                continue
+            if (int(float(row.get("ft_ord_qty") or 0)) == intent["qty"]
+                    and abs(float(row.get("ft_ord_unpr3") or 0) - intent["price"]) < 0.005):
+                return row["odno"]
+        return None
 
-    @staticmethod
-    def _find_output_by_odno(data: dict, odno_to_find: str) -> Optional[OrderDetail]:
+    def _intent_placed_after(self, intent: dict) -> Optional[str]:
+        """의도 기록 시각(KST) - 허용 오차, 주문 내역 시각과 비교할 문자열 (기록 없으면 None) (private)"""
+        try:
+            placed_at = datetime.strptime(intent["placed_at"], PLACED_AT_FORMAT)
+        except (KeyError, TypeError, ValueError):
+            return None
+        return (placed_at - self.ORDER_TIME_TOLERANCE).strftime(PLACED_AT_FORMAT)
+
+    def _track_fill(self, odno: Optional[str], symbol: str) -> Future:
         """
-        주문 번호로 주문 내역 찾기 (private)
+        주문번호 체결 확인 등록 후 TradeResult Future 반환 (private)
 
         Args:
-            data: 거래 내역 데이터
-            odno_to_find: 찾을 주문 번호
+            odno: 주문번호 (주문 실패 시 None)
+            symbol: 종목 심볼
 
         Returns:
-            OrderDetail or None
+            Future: 전량 체결 시 TradeResult (제한 시간 초과 시 마지막 부분 체결), 실패 시 None으로 완료
         """
-        for item in data['output']:
-            if item['odno'] == odno_to_find:
-                return OrderDetail(**item)
-        return None
+        if odno is None:
+            return self._completed_future(None)
+
+        result_future = Future()
+
+        def on_fill(fill_future: Future) -> None:
+            try:
+                fill = fill_future.result()
+                trade_result = self._to_trade_result(fill) if fill else None
+            except Exception as e:
+                result_future.set_exception(e)
+                return
+            # 자체 체결로 시세/잔고가 바뀌었으므로 캐시 무효화
+            self.invalidate_quote(symbol)
+            self.account_cache.invalidate()
+            result_future.set_result(trade_result)
+
+        self.fill_tracker.track(odno, symbol).add_done_callback(on_fill)
+        return result_future
 
     @staticmethod
-    def _perform_periodic_task(task_func, fail_msg: str):
+    def _to_trade_result(fill: Fill) -> 'TradeResult':
+        """체결 원장 레코드를 TradeResult로 변환 (private)"""
+        from domain.value_objects.trade_result import TradeResult
+        return TradeResult(
+            trade_type=None,
+            amount=fill.filled_qty,
+            unit_price=fill.filled_price,
+            total_price=fill.filled_amount
+        )
+
+    @staticmethod
+    def _completed_future(result) -> Future:
+        """결과가 채워진 Future 생성 (private)"""
+        future = Future()
+        future.set_result(result)
+        return future
+
+    # ===== 체결 원장 =====
+
+    def sync_fills(self, pending_odnos: Iterable[str] = ()) -> int:
+        """
+        체결 내역 증분 동기화
+
+        체결 내역은 최신 주문부터 내려오므로, 원장에 마지막으로 기록된 체결(및 아직
+        미체결 수량이 남은 체결, 지난 동기화 때 미체결이던 주문, 체결 대기 중인 주문)보다
+        오래된 페이지에 닿으면 연속 조회를 멈춘다. 원장이 비어 있으면 조회 기간 전체를 받는다.
+
+        미체결 주문까지 함께 조회해 그중 가장 오래된 주문을 key_store에 남기므로,
+        수동 주문이나 다른 프로세스 주문이 나중에 체결되어도 다음 동기화에서 기록된다.
+
+        Args:
+            pending_odnos: 체결 대기 중인 주문번호 (이 주문들보다 오래된 페이지는 건너뜀)
+
+        Returns:
+            int: 새로 기록되거나 갱신된 체결 수
+        """
+        if self.test_mode or self.fill_ledger_repo is None:
+            return 0
+
+        with self._fill_sync_lock:
+            since = util.get_previous_date(1)
+            floor = self._get_fill_sync_floor(since)
+            rows = self._get_fill_rows(floor=floor, pending_odnos=pending_odnos, include_open=True)
+            synced_at = datetime.now()
+            filled_rows = [row for row in rows if float(row.get('ft_ccld_qty') or 0) > 0]
+            changed = self.fill_ledger_repo.upsert_all([self._to_fill(row, synced_at) for row in filled_rows])
+            open_keys = [self._fill_row_key(row) for row in rows if float(row.get('nccs_qty') or 0) > 0]
+            open_floor = list(min(open_keys)) if open_keys else None
+            if key_store.read(key_store.FILL_SYNC_OPEN_FLOOR) != open_floor:
+                key_store.write(key_store.FILL_SYNC_OPEN_FLOOR, open_floor)
+
+        if changed:
+            print(f"🧾 체결 원장 동기화: {changed}건 기록 (조회 {len(rows)}행)")
+        return changed
+
+    def _get_fills(self, odnos: List[str]) -> Dict[str, Fill]:
+        """
+        체결 확인 대기 주문의 체결 조회 (HantooFillTracker 폴링용, private)
+
+        체결 원장이 있으면 증분 동기화 후 원장에서 읽고, 없으면 전체 체결 내역을 조회한다.
+
+        Args:
+            odnos: 체결 대기 중인 주문번호 목록
+
+        Returns:
+            Dict[str, Fill]: 주문번호 → 체결 (체결된 주문만)
+        """
+        if self.fill_ledger_repo is None:
+            synced_at = datetime.now()
+            fills = {}
+            wanted = set(odnos)
+            # 최신 주문부터 내려오므로 같은 주문번호는 먼저 나온 행(최근 주문일)을 사용
+            for row in self._get_fill_rows():
+                if row.get('odno') in wanted and row['odno'] not in fills:
+                    fills[row['odno']] = self._to_fill(row, synced_at)
+            return fills
+
+        self.sync_fills(pending_odnos=odnos)
+        return {
+            fill.odno: fill
+            for fill in self.fill_ledger_repo.find_by_odnos(odnos, since=util.get_previous_date(1))
+        }
+
+    def _get_fill_sync_floor(self, since: str) -> Optional[tuple]:
         """
-        주기적으로 작업 실행 (private)
+        증분 동기화 기준점 (이 키 이하의 주문은 다시 받을 필요 없음, private)
+
+        Returns:
+            Optional[tuple]: (주문일, 주문번호) 키, 원장이 비어 있으면 None (전체 조회)
+        """
+        latest = self.fill_ledger_repo.find_latest(since)
+        if latest is None:
+            return None
+        # 부분 체결 주문은 추가 체결될 수 있으므로 다시 받음
+        keys = [latest.sort_key()] + [fill.sort_key() for fill in self.fill_ledger_repo.find_open(since)]
+        # 지난 동기화 때 미체결이던 주문(수동/다른 프로세스 주문 포함)도 그 사이 체결되었을 수 있으므로 다시 받음
+        open_floor = key_store.read(key_store.FILL_SYNC_OPEN_FLOOR)
+        if open_floor and open_floor[0] >= since:
+            keys.append(tuple(open_floor))
+        return min(keys)
+
+    def _get_fill_rows(
+        self,
+        floor: Optional[tuple] = None,
+        pending_odnos: Iterable[str] = (),
+        include_open: bool = False
+    ) -> List[dict]:
+        """
+        당일 전 종목 체결 내역 조회 (연속 조회, floor에 닿으면 중단, private)
 
         Args:
-            task_func: 실행할 함수
-            fail_msg: 실패 메시지
+            floor: 증분 동기화 기준점 (None이면 전체 페이지 조회)
+            pending_odnos: 체결 대기 중인 주문번호 (당일 주문으로 간주하여 기준점에 포함)
+            include_open: 미체결 주문도 함께 조회 (False면 체결된 주문만)
 
         Returns:
-            작업 실행 결과 또는 False
+            List[dict]: 체결 내역 행 목록 (최신 주문 순, include_open이면 미체결 주문 포함)
         """
-        interval = 10
-        end_time = time.time() + 300
+        pending_numbers = [int(odno) for odno in pending_odnos if odno and odno.isdigit()]
+        end_point = "/uapi/overseas-stock/v1/trading/inquire-ccnl"
+        extra_param = {
+            "PDNO": "%",
+            "ORD_STRT_DT": util.get_previous_date(1),
+            "ORD_END_DT": util.get_previous_date(0),
+            "SLL_BUY_DVSN": "00",
+            "CCLD_NCCS_DVSN": "00" if include_open else "01",
+            "OVRS_EXCG_CD": "%",
+            "SORT_SQN": "DS",
+            "ORD_DT": "",
+            "ORD_GNO_BRNO": "",
+            "ODNO": "",
+            "CTX_AREA_NK200": "",
+            "CTX_AREA_FK200": "",
+        }
+        extra_header = {"tr_id": "TTTS3035R"}
 
-        while time.time() < end_time:
-            result = task_func()
-            if result:
-                return result
-            time.sleep(interval)
+        rows = []
+        for _ in range(self.FILL_HISTORY_MAX_PAGES):
+            response = self.data_source.get_request(end_point, extra_header, extra_param)
+            data = decode(response)
+            page = data.get('output') or []
+            rows.extend(page)
+
+            # 기준점 이하(이미 원장에 있는 주문)까지 내려왔으면 중단
+            if floor is not None and page:
+                stop_key = floor
+                if pending_numbers:
+                    stop_key = min(stop_key, (rows[0].get('ord_dt', ''), min(pending_numbers)))
+                if min(self._fill_row_key(row) for row in page) <= stop_key:
+                    break
+
+            # 다음 페이지가 있으면 연속 조회 키로 이어서 조회
+            if response.headers.get('tr_cont') not in ('M', 'F'):
+                break
+            extra_header = {"tr_id": "TTTS3035R", "tr_cont": "N"}
+            extra_param = dict(
+                extra_param,
+                CTX_AREA_NK200=data.get('ctx_area_nk200', ''),
+                CTX_AREA_FK200=data.get('ctx_area_fk200', ''),
+            )
+        return rows
+
+    @staticmethod
+    def _fill_row_key(row: dict) -> tuple:
+        """체결 내역 행의 (주문일, 주문번호) 키 (private)"""
+        odno = row.get('odno', '')
+        return row.get('ord_dt', ''), int(odno) if odno.isdigit() else 0
 
-        print(fail_msg)
-        return False
+    @staticmethod
+    def _to_fill(row: dict, synced_at: datetime) -> Fill:
+        """체결 내역 행을 체결 원장 레코드로 변환 (private)"""
+        return Fill(
+            ord_dt=row['ord_dt'],
+            odno=row['odno'],
+            symbol=row['pdno'],
+            is_buy=row.get('sll_buy_dvsn_cd') == '02',
+            order_qty=float(row.get('ft_ord_qty') or 0),
+            filled_qty=float(row.get('ft_ccld_qty') or 0),
+            filled_price=float(row.get('ft_ccld_unpr3') or 0),
+            filled_amount=float(row.get('ft_ccld_amt3') or 0),
+            unfilled_qty=float(row.get('nccs_qty') or 0),
+            order_time=row.get('ord_tmd', ''),
+            synced_at=synced_at
+        )
 
     def get_amount_data(self, symbol: str) -> Optional[BalanceResult]:
         """
@@ -425,20 +905,37 @@ class HantooExchangeRepositoryImpl(ExchangeRepository):
         if self.test_mode:
             return None
 
+        trading_exd = self.data_source.get_hantoo_exd(symbol).trading_exd
+        return self.account_cache.get(
+            HantooAccountSnapshotCache.BALANCES,
+            lambda: self._fetch_amount_data(trading_exd),
+            key=trading_exd
+        )
+
+    def _fetch_amount_data(self, trading_exd: str) -> BalanceResult:
+        """
+        잔고 API 조회 (private, 캐시 미사용)
+
+        Args:
+            trading_exd: 거래소 코드 (NASD, AMEX 등)
+
+        Returns:
+            BalanceResult: 잔고 데이터
+        """
         end_point = "/uapi/overseas-stock/v1/trading/inquire-balance"
         extra_header = {"tr_id": "TTTS3012R"}
         extra_param = {
-            "OVRS_EXCG_CD": self.data_source.get_hantoo_exd(symbol).trading_exd,
+            "OVRS_EXCG_CD": trading_exd,
             "TR_CRCY_CD": "USD",
             "CTX_AREA_NK200": "",
             "CTX_AREA_FK200": "",
         }
 
-        data = json.loads(self.data_source.get_request(end_point, extra_header, extra_param).text)
+        data = decode(self.data_source.get_request(end_point, extra_header, extra_param))
 
         # 데이터 클래스로 변환하여 반환
-        output1_objects = [Balance1(**item) for item in data['output1']]
-        output2_object = Balance2(**data['output2'])
+        output1_objects = build_rows(Balance1, data['output1'])
+        output2_object = build(Balance2, data['output2'])
 
         return BalanceResult(
             ctx_area_fk200=data['ctx_area_fk200'],
@@ -511,6 +1008,23 @@ class HantooExchangeRepositoryImpl(ExchangeRepository):
         if self.test_mode:
             return 7720.25
 
+        return self.account_cache.get(
+            HantooAccountSnapshotCache.CASH,
+            lambda: self._fetch_orderable_cash(symbol, price),
+            key=HantooAccountSnapshotCache.cash_key(symbol, price)
+        )
+
+    def _fetch_orderable_cash(self, symbol: str, price: float) -> float:
+        """
+        주문 가능 금액 API 조회 (private, 캐시 미사용)
+
+        Args:
+            symbol: 종목 심볼
+            price: 가격
+
+        Returns:
+            float: 주문 가능 금액
+        """
         end_point = "/uapi/overseas-stock/v1/trading/inquire-psamount"
         extra_header = {"tr_id": "TTTS3007R"}
         extra_param = {
@@ -519,8 +1033,8 @@ class HantooExchangeRepositoryImpl(ExchangeRepository):
             "ITEM_CD": symbol
         }
 
-        data = json.loads(self.data_source.get_request(end_point, extra_header, extra_param).text)
-        result = AvailableAmount(**data['output'])
+        data = decode(self.data_source.get_request(end_point, extra_header, extra_param))
+        result = build(AvailableAmount, data['output'])
         return float(result.ovrs_ord_psbl_amt)
 
     def get_amount_ticker_balance(self, ticker_list: List[str] = None) -> List[TickerItem]:
@@ -540,6 +1054,28 @@ class HantooExchangeRepositoryImpl(ExchangeRepository):
         if self.test_mode:
             return []
 
+        data = self.account_cache.get(HantooAccountSnapshotCache.SETTLEMENT, self._fetch_settlement_balance)
+
+        # ticker_list에 포함된 pdno 행만 모델로 변환 (스냅샷은 요청마다 종목이 다르므로 원본 행으로 보관)
+        tickers = set(ticker_list)
+        rows = build_rows(BalanceForTickerOutput1, data['output1'], where=lambda row: row.get('pdno') in tickers)
+        return [
+            TickerItem(
+                ticker=ticker.pdno,
+                amount=float(ticker.ord_psbl_qty1),
+                price=float(ticker.ovrs_now_pric1),
+                total_price=round(float(ticker.ord_psbl_qty1) * float(ticker.ovrs_now_pric1), 3)
+            )
+            for ticker in rows
+        ]
+
+    def _fetch_settlement_balance(self) -> dict:
+        """
+        결제기준 잔고 API 조회 (private, 캐시 미사용)
+
+        Returns:
+            dict: 결제기준 잔고 응답 (output1 행은 get_amount_ticker_balance에서 필요한 종목만 변환)
+        """
         end_point = "/uapi/overseas-stock/v1/trading/inquire-paymt-stdr-balance"
         extra_header = {
             "tr_id": "CTRP6010R",
@@ -552,27 +1088,4 @@ class HantooExchangeRepositoryImpl(ExchangeRepository):
             "INQR_DVSN_CD": "00"
         }
 
-        data = json.loads(self.data_source.get_request(end_point, extra_header, extra_param).text)
-
-        # BalanceForTickers 형태로 데이터 파싱
-        result = BalanceForTickers(
-            output1=[BalanceForTickerOutput1(**item) for item in data['output1']],
-            output2=[BalanceForTickerOutput2(**item) for item in data['output2']],
-            output3=BalanceForTickerOutput3(**data['output3']),
-            rt_cd=data['rt_cd'],
-            msg_cd=data['msg_cd'],
-            msg1=data['msg1']
-        )
-
-        # ticker_list에 포함된 pdno만 필터링하여 변환
-        filtered_result = [
-            TickerItem(
-                ticker=ticker.pdno,
-                amount=float(ticker.ord_psbl_qty1),
-                price=float(ticker.ovrs_now_pric1),
-                total_price=round(float(ticker.ord_psbl_qty1) * float(ticker.ovrs_now_pric1), 3)
-            )
-            for ticker in result.output1 if ticker.pdno in ticker_list
-        ]
-
-        return filtered_result
+        return decode(self.data_source.get_request(end_point, extra_header, extra_param))
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""주문 체결 일괄 확인 서비스"""
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+
+class _PendingOrder:
+    """체결 확인 대기 중인 주문"""
+
+    __slots__ = ("odno", "symbol", "future", "submitted_at", "deadline", "step", "next_check", "last_fill")
+
+    def __init__(self, odno: str, symbol: Optional[str], submitted_at: float, deadline: float):
+        self.odno = odno
+        self.symbol = symbol
+        self.future: Future = Future()
+        self.submitted_at = submitted_at
+        self.deadline = deadline
+        self.step = 0
+        self.next_check = submitted_at
+        # 마지막으로 확인한 부분 체결 (제한 시간 초과 시 결과로 사용)
+        self.last_fill: Any = None
+
+
+class _FillTimeStats:
+    """종목별 체결 확인 소요 시간 통계"""
+
+    __slots__ = ("count", "total", "max", "last")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def record(self, elapsed: float) -> None:
+        self.count += 1
+        self.total += elapsed
+        self.last = elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "avg_sec": round(self.total / self.count, 3) if self.count else 0.0,
+            "max_sec": round(self.max, 3),
+            "last_sec": round(self.last, 3),
+        }
+
+
+class HantooFillTracker:
+    """
+    미체결 주문 체결 확인 (전 종목 체결 내역 1회 조회로 일괄 확인)
+
+    - track()은 즉시 Future를 반환하고, 백그라운드 폴러가 체결을 확인하면 결과를 채움
+    - 여러 봇의 주문이 동시에 대기해도 주기마다 체결 조회는 대기 주문번호 전체로 1회만 수행
+    - 주문별 확인 간격은 schedule을 따라 점점 늘어나며(예: 0.5 → 1 → 2 → ...) max_interval에서 멈춤
+    - 종목별 체결 확인 소요 시간 통계를 기록
+    - 대기 주문이 없으면 폴러 스레드는 종료되고, 새 주문이 들어오면 다시 시작
+    - 부분 체결이면 전량 체결(fill.is_complete())될 때까지 계속 확인
+    - 제한 시간 내 전량 체결되지 않으면 마지막으로 확인한 부분 체결로, 체결 내역이 없으면 None으로 완료
+    """
+
+    def __init__(
+        self,
+        fetch_fills: Callable[[List[str]], Mapping[str, Any]],
+        schedule: Sequence[float] = (0.5, 1.0, 2.0),
+        max_interval: float = 10.0,
+        timeout: float = 300.0
+    ):
+        """
+        Args:
+            fetch_fills: 대기 주문번호 목록 → {주문번호: 체결(Fill)} 조회 함수 (체결된 주문만 포함)
+            schedule: 주문 후 확인 간격 목록 (초). 소진 후에는 마지막 간격을 2배씩 늘림
+            max_interval: 확인 간격 상한 (초)
+            timeout: 주문별 최대 대기 시간 (초)
+        """
+        if not schedule or any(delay <= 0 for delay in schedule):
+            raise ValueError("schedule은 0보다 큰 간격을 1개 이상 포함해야 합니다.")
+        self._fetch_fills = fetch_fills
+        self.schedule = tuple(schedule)
+        self.max_interval = max_interval
+        self.timeout = timeout
+        self._cond = threading.Condition()
+        self._pending: Dict[str, _PendingOrder] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stats: Dict[str, _FillTimeStats] = {}
+
+    def track(self, odno: str, symbol: Optional[str] = None) -> Future:
+        """
+        주문번호 체결 확인 등록
+
+        Args:
+            odno: 주문번호
+            symbol: 종목 심볼 (체결 소요 시간 통계용)
+
+        Returns:
+            Future: 전량 체결 시 fetch_fills가 반환한 체결,
+                제한 시간 초과 시 마지막 부분 체결(체결 내역이 없었으면 None)로 완료
+        """
+        with self._cond:
+            pending = self._pending.get(odno)
+            if pending is None:
+                now = time.monotonic()
+                pending = _PendingOrder(odno, symbol, now, now + self.timeout)
+                pending.next_check = now + self._delay(0)
+                self._pending[odno] = pending
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="hantoo-fill-tracker", daemon=True
+                )
+                self._thread.start()
+            else:
+                self._cond.notify_all()
+            return pending.future
+
+    def pending_count(self) -> int:
+        """체결 확인 대기 중인 주문 수"""
+        with self._cond:
+            return len(self._pending)
+
+    def fill_time_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        종목별 체결 확인 소요 시간 통계 조회 (주문 전송 → 체결 확인)
+
+        Returns:
+            Dict: 종목 → {"count", "avg_sec", "max_sec", "last_sec"}
+        """
+        with self._cond:
+            return {symbol: stats.to_dict() for symbol, stats in self._stats.items()}
+
+    # ===== Private Methods =====
+
+    def _delay(self, step: int) -> float:
+        """step번째 확인 간격 (schedule 소진 후 마지막 간격을 2배씩, 상한 max_interval)"""
+        if step < len(self.schedule):
+            delay = self.schedule[step]
+        else:
+            delay = self.schedule[-1] * (2 ** (step - len(self.schedule) + 1))
+        return min(delay, self.max_interval)
+
+    def _run(self) -> None:
+        """대기 주문이 남아있는 동안 가장 이른 확인 시점마다 체결 내역 조회"""
+        while True:
+            with self._cond:
+                while True:
+                    if not self._pending:
+                        self._thread = None
+                        return
+                    wait = min(p.next_check for p in self._pending.values()) - time.monotonic()
+                    if wait <= 0:
+                        break
+                    # 새 주문이 들어오면 깨어나 확인 시점 재계산
+                    self._cond.wait(wait)
+
+            self._poll_once()
+
+    def _poll_once(self) -> None:
+        """체결 내역 1회 조회 후 대기 주문 일괄 확인"""
+        with self._cond:
+            odnos = list(self._pending)
+
+        try:
+            print("거래내역을 조회중입니다.")
+            fills = self._fetch_fills(odnos)
+        except Exception as e:
+            logging.error(f"체결 내역 조회 실패: {e}")
+            fills = {}
+
+        resolved = []
+        now = time.monotonic()
+        with self._cond:
+            for odno, fill in fills.items():
+                pending = self._pending.get(odno)
+                if pending is None:
+                    continue
+                if not fill.is_complete():
+                    # 부분 체결: 나머지가 체결될 때까지 계속 확인
+                    pending.last_fill = fill
+                    continue
+                self._pending.pop(odno)
+                resolved.append((pending, fill))
+                if pending.symbol:
+                    self._stats.setdefault(pending.symbol, _FillTimeStats()).record(now - pending.submitted_at)
+            for odno, pending in list(self._pending.items()):
+                if pending.deadline <= now:
+                    self._pending.pop(odno)
+                    if pending.last_fill is not None:
+                        print(f"{odno} 제한 시간 내 전량 체결되지 않아 부분 체결로 확정합니다")
+                    else:
+                        print(f"{odno} 거래 내역이 찾을 수 없습니다")
+                    resolved.append((pending, pending.last_fill))
+                elif pending.next_check <= now:
+                    # 확인 시점이 지난 주문만 다음 간격으로 진행
+                    pending.step += 1
+                    pending.next_check = now + self._delay(pending.step)
+
+        for pending, fill in resolved:
+            if fill is not None:
+                print("거래내역을 찾았습니다")
+            pending.future.set_result(fill)
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""주문 의도(client order key) 기록 - 응답 유실 시 중복 주문 방지"""
+import threading
+from datetime import datetime, timedelta
+from typing import Optional, Set
+
+import pytz
+
+from config import key_store
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+# 한투 주문 내역의 국내 주문 시각(dmst_ord_dt + thco_ord_tmd)과 비교하는 형식 (KST)
+PLACED_AT_FORMAT = "%Y%m%d%H%M%S"
+KST = pytz.timezone("Asia/Seoul")
+
+
+class HantooOrderIntentStore:
+    """
+    주문 전송 전에 client key별 주문 의도를 key_store에 기록하는 저장소
+
+    - client key마다 key_store 행 1개 (NS_ORDER_INTENTS, 보관 기간 TTL)로 저장하므로
+      웹/스케줄러 프로세스가 서로의 기록을 덮어쓰지 않음
+    - 조회는 항상 key_store에서 다시 읽음 (다른 프로세스의 기록 반영)
+    - 주문 전송 전 record() → 접수 확인 시 complete()로 주문번호 연결
+    - 주문번호 없이 남은 의도는 '접수 여부 불명'이므로 재전송 전에 주문 내역과 대조해야 함
+    - 접수 거부가 확실하면 discard()로 삭제 (같은 key로 다시 주문 가능)
+    - retention_days가 지난 기록은 TTL로 만료
+    """
+
+    def __init__(self, retention_days: float = 2.0):
+        """
+        Args:
+            retention_days: 기록 보관 기간 (일)
+        """
+        self.retention = timedelta(days=retention_days)
+        # client_key -> {"symbol", "side", "qty", "price", "odno", "created_at", "placed_at"}
+        self._intents = key_store.namespace(key_store.NS_ORDER_INTENTS)
+        self._migrate_lock = threading.Lock()
+        self._migrated = False
+
+    def get(self, client_key: str) -> Optional[dict]:
+        """
+        주문 의도 조회
+
+        Args:
+            client_key: 클라이언트 주문 키
+
+        Returns:
+            dict: 기록된 주문 의도 (없으면 None)
+        """
+        self._migrate_legacy()
+        intent = self._intents.get(client_key)
+        return dict(intent) if intent else None
+
+    def record(self, client_key: str, symbol: str, side: str, qty: int, price: float) -> None:
+        """
+        주문 전송 직전 의도 기록 (주문번호 미정)
+
+        Args:
+            client_key: 클라이언트 주문 키
+            symbol: 종목 심볼
+            side: "buy" 또는 "sell"
+            qty: 주문 수량
+            price: 주문 가격
+        """
+        self._migrate_legacy()
+        intent = {
+            "symbol": symbol,
+            "side": side,
+            "qty": int(qty),
+            "price": float(price),
+            "odno": None,
+            "created_at": datetime.now().strftime(DATE_FORMAT),
+            "placed_at": datetime.now(KST).strftime(PLACED_AT_FORMAT),
+        }
+        self._intents.set(client_key, intent, ttl=self._ttl(intent))
+
+    def complete(self, client_key: str, odno: str) -> None:
+        """접수 확인된 주문번호 연결"""
+        intent = self.get(client_key)
+        if intent is not None:
+            intent["odno"] = odno
+            self._intents.set(client_key, intent, ttl=self._ttl(intent))
+
+    def discard(self, client_key: str) -> None:
+        """접수되지 않은 것이 확실한 의도 삭제"""
+        self._migrate_legacy()
+        self._intents.delete(client_key)
+
+    def claimed_odnos(self) -> Set[str]:
+        """이미 다른 주문 의도에 연결된 주문번호 목록 (대조 시 제외용, 다른 프로세스 기록 포함)"""
+        self._migrate_legacy()
+        return {intent["odno"] for intent in self._intents.items().values() if intent.get("odno")}
+
+    # ===== Private Methods =====
+
+    def _ttl(self, intent: dict) -> float:
+        """기록 시각 기준 남은 보관 시간 (초)"""
+        try:
+            created_at = datetime.strptime(intent["created_at"], DATE_FORMAT)
+        except (KeyError, TypeError, ValueError):
+            return self.retention.total_seconds()
+        return max((created_at + self.retention - datetime.now()).total_seconds(), 1.0)
+
+    def _migrate_legacy(self) -> None:
+        """이전 형식(ORDER_INTENTS 단일 값) 기록을 client key별 행으로 옮김 (프로세스당 최초 1회)"""
+        if self._migrated:
+            return
+        with self._migrate_lock:
+            if self._migrated:
+                return
+            legacy = key_store.read(key_store.ORDER_INTENTS)
+            if legacy:
+                for client_key, intent in legacy.items():
+                    if self._intents.get(client_key) is None:
+                        self._intents.set(client_key, intent, ttl=self._ttl(intent))
+                key_store.delete(key_store.ORDER_INTENTS)
+            self._migrated = True
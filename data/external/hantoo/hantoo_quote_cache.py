@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""종목별 시세 스냅샷 단기 캐시"""
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional, Tuple
+
+from domain.value_objects.quote_snapshot import QuoteSnapshot
+
+
+class HantooQuoteCache:
+    """
+    종목별 시세 스냅샷 단기(TTL) 캐시
+
+    - 같은 종목을 쓰는 여러 봇/웹 요청이 TTL 이내면 한 번 조회한 시세를 공유
+    - 같은 종목을 동시에 조회하면 진행 중인 1회 호출 결과를 함께 기다림 (request coalescing)
+    - 자체 체결 직후에는 invalidate()로 즉시 무효화 (종목별 세대를 올려 무효화 전에 시작된 조회 결과는 버림)
+    """
+
+    def __init__(self, ttl: float):
+        """
+        Args:
+            ttl: 기본 캐시 유효 시간 (초)
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # symbol -> (조회 완료 시각(monotonic), 스냅샷)
+        self._entries: Dict[str, Tuple[float, QuoteSnapshot]] = {}
+        # symbol -> 진행 중인 조회
+        self._in_flight: Dict[str, Future] = {}
+        # symbol -> 무효화 세대 (invalidate마다 증가)
+        self._generations: Dict[str, int] = {}
+
+    def get(
+        self,
+        symbol: str,
+        fetch: Callable[[], Optional[QuoteSnapshot]],
+        max_age: Optional[float] = None
+    ) -> Optional[QuoteSnapshot]:
+        """
+        캐시된 시세 조회 (만료 시 fetch 호출, 동시 요청은 1회로 합침)
+
+        Args:
+            symbol: 종목 심볼
+            fetch: 실제 시세 조회 함수
+            max_age: 허용 캐시 나이 (초, None이면 기본 TTL)
+
+        Returns:
+            QuoteSnapshot: 시세 스냅샷, 조회 실패 시 None
+        """
+        max_age = self.ttl if max_age is None else max_age
+
+        with self._lock:
+            entry = self._entries.get(symbol)
+            if entry and time.monotonic() - entry[0] < max_age:
+                return entry[1]
+
+            future = self._in_flight.get(symbol)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._in_flight[symbol] = future
+            generation = self._generations.get(symbol, 0)
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            quote = fetch()
+        except BaseException as e:
+            with self._lock:
+                if self._in_flight.get(symbol) is future:
+                    self._in_flight.pop(symbol)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            # 조회 중 무효화되었으면 체결 전 시세일 수 있으므로 캐시에 넣지 않음
+            if quote is not None and self._generations.get(symbol, 0) == generation:
+                self._entries[symbol] = (time.monotonic(), quote)
+            if self._in_flight.get(symbol) is future:
+                self._in_flight.pop(symbol)
+        future.set_result(quote)
+        return quote
+
+    def peek(self, symbol: str) -> Optional[QuoteSnapshot]:
+        """
+        나이와 관계없이 마지막으로 캐시된 시세 조회 (장애 시 fallback용)
+
+        Args:
+            symbol: 종목 심볼
+
+        Returns:
+            QuoteSnapshot: 마지막 시세, 없으면 None
+        """
+        with self._lock:
+            entry = self._entries.get(symbol)
+        return entry[1] if entry else None
+
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """
+        캐시 무효화
+
+        Args:
+            symbol: 무효화할 종목 (None이면 전체)
+        """
+        with self._lock:
+            symbols = set(self._entries) | set(self._in_flight) if symbol is None else {symbol}
+            for target in symbols:
+                self._generations[target] = self._generations.get(target, 0) + 1
+                # 진행 중인 조회는 무효화 전 결과이므로 이후 요청은 새로 조회
+                self._in_flight.pop(target, None)
+                entry = self._entries.get(target)
+                if entry:
+                    # 스냅샷은 peek() fallback용으로 남기고 만료 처리만 함
+                    self._entries[target] = (float('-inf'), entry[1])
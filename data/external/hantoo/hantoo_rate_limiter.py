@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""한국투자증권 API 호출 속도 제한 (토큰 버킷 + 우선순위 레인)"""
+import heapq
+import itertools
+import logging
+import threading
+import time
+from enum import IntEnum
+from typing import Dict
+
+
+class HantooApiPriority(IntEnum):
+    """API 호출 우선순위 레인 (값이 작을수록 먼저 처리)"""
+    ORDER = 0     # 주문 전송
+    FILL = 1      # 체결 확인
+    QUOTE = 2     # 시세 조회
+    ACCOUNT = 3   # 잔고/리포트 조회
+
+
+class _LaneStats:
+    """레인별 대기 시간 누적 통계"""
+
+    __slots__ = ("count", "total_wait", "max_wait")
+
+    def __init__(self):
+        self.count = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float) -> None:
+        self.count += 1
+        self.total_wait += wait
+        if wait > self.max_wait:
+            self.max_wait = wait
+
+    def to_dict(self) -> Dict[str, float]:
+        avg = self.total_wait / self.count if self.count else 0.0
+        return {
+            "count": self.count,
+            "avg_wait_ms": round(avg * 1000, 2),
+            "max_wait_ms": round(self.max_wait * 1000, 2),
+            "total_wait_ms": round(self.total_wait * 1000, 2),
+        }
+
+
+class HantooRateLimiter:
+    """
+    프로세스 전역 토큰 버킷 속도 제한기
+
+    - 초당 rate개의 토큰이 채워지고 최대 burst개까지 쌓임
+    - 토큰이 부족하면 대기열에 들어가며, 우선순위가 높은(값이 작은) 레인부터 토큰을 받음
+    - 같은 레인 안에서는 먼저 들어온 요청이 먼저 처리 (FIFO)
+    - 레인별 대기 시간 통계를 남겨 TWAP 구간 설계 시 실제 한도 대비 여유를 확인
+    """
+
+    # 이 시간 이상 대기하면 경고 로그
+    SLOW_WAIT_WARN = 1.0
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Args:
+            rate: 초당 허용 요청 수
+            burst: 순간 최대 허용 요청 수 (버킷 크기)
+        """
+        if rate <= 0 or burst <= 0:
+            raise ValueError("rate와 burst는 0보다 커야 합니다.")
+        self.rate = rate
+        self.burst = burst
+        self._cond = threading.Condition()
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        # (우선순위, 순번) 대기열
+        self._waiters = []
+        self._seq = itertools.count()
+        self._stats: Dict[HantooApiPriority, _LaneStats] = {p: _LaneStats() for p in HantooApiPriority}
+
+    def acquire(self, priority: HantooApiPriority = HantooApiPriority.ACCOUNT) -> float:
+        """
+        요청 1건 전송 권한 획득 (필요 시 대기)
+
+        Args:
+            priority: 우선순위 레인
+
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        start = time.monotonic()
+        ticket = (int(priority), next(self._seq))
+
+        with self._cond:
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    timeout = None
+                    if self._waiters[0] == ticket:
+                        self._refill()
+                        if self._tokens >= 1:
+                            self._tokens -= 1
+                            heapq.heappop(self._waiters)
+                            break
+                        # 다음 토큰이 채워질 때까지 대기
+                        timeout = (1 - self._tokens) / self.rate
+                    self._cond.wait(timeout)
+            except BaseException:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                raise
+            finally:
+                # 다음 순서 대기자에게 알림
+                self._cond.notify_all()
+
+            wait = time.monotonic() - start
+            self._stats[HantooApiPriority(priority)].record(wait)
+
+        if wait >= self.SLOW_WAIT_WARN:
+            logging.warning(f"API 호출 대기 지연 ({HantooApiPriority(priority).name}): {wait:.2f}초")
+        return wait
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        레인별 대기 시간 통계 조회
+
+        Returns:
+            Dict: {"ORDER": {"count": .., "avg_wait_ms": .., "max_wait_ms": .., "total_wait_ms": ..}, ...}
+        """
+        with self._cond:
+            return {p.name: self._stats[p].to_dict() for p in HantooApiPriority}
+
+    def reset_stats(self) -> None:
+        """대기 시간 통계 초기화"""
+        with self._cond:
+            self._stats = {p: _LaneStats() for p in HantooApiPriority}
+
+    # ===== Private Methods =====
+
+    def _refill(self) -> None:
+        """경과 시간만큼 토큰 충전 (lock 보유 상태에서 호출)"""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""한국투자증권 액세스 토큰 인메모리 보관소"""
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Optional, Tuple
+
+from config import key_store
+
+TOKEN_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class HantooTokenHolder:
+    """
+    액세스 토큰 인메모리 보관 + 단일 갱신(single-flight)
+
+    - 요청 경로의 토큰 조회는 메모리만 읽음 (파일 I/O 없음)
+    - 여러 스레드가 동시에 만료를 발견해도 발급 요청은 1회만 수행하고 나머지는 결과를 기다림
+    - 만료 버퍼(1시간) 진입 전에 백그라운드에서 선제 갱신
+    - key_store에는 토큰이 실제로 바뀐 경우에만 기록
+    """
+
+    # 만료 1시간 전부터는 만료된 토큰으로 간주 (egg 프로젝트 방식)
+    EXPIRY_BUFFER = timedelta(hours=1)
+    # 만료 버퍼 진입 10분 전에 백그라운드 선제 갱신
+    RENEW_AHEAD = timedelta(minutes=10)
+
+    def __init__(self, issue_func: Callable[[], Optional[Tuple[str, str]]]):
+        """
+        Args:
+            issue_func: 새 토큰 발급 함수 → (access_token, 만료일 문자열), 실패 시 None
+        """
+        self._issue_func = issue_func
+        self._cond = threading.Condition()
+        self._token: Optional[str] = None
+        self._valid_until: Optional[datetime] = None
+        self._refreshing = False
+        self._loaded = False
+        self._renew_timer: Optional[threading.Timer] = None
+
+    def get_token(self) -> Optional[str]:
+        """
+        유효한 토큰 조회 (만료 시 단일 갱신)
+
+        Returns:
+            str: 유효한 토큰, 발급 실패 시 None
+        """
+        if not self._loaded:
+            self._load_from_store()
+
+        token = self._token
+        valid_until = self._valid_until
+        if token and valid_until and datetime.now() < valid_until:
+            return token
+
+        logging.info("토큰이 없거나 만료 1시간 전입니다. 새로운 토큰을 발급합니다.")
+        return self.refresh(stale_token=token)
+
+    def ensure_valid_for(self, min_remaining: timedelta) -> Optional[str]:
+        """
+        남은 유효 시간이 min_remaining보다 짧으면 미리 갱신 (거래 시간대 중 갱신 방지)
+
+        Args:
+            min_remaining: 최소 남은 유효 시간 (만료 버퍼 제외)
+
+        Returns:
+            str: 유효한 토큰, 발급 실패 시 None
+        """
+        token = self.get_token()
+        valid_until = self._valid_until
+        if token and valid_until and valid_until - datetime.now() >= min_remaining:
+            return token
+
+        logging.info(f"토큰 남은 유효 시간이 {min_remaining}보다 짧아 미리 갱신합니다.")
+        return self.refresh(stale_token=token)
+
+    def refresh(self, stale_token: Optional[str] = None) -> Optional[str]:
+        """
+        토큰 갱신 (동시 호출 시 1회만 발급)
+
+        Args:
+            stale_token: 호출자가 만료됐다고 판단한 토큰.
+                         이미 다른 스레드가 다른 토큰으로 갱신했다면 발급 없이 그 토큰을 반환
+
+        Returns:
+            str: 갱신된 토큰, 발급 실패 시 None
+        """
+        with self._cond:
+            if self._refreshing:
+                # 진행 중인 갱신 결과를 기다림
+                while self._refreshing:
+                    self._cond.wait()
+                return self._token
+
+            if self._token and self._token != stale_token and self._is_valid():
+                return self._token
+
+            self._refreshing = True
+
+        issued = None
+        try:
+            issued = self._issue_func()
+        finally:
+            with self._cond:
+                if issued:
+                    self._set_token(*issued)
+                self._refreshing = False
+                self._cond.notify_all()
+
+        return self._token if issued else None
+
+    def shutdown(self) -> None:
+        """백그라운드 갱신 타이머 중지"""
+        with self._cond:
+            if self._renew_timer is not None:
+                self._renew_timer.cancel()
+                self._renew_timer = None
+
+    # ===== Private Methods =====
+
+    def _is_valid(self) -> bool:
+        return self._valid_until is not None and datetime.now() < self._valid_until
+
+    def _load_from_store(self) -> None:
+        """최초 1회 key_store에서 토큰 로드"""
+        with self._cond:
+            if self._loaded:
+                return
+            token = key_store.read(key_store.AT_KEY)
+            expiration = key_store.read(key_store.AT_EX_DATE)
+            if token and expiration:
+                try:
+                    self._apply(token, datetime.strptime(expiration, TOKEN_DATE_FORMAT))
+                except ValueError as e:
+                    logging.error(f"유효하지 않은 만료일 형식입니다: {e}")
+            self._loaded = True
+
+    def _set_token(self, token: str, expiration: str) -> None:
+        """새로 발급된 토큰 반영 (lock 보유 상태에서 호출)"""
+        try:
+            expiration_datetime = datetime.strptime(expiration, TOKEN_DATE_FORMAT)
+        except (TypeError, ValueError) as e:
+            logging.error(f"유효하지 않은 만료일 형식입니다: {e}")
+            return
+
+        if token != self._token:
+            key_store.write(key_store.AT_KEY, token)
+            key_store.write(key_store.AT_EX_DATE, expiration)
+        self._apply(token, expiration_datetime)
+
+    def _apply(self, token: str, expiration: datetime) -> None:
+        """메모리 상태 갱신 + 선제 갱신 타이머 재설정 (lock 보유 상태에서 호출)"""
+        self._token = token
+        self._valid_until = expiration - self.EXPIRY_BUFFER
+
+        if self._renew_timer is not None:
+            self._renew_timer.cancel()
+            self._renew_timer = None
+
+        # 이미 선제 갱신 시점이 지난 토큰이면 요청 경로에서 만료 시 갱신 (같은 토큰 재발급 반복 방지)
+        delay = (self._valid_until - self.RENEW_AHEAD - datetime.now()).total_seconds()
+        if delay <= 0:
+            return
+        self._renew_timer = threading.Timer(delay, self._renew_in_background, args=(token,))
+        self._renew_timer.daemon = True
+        self._renew_timer.start()
+
+    def _renew_in_background(self, token: str) -> None:
+        """만료 버퍼 진입 전 선제 갱신"""
+        try:
+            logging.info("토큰 만료가 가까워 백그라운드에서 선제 갱신합니다.")
+            self.refresh(stale_token=token)
+        except Exception as e:
+            logging.error(f"토큰 선제 갱신 실패: {e}")
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+"""Market Bar Store - 티커별 일봉 데이터 컬럼 저장소 (numpy .npy)"""
+import json
+import logging
+import os
+import shutil
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Sequence, Set
+
+import numpy as np
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows 등 fcntl이 없는 환경에서는 프로세스 간 잠금 생략
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# 저장 형식이 바뀌면 올림 (버전이 다른 저장소는 없는 것으로 보고 다시 다운로드)
+SCHEMA_VERSION = 1
+META_FILE = "meta.json"
+INDEX_NAME = "_index"
+
+
+class MarketBarStore:
+    """
+    티커별 일봉 데이터를 컬럼 단위 .npy 파일로 저장하는 저장소
+
+    - {root_dir}/{ticker}/ 아래에 날짜 인덱스(_index.<세대>.npy), 컬럼별 <컬럼>.<세대>.npy, meta.json 저장
+    - 읽기 시 CSV 텍스트 파싱 없이 .npy 헤더 뒤 오프셋으로 이동해 필요한 컬럼의 마지막 N행만 읽음
+    - 쓰기는 새 세대 파일을 모두 기록한 뒤 meta.json을 임시 파일 + rename으로 교체하므로
+      읽는 쪽은 항상 한 세대의 완성된 파일만 보게 됨 (직전 세대 파일은 다음 쓰기까지 유지)
+    - lock()으로 프로세스 간(웹/스케줄러) 티커별 갱신 작업을 직렬화
+    """
+
+    def __init__(self, root_dir: str):
+        """
+        Args:
+            root_dir: 저장소 최상위 디렉토리
+        """
+        self.root_dir = root_dir
+
+    def exists(self, ticker: str) -> bool:
+        """저장된 데이터 존재 여부 (현재 스키마 버전만 인정)"""
+        return self._read_meta(ticker) is not None
+
+    def read(
+        self,
+        ticker: str,
+        columns: Optional[Sequence[str]] = None,
+        tail: Optional[int] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        저장된 데이터 조회
+
+        Args:
+            ticker: 종목 심볼
+            columns: 읽을 컬럼 목록 (None이면 전체)
+            tail: 마지막 N행만 읽기 (None이면 전체)
+
+        Returns:
+            DataFrame: 날짜 인덱스 데이터, 없거나 손상/요청 컬럼 누락 시 None
+        """
+        meta = self._read_meta(ticker)
+        if meta is None:
+            return None
+
+        files = {column["name"]: column["file"] for column in meta["columns"]}
+        index_file = meta.get("index_file", f"{INDEX_NAME}.npy")
+        names = list(files) if columns is None else list(columns)
+        missing = [name for name in names if name not in files]
+        if missing:
+            logger.warning(f"⚠️ [{ticker}] 저장소에 없는 컬럼: {missing}")
+            return None
+
+        rows = meta["rows"]
+        start = max(rows - tail, 0) if tail is not None else 0
+        try:
+            index = self._load_slice(ticker, index_file, rows, start)
+            data = {name: self._load_slice(ticker, files[name], rows, start) for name in names}
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ [{ticker}] 저장소 읽기 실패: {e}")
+            return None
+
+        date_index = pd.DatetimeIndex(index, name=meta.get("index_name"))
+        if meta.get("index_tz"):
+            date_index = date_index.tz_localize("UTC").tz_convert(meta["index_tz"])
+        return pd.DataFrame(data, index=date_index, copy=False)
+
+    def write(self, ticker: str, df: pd.DataFrame) -> None:
+        """
+        데이터 전체 저장 (기존 데이터 교체, lock(ticker) 보유 상태에서 호출)
+
+        Args:
+            ticker: 종목 심볼
+            df: 날짜 인덱스 DataFrame (숫자 컬럼만)
+        """
+        ticker_dir = self._ticker_dir(ticker)
+        os.makedirs(ticker_dir, exist_ok=True)
+        previous_files = self._meta_files(self._load_meta_file(ticker))
+        generation = datetime.now().strftime("%Y%m%d%H%M%S%f")
+
+        index = pd.DatetimeIndex(df.index)
+        index_tz = str(index.tz) if index.tz is not None else None
+        if index_tz:
+            index = index.tz_convert("UTC").tz_localize(None)
+
+        columns: List[Dict[str, str]] = []
+        index_file = self._column_file(INDEX_NAME, generation)
+        self._save_array(ticker_dir, index_file, index.to_numpy(dtype="datetime64[ns]"))
+        for position, name in enumerate(df.columns):
+            values = df.iloc[:, position].to_numpy()
+            if values.dtype == object:
+                values = values.astype(float)
+            file_name = self._column_file(str(name), generation)
+            self._save_array(ticker_dir, file_name, values)
+            columns.append({"name": str(name), "file": file_name, "dtype": str(values.dtype)})
+
+        # 새 세대 파일을 모두 쓴 뒤 meta.json 교체로 한 번에 전환
+        meta = {
+            "schema_version": SCHEMA_VERSION,
+            "rows": len(df),
+            "index_name": df.index.name,
+            "index_tz": index_tz,
+            "index_file": index_file,
+            "columns": columns,
+            "updated_at": datetime.now().isoformat(),
+        }
+        meta_path = os.path.join(ticker_dir, META_FILE)
+        with open(meta_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(meta_path + ".tmp", meta_path)
+
+        # 읽는 중일 수 있는 직전 세대만 남기고 나머지 정리
+        self._remove_unused(ticker_dir, self._meta_files(meta) | previous_files)
+
+    def delete(self, ticker: str) -> None:
+        """저장된 데이터 삭제"""
+        shutil.rmtree(self._ticker_dir(ticker), ignore_errors=True)
+
+    @contextmanager
+    def lock(self, ticker: str) -> Iterator[None]:
+        """
+        티커별 프로세스 간 배타 잠금 ({root_dir}/{ticker}.lock, fcntl.flock)
+
+        같은 프로세스의 스레드 간 중복 실행은 호출하는 쪽에서 막아야 한다 (flock은 프로세스 단위가 아닌 파일 열기 단위).
+        """
+        if fcntl is None:
+            yield
+            return
+        os.makedirs(self.root_dir, exist_ok=True)
+        with open(os.path.join(self.root_dir, f"{ticker}.lock"), "a") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def convert_csv(self, ticker: str, csv_path: str) -> bool:
+        """
+        기존 CSV 캐시를 저장소로 변환 (성공 시 원본은 .csv.migrated로 이름 변경, lock(ticker) 보유 상태에서 호출)
+
+        Args:
+            ticker: 종목 심볼
+            csv_path: 기존 CSV 경로
+
+        Returns:
+            bool: 변환 성공 여부
+        """
+        try:
+            df = pd.read_csv(csv_path, index_col=0)
+            df.index = pd.to_datetime(df.index)
+            self.write(ticker, df)
+            os.replace(csv_path, csv_path + ".migrated")
+            logger.info(f"📦 [{ticker}] CSV → 컬럼 저장소 변환 완료 ({len(df)}행)")
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ [{ticker}] CSV 변환 실패: {e}")
+            return False
+
+    # ===== Private Methods =====
+
+    def _ticker_dir(self, ticker: str) -> str:
+        return os.path.join(self.root_dir, ticker)
+
+    def _load_meta_file(self, ticker: str) -> Optional[dict]:
+        """meta.json 로드 (스키마 버전 확인 없음, 없거나 손상 시 None)"""
+        meta_path = os.path.join(self._ticker_dir(ticker), META_FILE)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ [{ticker}] meta.json 읽기 실패: {e}")
+            return None
+
+    def _read_meta(self, ticker: str) -> Optional[dict]:
+        meta = self._load_meta_file(ticker)
+        if meta is None:
+            return None
+        if meta.get("schema_version") != SCHEMA_VERSION:
+            logger.info(f"📥 [{ticker}] 저장소 스키마 버전 불일치 ({meta.get('schema_version')} != {SCHEMA_VERSION})")
+            return None
+        return meta
+
+    def _load_slice(self, ticker: str, file_name: str, rows: int, start: int) -> np.ndarray:
+        """.npy 헤더만 해석한 뒤 start 행 위치로 이동해 나머지 행만 읽기 (행 수가 meta와 다르면 ValueError)"""
+        with open(os.path.join(self._ticker_dir(ticker), file_name), "rb") as f:
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, _, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, _, dtype = np.lib.format.read_array_header_2_0(f)
+            if shape != (rows,):
+                raise ValueError(f"{file_name} 행 수 불일치 ({shape} != ({rows},))")
+            f.seek(start * dtype.itemsize, os.SEEK_CUR)
+            return np.fromfile(f, dtype=dtype, count=rows - start)
+
+    @staticmethod
+    def _save_array(ticker_dir: str, file_name: str, values: np.ndarray) -> None:
+        with open(os.path.join(ticker_dir, file_name), "wb") as f:
+            np.save(f, values, allow_pickle=False)
+            f.flush()
+            os.fsync(f.fileno())
+
+    @staticmethod
+    def _meta_files(meta: Optional[dict]) -> Set[str]:
+        """meta.json이 가리키는 파일 목록"""
+        if not meta:
+            return set()
+        files = {column["file"] for column in meta.get("columns", [])}
+        files.add(meta.get("index_file", f"{INDEX_NAME}.npy"))
+        return files
+
+    @staticmethod
+    def _remove_unused(ticker_dir: str, keep: Set[str]) -> None:
+        for name in os.listdir(ticker_dir):
+            if name == META_FILE or name in keep:
+                continue
+            try:
+                os.remove(os.path.join(ticker_dir, name))
+            except OSError:
+                pass
+
+    @staticmethod
+    def _column_file(name: str, generation: str) -> str:
+        """컬럼 이름 → 세대별 파일 이름 (예: 'Adj Close' → 'Adj_Close.<세대>.npy')"""
+        safe = "".join(ch if ch.isalnum() else "_" for ch in name)
+        return f"{safe}.{generation}.npy"
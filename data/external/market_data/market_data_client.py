@@ -1,14 +1,20 @@
 # -*- coding: utf-8 -*-
 """Market Data Client - yfinance를 사용한 시장 데이터 조회 (캐싱 전담)"""
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import ExitStack
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional, Sequence, Tuple
 
 import pandas as pd
 import yfinance as yf
 import logging
 
+from data.external.market_data.market_bar_store import MarketBarStore
+
 logger = logging.getLogger(__name__)
 
 # 프로젝트 루트 기준 데이터 디렉토리 설정
@@ -16,6 +22,26 @@ PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..
 DATA_DIR = os.path.join(PROJECT_ROOT, "data", "market_cache")
 os.makedirs(DATA_DIR, exist_ok=True)
 
+# 증분 갱신 시 기존 캐시와 겹치게 다시 받는 거래일 수 (분할/배당 조정 감지용)
+INCREMENTAL_OVERLAP_BARS = 5
+# 겹치는 구간 가격 비교 허용 오차 (상대값), 초과 시 조정 발생으로 보고 전체 재다운로드
+ADJUSTMENT_TOLERANCE = 1e-4
+# 캐시 시작일이 조회 기간 시작보다 이 일수 이상 늦으면 기간 부족으로 보고 전체 재다운로드 (주말/휴장일 여유)
+PERIOD_START_SLACK_DAYS = 7
+
+# 메모리에 유지할 DataFrame 최대 개수 (LRU, 티커 전체 데이터와 컬럼/행 수별 부분 데이터를 각각 1개로 셈)
+FRAME_CACHE_SIZE = 128
+
+# interval 일수 상한 → (yfinance period, 캐시 보관 기간)
+_PERIODS = [
+    (30, "1mo", pd.DateOffset(months=1)),
+    (90, "3mo", pd.DateOffset(months=3)),
+    (180, "6mo", pd.DateOffset(months=6)),
+    (365, "1y", pd.DateOffset(years=1)),
+    (730, "2y", pd.DateOffset(years=2)),
+    (1825, "5y", pd.DateOffset(years=5)),
+]
+
 
 @dataclass
 class CacheInfo:
@@ -35,10 +61,22 @@ class TickerData:
 class MarketDataClient:
     """시장 데이터 조회 클라이언트 (yfinance 사용, 캐싱 전담)"""
 
-    def __init__(self):
+    def __init__(self, frame_cache_size: int = FRAME_CACHE_SIZE):
+        """
+        Args:
+            frame_cache_size: 메모리에 유지할 DataFrame 최대 개수
+        """
         # 지연 import로 순환 참조 방지
         from config import key_store
         self._key_store = key_store
+        self._store = MarketBarStore(DATA_DIR)
+        self._frame_cache_size = frame_cache_size
+        self._frame_lock = threading.Lock()
+        # (ticker, 컬럼, 행 수) -> (캐시 세대 = 저장 타임스탬프, DataFrame), 최근 사용 순 (전체 데이터는 (ticker, None, None))
+        self._frames: "OrderedDict[tuple, Tuple[str, pd.DataFrame]]" = OrderedDict()
+        # ticker -> 진행 중인 갱신 결과 (single-flight)
+        self._inflight_lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
 
     def _get_cache_info(self, timestamp_key: str, cache_hours: int) -> Optional[CacheInfo]:
         """캐시 유효성 확인 및 CacheInfo 반환
@@ -85,87 +123,552 @@ class MarketDataClient:
         self,
         ticker: str,
         interval: int = 30,
-        cache_hours: int = 6
+        cache_hours: int = 6,
+        columns: Optional[Sequence[str]] = None,
+        tail: Optional[int] = None
     ) -> Optional[TickerData]:
         """
-        특정 티커의 과거 데이터 조회 (CSV + 타임스탬프 캐싱)
+        특정 티커의 과거 데이터 조회 (컬럼 저장소 + 타임스탬프 캐싱)
+
+        캐시가 만료되면 마지막 캐시 날짜 이후만 받아 병합하고,
+        캐시가 없거나 분할/배당 조정이 감지되면 period 전체를 다시 받는다.
+        같은 티커를 여러 스레드/프로세스가 동시에 요청해도 다운로드는 한 번만 수행된다.
 
         Args:
             ticker: 종목 심볼 (예: 'TQQQ', 'SOXL')
             interval: 조회 기간 (일수)
             cache_hours: 캐시 유효 시간 (시간 단위, 기본 6시간)
+            columns: 필요한 컬럼만 반환 (None이면 전체, 예: RSI/이평선은 ['Close'])
+            tail: 마지막 N행만 반환 (None이면 전체)
 
         Returns:
             TickerData: DataFrame + 캐시 정보, 실패 시 None
         """
-        file_path = os.path.join(DATA_DIR, f"{ticker}.csv")
         timestamp_key = f"{ticker}_YF_DATA_TIMESTAMP"
 
-        # 캐시 확인
+        # 캐시 확인 (같은 세대의 DataFrame이 메모리에 있으면 디스크를 읽지 않음)
         cache_info = self._get_cache_info(timestamp_key, cache_hours)
-        if cache_info and os.path.exists(file_path):
-            try:
-                df = pd.read_csv(file_path, index_col=0)
-                df.index = pd.to_datetime(df.index)
+        if cache_info:
+            df = self._read_frame(ticker, cache_info.cached_at, columns, tail)
+            if df is not None:
                 logger.info(f"📂 기존 데이터 사용 ({ticker}, 경과: {cache_info.elapsed_hours:.1f}시간)")
                 return TickerData(df=df, cache_info=cache_info)
-            except Exception as e:
-                logger.warning(f"⚠️ 캐시 파일 읽기 실패: {e}")
-
-        # 새로운 데이터 다운로드 (period 방식 사용)
-        # interval 일수에 따라 적절한 period 선택
-        if interval <= 30:
-            period = "1mo"
-        elif interval <= 90:
-            period = "3mo"
-        elif interval <= 180:
-            period = "6mo"
-        elif interval <= 365:
-            period = "1y"
-        elif interval <= 730:
-            period = "2y"
-        elif interval <= 1825:
-            period = "5y"
-        else:
-            period = "max"
 
+        # 만료/없음: 같은 티커의 진행 중인 갱신이 있으면 그 결과를 함께 사용
+        refreshed = self._refresh_single_flight(ticker, interval)
+        if refreshed is None:
+            return None
+        df, cache_info = refreshed
+        df = self._project(df, columns, tail)
+        if df is None:
+            logger.error(f"❌ [{ticker}] 요청 컬럼 없음: {columns}")
+            return None
+        return TickerData(df=df, cache_info=cache_info)
+
+    def prefetch(
+        self,
+        tickers: Sequence[str],
+        interval: int = 30,
+        cache_hours: int = 6
+    ) -> Dict[str, bool]:
+        """
+        여러 티커의 캐시를 한 번에 갱신 (만료/없는 티커만 multi-ticker yf.download로 받음)
+
+        - 증분 갱신 가능한 티커는 가장 이른 시작일부터 1회, 나머지(조정 감지 포함)는 period 전체 1회로 최대 2회 다운로드
+        - 다른 스레드가 이미 갱신 중인 티커는 그 결과를 기다림
+        - 저장 후에는 fetch_ticker_history가 메모리/저장소에서 바로 응답
+
+        Args:
+            tickers: 종목 심볼 목록
+            interval: 조회 기간 (일수)
+            cache_hours: 캐시 유효 시간 (이 시간 안에 갱신된 티커는 건너뜀)
+
+        Returns:
+            Dict: 티커 → 캐시 준비 여부 (이미 유효했거나 갱신 성공 시 True)
+        """
+        results: Dict[str, bool] = {}
+        stale = []
+        for ticker in dict.fromkeys(tickers):
+            if self._get_cache_info(f"{ticker}_YF_DATA_TIMESTAMP", cache_hours) and self._store.exists(ticker):
+                results[ticker] = True
+            else:
+                stale.append(ticker)
+        if not stale:
+            return results
+
+        owned: Dict[str, Future] = {}
+        waiting: Dict[str, Future] = {}
+        with self._inflight_lock:
+            for ticker in stale:
+                if ticker in self._inflight:
+                    waiting[ticker] = self._inflight[ticker]
+                else:
+                    owned[ticker] = self._inflight[ticker] = Future()
+
+        refreshed: Dict[str, Tuple[pd.DataFrame, CacheInfo]] = {}
         try:
-            df = yf.download(
-                tickers=ticker,
-                period=period,
-                progress=False,
-                group_by="ticker"
-            )
-
-            if df.empty:
-                logger.error(f"❌ [{ticker}] 다운로드 실패 또는 데이터 없음")
-                return None
+            if owned:
+                refreshed = self._refresh_batch(list(owned), interval)
+        finally:
+            with self._inflight_lock:
+                for ticker, future in owned.items():
+                    future.set_result(refreshed.get(ticker))
+                    self._inflight.pop(ticker, None)
 
-            # 멀티 인덱스 처리
-            if isinstance(df.columns, pd.MultiIndex):
-                df.columns = df.columns.droplevel(0)
-
-            # CSV 저장 및 타임스탬프 기록
-            df.to_csv(file_path)
-            cached_at = self._save_cache_timestamp(timestamp_key)
-            logger.info(f"✅ [{ticker}] 저장 완료: {file_path}")
-
-            return TickerData(
-                df=df,
-                cache_info=CacheInfo(
-                    cached_at=cached_at,
-                    elapsed_hours=0.0,
-                    is_from_cache=False
-                )
-            )
+        for ticker in owned:
+            results[ticker] = ticker in refreshed
+        for ticker, future in waiting.items():
+            results[ticker] = future.result() is not None
+        return results
+
+    def _refresh_batch(self, tickers: Sequence[str], interval: int) -> Dict[str, Tuple[pd.DataFrame, CacheInfo]]:
+        """
+        여러 티커 캐시 갱신 (티커별 프로세스 간 잠금을 모두 보유한 상태에서 일괄 다운로드 후 저장)
+
+        Returns:
+            Dict: 갱신(또는 다른 프로세스가 갱신)된 티커 → (전체 DataFrame, CacheInfo)
+        """
+        seen = {ticker: self._key_store.read(f"{ticker}_YF_DATA_TIMESTAMP") for ticker in tickers}
+        period, keep_offset = self._select_period(interval)
+        period_start = pd.Timestamp.now().normalize() - keep_offset if keep_offset is not None else None
+        refreshed: Dict[str, Tuple[pd.DataFrame, CacheInfo]] = {}
+
+        try:
+            with ExitStack() as stack:
+                # 프로세스 간 교착 방지를 위해 항상 같은 순서로 잠금
+                for ticker in sorted(tickers):
+                    stack.enter_context(self._store.lock(ticker))
+
+                incremental: Dict[str, pd.DataFrame] = {}
+                starts = []
+                full = []
+                for ticker in tickers:
+                    current = self._key_store.read(f"{ticker}_YF_DATA_TIMESTAMP")
+                    cached_df = self._read_cached(ticker, locked=True)
+                    if current and current != seen[ticker] and cached_df is not None:
+                        # 잠금을 기다리는 동안 다른 프로세스가 갱신함
+                        self._put_frame(ticker, current, cached_df)
+                        refreshed[ticker] = (cached_df, CacheInfo(cached_at=current, elapsed_hours=0.0, is_from_cache=True))
+                        continue
+                    start = self._incremental_start(cached_df, period_start) if cached_df is not None else None
+                    if start is None:
+                        full.append(ticker)
+                    else:
+                        incremental[ticker] = cached_df
+                        starts.append(start)
+
+                merged: Dict[str, pd.DataFrame] = {}
+                if incremental:
+                    try:
+                        fresh = self._download_batch(list(incremental), start=min(starts).strftime("%Y-%m-%d"))
+                    except Exception as e:
+                        logger.warning(f"⚠️ 일괄 증분 다운로드 실패, 전체 다운로드로 전환: {e}")
+                        fresh = {}
+                    for ticker, cached_df in incremental.items():
+                        df = self._merge_incremental(ticker, cached_df, fresh[ticker], period_start) if ticker in fresh else None
+                        if df is None:
+                            full.append(ticker)
+                        else:
+                            merged[ticker] = df
+
+                if full:
+                    try:
+                        fresh = self._download_batch(full, period=period)
+                    except Exception as e:
+                        logger.error(f"❌ 일괄 다운로드 실패 ({', '.join(full)}): {e}")
+                        fresh = {}
+                    for ticker in full:
+                        if ticker in fresh:
+                            merged[ticker] = fresh[ticker]
+                        else:
+                            logger.error(f"❌ [{ticker}] 다운로드 실패 또는 데이터 없음")
+
+                for ticker, df in merged.items():
+                    try:
+                        self._store.write(ticker, df)
+                        cached_at = self._save_cache_timestamp(f"{ticker}_YF_DATA_TIMESTAMP")
+                        self._put_frame(ticker, cached_at, df)
+                        refreshed[ticker] = (df, CacheInfo(cached_at=cached_at, elapsed_hours=0.0, is_from_cache=False))
+                    except Exception as e:
+                        logger.error(f"❌ [{ticker}] 저장 실패: {e}")
+
+            logger.info(f"✅ 일괄 갱신 완료: {len(refreshed)}/{len(tickers)} "
+                        f"(증분 시도 {len(incremental)}, 전체 다운로드 {len(full)})")
+        except Exception as e:
+            logger.error(f"일괄 갱신 중 오류 발생: {e}")
+        return refreshed
+
+    def _refresh_single_flight(self, ticker: str, interval: int) -> Optional[Tuple[pd.DataFrame, CacheInfo]]:
+        """
+        티커별 단일 갱신 실행 (동시에 요청한 스레드는 먼저 시작한 갱신의 결과를 기다려 공유)
+
+        Args:
+            ticker: 종목 심볼
+            interval: 조회 기간 (일수)
+
+        Returns:
+            (전체 DataFrame, CacheInfo), 실패 시 None
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(ticker)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[ticker] = future
+
+        if not is_leader:
+            logger.info(f"⏳ [{ticker}] 진행 중인 다운로드 결과 대기")
+            return future.result()
+
+        try:
+            result = self._refresh(ticker, interval)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(ticker, None)
+
+    def _refresh(self, ticker: str, interval: int) -> Optional[Tuple[pd.DataFrame, CacheInfo]]:
+        """
+        캐시 갱신 (프로세스 간 잠금 보유 상태에서 증분/전체 다운로드 후 저장)
+
+        잠금을 기다리는 동안 다른 프로세스(웹/스케줄러)가 이미 갱신했으면 다시 받지 않고 그 결과를 사용한다.
+
+        Returns:
+            (전체 DataFrame, CacheInfo), 실패 시 None
+        """
+        timestamp_key = f"{ticker}_YF_DATA_TIMESTAMP"
+        seen_timestamp = self._key_store.read(timestamp_key)
+
+        try:
+            with self._store.lock(ticker):
+                current_timestamp = self._key_store.read(timestamp_key)
+                if current_timestamp and current_timestamp != seen_timestamp:
+                    df = self._read_cached(ticker, locked=True)
+                    if df is not None:
+                        logger.info(f"📂 [{ticker}] 다른 프로세스가 갱신한 데이터 사용")
+                        self._put_frame(ticker, current_timestamp, df)
+                        return df, CacheInfo(cached_at=current_timestamp, elapsed_hours=0.0, is_from_cache=True)
+
+                # 증분 병합에는 전체 데이터가 필요
+                cached_df = self._read_cached(ticker, locked=True)
+
+                period, keep_offset = self._select_period(interval)
+                period_start = pd.Timestamp.now().normalize() - keep_offset if keep_offset is not None else None
+
+                # 만료된 캐시가 있으면 마지막 날짜 이후만 받아 병합, 불가하면 전체 다운로드
+                df = None
+                if cached_df is not None:
+                    df = self._refresh_incremental(ticker, cached_df, period_start)
+
+                if df is None:
+                    df = self._download(ticker, period=period)
+                    if df.empty:
+                        logger.error(f"❌ [{ticker}] 다운로드 실패 또는 데이터 없음")
+                        return None
+
+                # 저장소 기록 후 타임스탬프 기록 (타임스탬프가 보이면 데이터는 이미 완성된 상태)
+                self._store.write(ticker, df)
+                cached_at = self._save_cache_timestamp(timestamp_key)
+                self._put_frame(ticker, cached_at, df)
+                logger.info(f"✅ [{ticker}] 저장 완료: {os.path.join(DATA_DIR, ticker)}")
+
+            return df, CacheInfo(cached_at=cached_at, elapsed_hours=0.0, is_from_cache=False)
 
         except Exception as e:
             logger.error(f"{ticker} 조회 중 오류 발생: {e}")
             return None
 
+    def _read_cached(self, ticker: str, locked: bool = False) -> Optional[pd.DataFrame]:
+        """
+        저장소에서 전체 캐시 읽기 (기존 CSV 캐시만 있으면 최초 1회 변환, 실패 시 None)
+
+        Args:
+            ticker: 종목 심볼
+            locked: 호출자가 이미 store.lock(ticker)를 보유 중인지 여부
+        """
+        df = self._store.read(ticker)
+        if df is not None:
+            return df
+
+        csv_path = os.path.join(DATA_DIR, f"{ticker}.csv")
+        if not os.path.exists(csv_path):
+            return None
+        if locked:
+            converted = self._store.convert_csv(ticker, csv_path)
+        else:
+            with self._store.lock(ticker):
+                # 잠금을 기다리는 동안 다른 프로세스가 변환했을 수 있음
+                df = self._store.read(ticker)
+                if df is not None:
+                    return df
+                converted = os.path.exists(csv_path) and self._store.convert_csv(ticker, csv_path)
+        return self._store.read(ticker) if converted else None
+
+    def _read_frame(
+        self,
+        ticker: str,
+        generation: str,
+        columns: Optional[Sequence[str]],
+        tail: Optional[int]
+    ) -> Optional[pd.DataFrame]:
+        """
+        유효한 캐시 읽기 (메모리 → 저장소 순)
+
+        메모리에 같은 요청의 부분 데이터나 전체 데이터가 있으면 그것을 잘라 쓰고,
+        없으면 컬럼/행 수가 지정된 요청은 저장소에서 그 부분만 읽어 따로 메모리에 둔다.
+        전체 요청이거나 저장소에서 읽지 못하면(CSV 캐시만 있는 경우 등) 전체를 읽는다.
+
+        Returns:
+            DataFrame: 요청 범위 복사본, 없거나 요청 컬럼이 없으면 None
+        """
+        selective = columns is not None or tail is not None
+        if selective:
+            df = self._get_frame(ticker, generation, columns, tail)
+            if df is not None:
+                return self._project(df, columns, tail)
+        df = self._get_frame(ticker, generation)
+        if df is not None:
+            return self._project(df, columns, tail)
+
+        if selective:
+            df = self._store.read(ticker, columns=columns, tail=tail)
+            if df is not None:
+                self._put_frame(ticker, generation, df, columns, tail)
+                return self._project(df, columns, tail)
+
+        df = self._read_cached(ticker)
+        if df is None:
+            return None
+        self._put_frame(ticker, generation, df)
+        return self._project(df, columns, tail)
+
+    def _get_frame(
+        self,
+        ticker: str,
+        generation: str,
+        columns: Optional[Sequence[str]] = None,
+        tail: Optional[int] = None
+    ) -> Optional[pd.DataFrame]:
+        """메모리 캐시 조회 (세대가 다르면 다른 프로세스가 갱신한 것이므로 폐기)"""
+        key = self._frame_key(ticker, columns, tail)
+        with self._frame_lock:
+            entry = self._frames.get(key)
+            if entry is None:
+                return None
+            if entry[0] != generation:
+                del self._frames[key]
+                return None
+            self._frames.move_to_end(key)
+            return entry[1]
+
+    def _put_frame(
+        self,
+        ticker: str,
+        generation: str,
+        df: pd.DataFrame,
+        columns: Optional[Sequence[str]] = None,
+        tail: Optional[int] = None
+    ) -> None:
+        """메모리 캐시 저장 (최대 개수 초과 시 가장 오래 사용하지 않은 항목 제거)"""
+        key = self._frame_key(ticker, columns, tail)
+        with self._frame_lock:
+            self._frames[key] = (generation, df)
+            self._frames.move_to_end(key)
+            while len(self._frames) > self._frame_cache_size:
+                self._frames.popitem(last=False)
+
+    def _drop_frame(self, ticker: str) -> None:
+        """티커의 메모리 캐시 전체(부분 데이터 포함) 삭제"""
+        with self._frame_lock:
+            for key in [key for key in self._frames if key[0] == ticker]:
+                del self._frames[key]
+
+    @staticmethod
+    def _frame_key(ticker: str, columns: Optional[Sequence[str]], tail: Optional[int]) -> tuple:
+        return ticker, tuple(columns) if columns is not None else None, tail
+
+    @staticmethod
+    def _project(
+        df: pd.DataFrame,
+        columns: Optional[Sequence[str]],
+        tail: Optional[int]
+    ) -> Optional[pd.DataFrame]:
+        """
+        필요한 컬럼/마지막 N행만 복사하여 반환 (메모리 캐시 원본 보호)
+
+        Returns:
+            DataFrame, 요청 컬럼이 없으면 None
+        """
+        if columns is not None:
+            if any(column not in df.columns for column in columns):
+                return None
+            df = df[list(columns)]
+        else:
+            df = df.copy()
+        return df.tail(tail) if tail is not None else df
+
+    @staticmethod
+    def _select_period(interval: int) -> Tuple[str, Optional[pd.DateOffset]]:
+        """
+        interval 일수에 맞는 yfinance period 선택
+
+        Returns:
+            (period, 캐시 보관 기간) - "max"이면 보관 기간 None (전체 보관)
+        """
+        for max_days, period, keep_offset in _PERIODS:
+            if interval <= max_days:
+                return period, keep_offset
+        return "max", None
+
+    @staticmethod
+    def _download(ticker: str, **kwargs) -> pd.DataFrame:
+        """yf.download 호출 후 단일 티커 컬럼으로 정리"""
+        df = yf.download(
+            tickers=ticker,
+            progress=False,
+            group_by="ticker",
+            **kwargs
+        )
+
+        # 멀티 인덱스 처리
+        if isinstance(df.columns, pd.MultiIndex):
+            df.columns = df.columns.droplevel(0)
+        return df
+
+    @staticmethod
+    def _download_batch(tickers: Sequence[str], **kwargs) -> Dict[str, pd.DataFrame]:
+        """
+        여러 티커를 yf.download 1회(threads)로 받아 티커별로 분리
+
+        Returns:
+            Dict: 티커 → DataFrame (데이터가 없는 티커는 제외)
+        """
+        df = yf.download(
+            tickers=list(tickers),
+            progress=False,
+            group_by="ticker",
+            threads=True,
+            **kwargs
+        )
+
+        frames: Dict[str, pd.DataFrame] = {}
+        if not isinstance(df.columns, pd.MultiIndex):
+            return frames
+        available = set(df.columns.get_level_values(0))
+        for ticker in tickers:
+            if ticker not in available:
+                continue
+            # 티커마다 거래일이 달라 합쳐진 인덱스에 생긴 빈 행 제거
+            frame = df[ticker].dropna(how="all")
+            if not frame.empty:
+                frames[ticker] = frame
+        return frames
+
+    def _refresh_incremental(
+        self,
+        ticker: str,
+        cached_df: pd.DataFrame,
+        period_start: Optional[pd.Timestamp]
+    ) -> Optional[pd.DataFrame]:
+        """
+        만료된 캐시의 마지막 구간부터만 다운로드하여 병합
+
+        Args:
+            ticker: 종목 심볼
+            cached_df: 기존 캐시 데이터
+            period_start: 보관 시작일 (None이면 전체 보관)
+
+        Returns:
+            DataFrame: 병합된 데이터, 전체 재다운로드가 필요하면 None
+        """
+        overlap_start = self._incremental_start(cached_df, period_start)
+        if overlap_start is None:
+            return None
+
+        try:
+            fresh = self._download(ticker, start=overlap_start.strftime("%Y-%m-%d"))
+        except Exception as e:
+            logger.warning(f"⚠️ [{ticker}] 증분 다운로드 실패, 전체 다운로드로 전환: {e}")
+            return None
+        return self._merge_incremental(ticker, cached_df, fresh, period_start)
+
+    @staticmethod
+    def _incremental_start(cached_df: pd.DataFrame, period_start: Optional[pd.Timestamp]) -> Optional[pd.Timestamp]:
+        """
+        증분 다운로드 시작일 (마지막 INCREMENTAL_OVERLAP_BARS 거래일을 겹치게 다시 받음)
+
+        Returns:
+            Timestamp: 시작일, 캐시가 짧거나 기간이 부족해 전체 다운로드가 필요하면 None
+        """
+        if len(cached_df) < INCREMENTAL_OVERLAP_BARS or not cached_df.index.is_monotonic_increasing:
+            return None
+        # 이전에 더 짧은 기간으로 받은 캐시면 앞부분이 비어 있으므로 전체 다운로드
+        if period_start is not None and cached_df.index[0] > period_start + pd.Timedelta(days=PERIOD_START_SLACK_DAYS):
+            return None
+        return cached_df.index[-INCREMENTAL_OVERLAP_BARS]
+
+    def _merge_incremental(
+        self,
+        ticker: str,
+        cached_df: pd.DataFrame,
+        fresh: pd.DataFrame,
+        period_start: Optional[pd.Timestamp]
+    ) -> Optional[pd.DataFrame]:
+        """
+        증분 다운로드 결과를 기존 캐시에 병합 (중복 날짜는 새 값 우선)
+
+        겹치는 구간의 값이 바뀌었으면(분할/배당 조정) 과거 전체가 달라진 것이므로 None을 반환한다.
+
+        Returns:
+            DataFrame: 병합된 데이터, 전체 재다운로드가 필요하면 None
+        """
+        if fresh.empty or set(fresh.columns) != set(cached_df.columns):
+            return None
+        fresh = fresh[cached_df.columns]
+        fresh.index = pd.to_datetime(fresh.index)
+
+        if self._is_adjusted(cached_df, fresh):
+            logger.info(f"🔁 [{ticker}] 분할/배당 조정 감지 - 전체 재다운로드")
+            return None
+
+        merged = pd.concat([cached_df, fresh])
+        merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+        if period_start is not None:
+            merged = merged[merged.index >= period_start]
+
+        added = len(fresh.index.difference(cached_df.index))
+        logger.info(f"🔄 [{ticker}] 증분 갱신: {fresh.index[0]:%Y-%m-%d} 이후 {len(fresh)}건 수신 (신규 {added}건)")
+        return merged
+
+    @staticmethod
+    def _is_adjusted(cached_df: pd.DataFrame, fresh: pd.DataFrame) -> bool:
+        """
+        겹치는 구간의 가격이 기존 캐시와 다른지 확인
+
+        캐시의 마지막 봉은 장중에 받은 미확정 값일 수 있으므로 비교에서 제외한다.
+        겹치는 확정 봉이 하나도 없으면 검증할 수 없으므로 조정된 것으로 간주한다.
+        """
+        common = cached_df.index[:-1].intersection(fresh.index)
+        if common.empty:
+            return True
+
+        for column in ("Close", "Adj Close"):
+            if column not in cached_df.columns:
+                continue
+            old = cached_df.loc[common, column].astype(float)
+            new = fresh.loc[common, column].astype(float)
+            diff = ((new - old).abs() / old.abs().where(old != 0, 1.0)).max()
+            if pd.isna(diff) or diff > ADJUSTMENT_TOLERANCE:
+                return True
+        return False
+
     def clear_cache(self, ticker: str) -> bool:
         """
-        특정 티커의 캐시(타임스탬프) 삭제
+        특정 티커의 캐시(타임스탬프 + 메모리 DataFrame) 삭제
 
         Args:
             ticker: 캐시 삭제할 티커
@@ -174,6 +677,7 @@ class MarketDataClient:
             bool: 삭제 성공 여부
         """
         timestamp_key = f"{ticker}_YF_DATA_TIMESTAMP"
+        self._drop_frame(ticker)
         try:
             self._key_store.delete(timestamp_key)
             logger.info(f"🗑️ [{ticker}] 캐시 타임스탬프 삭제: {timestamp_key}")
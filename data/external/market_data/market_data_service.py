@@ -48,7 +48,8 @@ class MarketDataService:
             ticker_data = self.client.fetch_ticker_history(
                 ticker,
                 interval=self.CACHE_INTERVAL,
-                cache_hours=cache_hours
+                cache_hours=cache_hours,
+                columns=['Close']
             )
             if ticker_data is None:
                 return None
@@ -105,7 +106,9 @@ class MarketDataService:
             ticker_data = self.client.fetch_ticker_history(
                 ticker,
                 interval=self.CACHE_INTERVAL,
-                cache_hours=cache_hours
+                cache_hours=cache_hours,
+                columns=['Close'],
+                tail=days
             )
             if ticker_data is None:
                 return None
@@ -146,7 +149,9 @@ class MarketDataService:
             ticker_data = self.client.fetch_ticker_history(
                 ticker,
                 interval=self.CACHE_INTERVAL,
-                cache_hours=cache_hours
+                cache_hours=cache_hours,
+                columns=['Close'],
+                tail=days + 1
             )
             if ticker_data is None:
                 return None
@@ -190,7 +195,9 @@ class MarketDataService:
             ticker_data = self.client.fetch_ticker_history(
                 ticker,
                 interval=self.CACHE_INTERVAL,
-                cache_hours=0
+                cache_hours=0,
+                columns=['High', 'Low', 'Close'],
+                tail=period + 1
             )
             if ticker_data is None:
                 return None
@@ -216,6 +223,19 @@ class MarketDataService:
             logger.error(f"{ticker} ATR 조회 실패: {e}")
             return None
 
+    def prefetch(self, tickers: List[str], cache_hours: int = 6) -> Dict[str, bool]:
+        """
+        여러 티커의 캐시를 한 번에 갱신 (만료/없는 티커만 일괄 다운로드)
+
+        Args:
+            tickers: 종목 심볼 목록
+            cache_hours: 캐시 유효 시간 (시간 단위, 기본 6시간)
+
+        Returns:
+            Dict: 티커 → 캐시 준비 여부
+        """
+        return self.client.prefetch(tickers, interval=self.CACHE_INTERVAL, cache_hours=cache_hours)
+
     def clear_cache(self, ticker: str) -> bool:
         """
         특정 티커의 캐시(타임스탬프) 삭제
@@ -253,7 +273,9 @@ class MarketDataService:
             ticker_data = self.client.fetch_ticker_history(
                 ticker,
                 interval=self.CACHE_INTERVAL,
-                cache_hours=cache_hours
+                cache_hours=cache_hours,
+                columns=['Close'],
+                tail=60
             )
             if ticker_data is None:
                 return None
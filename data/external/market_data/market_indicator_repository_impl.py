@@ -72,6 +72,23 @@ class MarketIndicatorRepositoryImpl(MarketIndicatorRepository):
             logger.error(f"{ticker} 가격 히스토리 조회 실패: {e}")
             return None
 
+    def prefetch(self, tickers: List[str], cache_hours: int = 6) -> Dict[str, bool]:
+        """
+        여러 티커의 시세 캐시를 한 번에 갱신 (만료/없는 티커만 일괄 다운로드)
+
+        Args:
+            tickers: 종목 심볼 목록
+            cache_hours: 캐시 유효 시간 (시간 단위, 기본 6시간)
+
+        Returns:
+            Dict[str, bool]: 티커 → 캐시 준비 여부
+        """
+        try:
+            return self.service.prefetch(tickers=tickers, cache_hours=cache_hours)
+        except Exception as e:
+            logger.error(f"시세 일괄 갱신 실패 ({', '.join(tickers)}): {e}")
+            return {ticker: False for ticker in tickers}
+
     def clear_cache(self, tickers: list) -> list:
         """
         특정 티커들의 캐시(타임스탬프) 삭제
@@ -3,10 +3,12 @@ from data.persistence.sqlalchemy.models.bot_info_model import BotInfoModel
 from data.persistence.sqlalchemy.models.trade_model import TradeModel
 from data.persistence.sqlalchemy.models.history_model import HistoryModel
 from data.persistence.sqlalchemy.models.order_model import OrderModel
+from data.persistence.sqlalchemy.models.fill_model import FillModel
 
 __all__ = [
     'BotInfoModel',
     'TradeModel',
     'HistoryModel',
     'OrderModel',
+    'FillModel',
 ]
@@ -0,0 +1,30 @@
+"""Fill ORM Model - 체결 원장 SQLAlchemy 모델"""
+from sqlalchemy import Column, String, Float, Boolean, DateTime
+from data.persistence.sqlalchemy.core.base import Base
+
+
+class FillModel(Base):
+    """체결 원장 테이블 ORM 모델"""
+
+    __tablename__ = 'fill_ledger'
+
+    # Composite Primary Key (주문번호는 일자별로 다시 시작)
+    ord_dt = Column(String, primary_key=True, nullable=False)
+    odno = Column(String, primary_key=True, nullable=False)
+
+    # 체결 정보
+    symbol = Column(String, nullable=False, index=True)
+    is_buy = Column(Boolean, nullable=False)
+    order_qty = Column(Float, nullable=False)
+    filled_qty = Column(Float, nullable=False)
+    filled_price = Column(Float, nullable=False)
+    filled_amount = Column(Float, nullable=False)
+    unfilled_qty = Column(Float, nullable=False, index=True)
+    order_time = Column(String, nullable=False)
+    synced_at = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<FillModel(ord_dt={self.ord_dt}, odno={self.odno}, symbol={self.symbol}, "
+            f"filled_qty={self.filled_qty}/{self.order_qty}, filled_price={self.filled_price})>"
+        )
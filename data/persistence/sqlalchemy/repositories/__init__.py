@@ -3,6 +3,7 @@ from data.persistence.sqlalchemy.repositories.bot_info_repository_impl import SQ
 from data.persistence.sqlalchemy.repositories.trade_repository_impl import SQLAlchemyTradeRepositoryImpl
 from data.persistence.sqlalchemy.repositories.history_repository_impl import SQLAlchemyHistoryRepositoryImpl
 from data.persistence.sqlalchemy.repositories.order_repository_impl import SQLAlchemyOrderRepositoryImpl
+from data.persistence.sqlalchemy.repositories.fill_ledger_repository_impl import SQLAlchemyFillLedgerRepositoryImpl
 
 # 하위 호환성을 위한 별칭 (deprecated, 추후 제거 예정)
 SQLAlchemyBotInfoRepository = SQLAlchemyBotInfoRepositoryImpl
@@ -16,6 +17,7 @@ __all__ = [
     'SQLAlchemyTradeRepositoryImpl',
     'SQLAlchemyHistoryRepositoryImpl',
     'SQLAlchemyOrderRepositoryImpl',
+    'SQLAlchemyFillLedgerRepositoryImpl',
     # Deprecated aliases
     'SQLAlchemyBotInfoRepository',
     'SQLAlchemyTradeRepository',
@@ -0,0 +1,125 @@
+"""Fill Ledger Repository Implementation"""
+from typing import Iterable, List, Optional
+
+from sqlalchemy.orm import Session
+
+from domain.entities.fill import Fill
+from domain.repositories.fill_ledger_repository import FillLedgerRepository
+from data.persistence.sqlalchemy.models.fill_model import FillModel
+
+
+class SQLAlchemyFillLedgerRepositoryImpl(FillLedgerRepository):
+    """
+    SQLAlchemy 기반 체결 원장 Repository 구현체
+
+    체결 확인 폴러 스레드에서 기록하므로 scoped_session(스레드별 세션)을 주입받는다.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def upsert_all(self, fills: List[Fill]) -> int:
+        """체결 저장 (신규 삽입 또는 체결 수량 갱신), 변경된 건수 반환"""
+        if not fills:
+            return 0
+
+        try:
+            keys = {(fill.ord_dt, fill.odno) for fill in fills}
+            existing = {
+                (model.ord_dt, model.odno): model
+                for model in self.session.query(FillModel).filter(
+                    FillModel.ord_dt.in_({ord_dt for ord_dt, _ in keys}),
+                    FillModel.odno.in_({odno for _, odno in keys})
+                ).all()
+            }
+
+            changed = 0
+            for fill in fills:
+                model = existing.get((fill.ord_dt, fill.odno))
+                if model is None:
+                    model = self._to_model(fill)
+                    self.session.add(model)
+                    existing[(fill.ord_dt, fill.odno)] = model
+                    changed += 1
+                elif model.filled_qty != fill.filled_qty or model.unfilled_qty != fill.unfilled_qty:
+                    # 추가 체결: 체결 수량/금액만 갱신 (PK는 불변)
+                    model.filled_qty = fill.filled_qty
+                    model.filled_price = fill.filled_price
+                    model.filled_amount = fill.filled_amount
+                    model.unfilled_qty = fill.unfilled_qty
+                    model.synced_at = fill.synced_at
+                    changed += 1
+
+            self.session.commit()
+            return changed
+        except Exception as e:
+            self.session.rollback()
+            raise e
+
+    def find_by_odnos(self, odnos: Iterable[str], since: str) -> List[Fill]:
+        """since(YYYYMMDD) 이후 주문 중 주문번호로 조회 (같은 번호는 최근 주문일 우선)"""
+        odnos = set(odnos)
+        if not odnos:
+            return []
+
+        models = self.session.query(FillModel).filter(
+            FillModel.ord_dt >= since,
+            FillModel.odno.in_(odnos)
+        ).order_by(FillModel.ord_dt).all()
+
+        # 일자별로 주문번호가 다시 시작하므로 같은 번호는 최근 주문일로 덮어씀
+        latest = {model.odno: model for model in models}
+        return [self._to_entity(model) for model in latest.values()]
+
+    def find_since(self, since: str) -> List[Fill]:
+        """since(YYYYMMDD) 이후 체결 전체 조회 (주문 순서)"""
+        models = self.session.query(FillModel).filter(FillModel.ord_dt >= since).all()
+        return sorted((self._to_entity(model) for model in models), key=Fill.sort_key)
+
+    def find_open(self, since: str) -> List[Fill]:
+        """since(YYYYMMDD) 이후 미체결 수량이 남은 체결 조회"""
+        models = self.session.query(FillModel).filter(
+            FillModel.ord_dt >= since,
+            FillModel.unfilled_qty > 0
+        ).all()
+        return [self._to_entity(model) for model in models]
+
+    def find_latest(self, since: str) -> Optional[Fill]:
+        """since(YYYYMMDD) 이후 마지막으로 기록된 체결 조회 (증분 동기화 기준점)"""
+        # 주문번호는 고정 길이(0 채움) 문자열이므로 문자열 정렬이 번호 순서와 같음
+        model = self.session.query(FillModel).filter(
+            FillModel.ord_dt >= since
+        ).order_by(FillModel.ord_dt.desc(), FillModel.odno.desc()).first()
+        return self._to_entity(model) if model else None
+
+    def _to_entity(self, model: FillModel) -> Fill:
+        """ORM Model → Entity 변환 (Mapper)"""
+        return Fill(
+            ord_dt=model.ord_dt,
+            odno=model.odno,
+            symbol=model.symbol,
+            is_buy=model.is_buy,
+            order_qty=model.order_qty,
+            filled_qty=model.filled_qty,
+            filled_price=model.filled_price,
+            filled_amount=model.filled_amount,
+            unfilled_qty=model.unfilled_qty,
+            order_time=model.order_time,
+            synced_at=model.synced_at
+        )
+
+    def _to_model(self, entity: Fill) -> FillModel:
+        """Entity → ORM Model 변환 (Mapper)"""
+        return FillModel(
+            ord_dt=entity.ord_dt,
+            odno=entity.odno,
+            symbol=entity.symbol,
+            is_buy=entity.is_buy,
+            order_qty=entity.order_qty,
+            filled_qty=entity.filled_qty,
+            filled_price=entity.filled_price,
+            filled_amount=entity.filled_amount,
+            unfilled_qty=entity.unfilled_qty,
+            order_time=entity.order_time,
+            synced_at=entity.synced_at
+        )
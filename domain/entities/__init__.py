@@ -7,3 +7,6 @@ __all__ = ['BotInfo', 'Trade', 'History']
 from domain.entities.order import Order
 
 __all__.append('Order')
+from domain.entities.fill import Fill
+
+__all__.append('Fill')
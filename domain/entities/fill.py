@@ -0,0 +1,65 @@
+"""Fill Entity - 증권사 체결 원장"""
+from datetime import datetime
+
+
+class Fill:
+    """
+    체결 원장 엔티티
+
+    증권사 체결 내역(주문번호 단위)을 로컬에 보관한 것.
+    부분 체결 후 추가 체결되면 같은 (ord_dt, odno) 레코드의 체결 수량이 갱신된다.
+    """
+
+    def __init__(
+        self,
+        ord_dt: str,
+        odno: str,
+        symbol: str,
+        is_buy: bool,
+        order_qty: float,
+        filled_qty: float,
+        filled_price: float,
+        filled_amount: float,
+        unfilled_qty: float,
+        order_time: str,
+        synced_at: datetime
+    ):
+        # 복합 PK 검증
+        if not ord_dt or len(ord_dt) != 8:
+            raise ValueError("ord_dt must be YYYYMMDD")
+        if not odno or not odno.strip():
+            raise ValueError("odno cannot be empty")
+        if not symbol or not symbol.strip():
+            raise ValueError("Symbol cannot be empty")
+
+        # 수량 검증
+        if filled_qty < 0:
+            raise ValueError("filled_qty cannot be negative")
+        if unfilled_qty < 0:
+            raise ValueError("unfilled_qty cannot be negative")
+
+        self.ord_dt = ord_dt
+        self.odno = odno.strip()
+        self.symbol = symbol.strip().upper()
+        self.is_buy = bool(is_buy)
+        self.order_qty = float(order_qty)
+        self.filled_qty = float(filled_qty)
+        self.filled_price = round(float(filled_price), 4)
+        self.filled_amount = round(float(filled_amount), 2)
+        self.unfilled_qty = float(unfilled_qty)
+        self.order_time = order_time
+        self.synced_at = synced_at
+
+    def is_complete(self) -> bool:
+        """전량 체결 여부"""
+        return self.unfilled_qty <= 0
+
+    def sort_key(self) -> tuple:
+        """주문 순서 키 (주문일, 주문번호) - 주문번호는 일자별 증가 번호"""
+        return self.ord_dt, int(self.odno) if self.odno.isdigit() else 0
+
+    def __repr__(self):
+        return (
+            f"Fill(ord_dt={self.ord_dt}, odno={self.odno}, symbol={self.symbol}, "
+            f"{'buy' if self.is_buy else 'sell'} {self.filled_qty}/{self.order_qty} @ {self.filled_price})"
+        )
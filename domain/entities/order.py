@@ -57,6 +57,11 @@ class Order:
         """주문이 완료되었는지 확인"""
         return self.trade_count >= self.total_count
 
+    def get_slice_key(self) -> str:
+        """현재 회차 주문의 클라이언트 주문 키 (같은 주문/회차는 재시도해도 같은 키)"""
+        slice_no = self.total_count - self.trade_count + 1
+        return f"{self.name}:{self.date_added.strftime('%Y%m%d%H%M%S')}:{slice_no}"
+
     def get_completion_rate(self) -> float:
         """완료율 반환 (0.0 ~ 1.0)"""
         if self.total_count == 0:
@@ -1,10 +1,11 @@
 # -*- coding: utf-8 -*-
 """Exchange Repository Interface - 증권사 API 추상화"""
 from abc import ABC, abstractmethod
-from typing import Optional, List, TYPE_CHECKING
+from concurrent.futures import Future
+from typing import Optional, List, Dict, Iterable, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from domain.value_objects import TradeResult
+    from domain.value_objects import TradeResult, QuoteSnapshot
     from data.external.hantoo.hantoo_models import BalanceResult, TickerItem
 
 
@@ -19,22 +20,51 @@ class ExchangeRepository(ABC):
     # === 가격 조회 ===
 
     @abstractmethod
-    def get_price(self, symbol: str) -> Optional[float]:
+    def get_quote(self, symbol: str, max_age: Optional[float] = None) -> Optional['QuoteSnapshot']:
         """
-        현재 가격 조회
+        시세 스냅샷 조회 (현재가, 전일 종가, 호가, 조회 시각을 1회 호출로 조회)
 
         Args:
             symbol: 종목 심볼
+            max_age: 허용 캐시 나이 (초, None이면 구현체 기본 TTL)
+
+        Returns:
+            QuoteSnapshot: 시세 스냅샷, 조회 실패 시 None
+        """
+        ...
+
+    @abstractmethod
+    def get_price(self, symbol: str, max_age: Optional[float] = None) -> Optional[float]:
+        """
+        현재 가격 조회 (get_quote의 last)
+
+        Args:
+            symbol: 종목 심볼
+            max_age: 허용 캐시 나이 (초, None이면 구현체 기본 TTL)
 
         Returns:
             float: 현재 가격, 조회 실패 시 None
         """
         ...
 
+    @abstractmethod
+    def get_prices(self, symbols: Iterable[str], max_age: Optional[float] = None) -> Dict[str, Optional[float]]:
+        """
+        여러 종목 현재가 일괄 조회 (중복 제거 후 동시 조회)
+
+        Args:
+            symbols: 종목 심볼 목록
+            max_age: 허용 캐시 나이 (초, None이면 구현체 기본 TTL)
+
+        Returns:
+            Dict[str, Optional[float]]: {심볼: 현재가}, 조회 실패한 종목은 None
+        """
+        ...
+
     @abstractmethod
     def get_prev_price(self, symbol: str) -> Optional[float]:
         """
-        전일 종가 조회
+        전일 종가 조회 (get_quote의 base)
 
         Args:
             symbol: 종목 심볼
@@ -73,7 +103,25 @@ class ExchangeRepository(ABC):
     # === 주문 실행 ===
 
     @abstractmethod
-    def buy(self, symbol: str, amount: float, request_price: float) -> Optional['TradeResult']:
+    def is_order_unconfirmed(self, client_key: str) -> bool:
+        """
+        client key 주문이 접수 여부 불명 상태로 남아 있는지 확인
+
+        응답 유실 후 주문 내역에서도 확인되지 않아 주문 메서드가 None을 반환한 경우 True.
+        같은 키로 다시 호출하지 않으면 이 주문은 재전송/체결 반영되지 않는다.
+
+        Args:
+            client_key: 클라이언트 주문 키
+
+        Returns:
+            bool: 접수 여부 불명이면 True
+        """
+        ...
+
+    @abstractmethod
+    def buy(
+        self, symbol: str, amount: float, request_price: float, client_key: Optional[str] = None
+    ) -> Optional['TradeResult']:
         """
         즉시 매수 (주문 후 체결 확인까지 대기)
 
@@ -81,6 +129,7 @@ class ExchangeRepository(ABC):
             symbol: 종목 심볼
             amount: 매수 수량
             request_price: 주문 가격
+            client_key: 클라이언트 주문 키 (같은 키는 한 번만 접수, None이면 호출마다 새 키)
 
         Returns:
             TradeResult: 거래 결과, 실패 시 None
@@ -88,7 +137,9 @@ class ExchangeRepository(ABC):
         ...
 
     @abstractmethod
-    def sell(self, symbol: str, amount: float, request_price: float) -> Optional['TradeResult']:
+    def sell(
+        self, symbol: str, amount: float, request_price: float, client_key: Optional[str] = None
+    ) -> Optional['TradeResult']:
         """
         즉시 매도 (주문 후 체결 확인까지 대기)
 
@@ -96,6 +147,7 @@ class ExchangeRepository(ABC):
             symbol: 종목 심볼
             amount: 매도 수량
             request_price: 주문 가격
+            client_key: 클라이언트 주문 키 (같은 키는 한 번만 접수, None이면 호출마다 새 키)
 
         Returns:
             TradeResult: 거래 결과, 실패 시 None
@@ -103,7 +155,45 @@ class ExchangeRepository(ABC):
         ...
 
     @abstractmethod
-    def buy_request_only_odno(self, symbol: str, amount: float, request_price: float) -> Optional[str]:
+    def submit_buy(
+        self, symbol: str, amount: float, request_price: float, client_key: Optional[str] = None
+    ) -> Future:
+        """
+        매수 주문 전송 후 즉시 반환 (체결 확인은 백그라운드에서 진행)
+
+        Args:
+            symbol: 종목 심볼
+            amount: 매수 수량
+            request_price: 주문 가격
+            client_key: 클라이언트 주문 키 (같은 키는 한 번만 접수, None이면 호출마다 새 키)
+
+        Returns:
+            Future: 체결 시 TradeResult, 실패 시 None으로 완료
+        """
+        ...
+
+    @abstractmethod
+    def submit_sell(
+        self, symbol: str, amount: float, request_price: float, client_key: Optional[str] = None
+    ) -> Future:
+        """
+        매도 주문 전송 후 즉시 반환 (체결 확인은 백그라운드에서 진행)
+
+        Args:
+            symbol: 종목 심볼
+            amount: 매도 수량
+            request_price: 주문 가격
+            client_key: 클라이언트 주문 키 (같은 키는 한 번만 접수, None이면 호출마다 새 키)
+
+        Returns:
+            Future: 체결 시 TradeResult, 실패 시 None으로 완료
+        """
+        ...
+
+    @abstractmethod
+    def buy_request_only_odno(
+        self, symbol: str, amount: float, request_price: float, client_key: Optional[str] = None
+    ) -> Optional[str]:
         """
         매수 주문만 (주문번호만 반환, TWAP용)
 
@@ -111,6 +201,7 @@ class ExchangeRepository(ABC):
             symbol: 종목 심볼
             amount: 매수 수량
             request_price: 주문 가격
+            client_key: 클라이언트 주문 키 (같은 키는 한 번만 접수, None이면 호출마다 새 키)
 
         Returns:
             str: 주문번호 (ODNO), 실패 시 None
@@ -118,7 +209,9 @@ class ExchangeRepository(ABC):
         ...
 
     @abstractmethod
-    def sell_request_only_odno(self, symbol: str, amount: float, request_price: float) -> Optional[str]:
+    def sell_request_only_odno(
+        self, symbol: str, amount: float, request_price: float, client_key: Optional[str] = None
+    ) -> Optional[str]:
         """
         매도 주문만 (주문번호만 반환, TWAP용)
 
@@ -126,6 +219,7 @@ class ExchangeRepository(ABC):
             symbol: 종목 심볼
             amount: 매도 수량
             request_price: 주문 가격
+            client_key: 클라이언트 주문 키 (같은 키는 한 번만 접수, None이면 호출마다 새 키)
 
         Returns:
             str: 주문번호 (ODNO), 실패 시 None
@@ -186,3 +280,48 @@ class ExchangeRepository(ABC):
             List[TickerItem]: 티커별 잔고 정보
         """
         ...
+
+    # === 상태 조회 ===
+
+    @abstractmethod
+    def is_available(self) -> bool:
+        """
+        증권사 API 호출 가능 여부 (장애로 차단 중이면 False)
+
+        스케줄러가 작업 실행 전에 확인하여 차단 중에는 작업을 건너뜀
+
+        Returns:
+            bool: 호출 가능 여부
+        """
+        ...
+
+    # === 사전 준비 ===
+
+    @abstractmethod
+    def warm_up(self, symbols: Iterable[str]) -> Dict[str, Optional[float]]:
+        """
+        거래 시작 전 사전 준비 (토큰 갱신, 커넥션 연결, 시세/거래소 코드 적재)
+
+        첫 거래 작업이 토큰 발급, DNS/TLS 연결 비용을 떠안지 않도록 미리 수행
+
+        Args:
+            symbols: 시세를 미리 조회할 종목 목록
+
+        Returns:
+            Dict[str, Optional[float]]: 단계 이름 → 소요 시간 (ms, 실패한 단계는 None)
+        """
+        ...
+
+    # === 체결 원장 ===
+
+    @abstractmethod
+    def sync_fills(self) -> int:
+        """
+        증권사 체결 내역을 체결 원장에 증분 동기화
+
+        마지막으로 기록된 체결 이후의 신규/변경 체결만 조회하여 기록
+
+        Returns:
+            int: 새로 기록되거나 갱신된 체결 수
+        """
+        ...
@@ -0,0 +1,34 @@
+"""Fill Ledger Repository Interface"""
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional
+
+from domain.entities.fill import Fill
+
+
+class FillLedgerRepository(ABC):
+    """체결 원장 저장소 인터페이스"""
+
+    @abstractmethod
+    def upsert_all(self, fills: List[Fill]) -> int:
+        """체결 저장 (신규 삽입 또는 체결 수량 갱신), 변경된 건수 반환"""
+        pass
+
+    @abstractmethod
+    def find_by_odnos(self, odnos: Iterable[str], since: str) -> List[Fill]:
+        """since(YYYYMMDD) 이후 주문 중 주문번호로 조회 (같은 번호는 최근 주문일 우선)"""
+        pass
+
+    @abstractmethod
+    def find_since(self, since: str) -> List[Fill]:
+        """since(YYYYMMDD) 이후 체결 전체 조회 (주문 순서)"""
+        pass
+
+    @abstractmethod
+    def find_open(self, since: str) -> List[Fill]:
+        """since(YYYYMMDD) 이후 미체결 수량이 남은 체결 조회"""
+        pass
+
+    @abstractmethod
+    def find_latest(self, since: str) -> Optional[Fill]:
+        """since(YYYYMMDD) 이후 마지막으로 기록된 체결 조회 (증분 동기화 기준점)"""
+        pass
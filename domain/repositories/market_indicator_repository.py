@@ -37,6 +37,20 @@ class MarketIndicatorRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def prefetch(self, tickers: List[str], cache_hours: int = 6) -> Dict[str, bool]:
+        """
+        여러 티커의 시세 캐시를 한 번에 갱신 (만료/없는 티커만 일괄 다운로드)
+
+        Args:
+            tickers: 종목 심볼 목록
+            cache_hours: 캐시 유효 시간 (시간 단위, 기본 6시간)
+
+        Returns:
+            Dict[str, bool]: 티커 → 캐시 준비 여부
+        """
+        pass
+
     @abstractmethod
     def clear_cache(self, tickers: List[str]) -> List[str]:
         """
@@ -5,6 +5,7 @@ from domain.value_objects.trade_result import TradeResult
 from domain.value_objects.order_type import OrderType
 from domain.value_objects.netting_pair import NettingPair
 from domain.value_objects.indicator_level import IndicatorLevel
+from domain.value_objects.quote_snapshot import QuoteSnapshot
 
 __all__ = [
     'PointLoc',
@@ -13,4 +14,5 @@ __all__ = [
     'OrderType',
     'NettingPair',
     'IndicatorLevel',
+    'QuoteSnapshot',
 ]
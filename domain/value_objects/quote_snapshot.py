@@ -0,0 +1,46 @@
+"""QuoteSnapshot Value Object - 시세 스냅샷"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class QuoteSnapshot:
+    """
+    시세 스냅샷 (1회 조회 결과)
+
+    현재가/전일 종가/호가를 한 번의 API 호출로 받아 함께 보관하여
+    같은 판단에 필요한 가격들을 추가 호출 없이 사용하도록 하는 Value Object.
+
+    Attributes:
+        symbol: 종목 심볼
+        last: 현재가 (조회 실패 시 None)
+        base: 전일 종가 (조회 실패 시 None)
+        bid: 매수 1호가 (제공되지 않는 경우 None)
+        ask: 매도 1호가 (제공되지 않는 경우 None)
+        timestamp: 조회 시각
+    """
+    symbol: str
+    last: Optional[float]
+    base: Optional[float]
+    bid: Optional[float] = None
+    ask: Optional[float] = None
+    timestamp: datetime = field(default_factory=datetime.now)
+
+    @property
+    def drop_ratio(self) -> Optional[float]:
+        """전일 종가 대비 하락률 (소수, 상승 시 음수)"""
+        if not self.last or not self.base:
+            return None
+        return (self.base - self.last) / self.base
+
+    @property
+    def age_seconds(self) -> float:
+        """조회 후 경과 시간 (초)"""
+        return (datetime.now() - self.timestamp).total_seconds()
+
+    def __repr__(self) -> str:
+        return (
+            f"QuoteSnapshot(symbol={self.symbol}, last={self.last}, base={self.base}, "
+            f"bid={self.bid}, ask={self.ask}, timestamp={self.timestamp:%H:%M:%S})"
+        )
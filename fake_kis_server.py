@@ -0,0 +1,481 @@
+"""한투(KIS) 오픈API 로컬 대역 서버
+
+실서버 없이 토큰/현재가/주문/체결내역/잔고 요청 경로 전체를 실행하고 측정하기 위한
+HTTP 대역 서버. 표준 라이브러리만 사용한다.
+
+지원 엔드포인트:
+- POST /oauth2/tokenP                                          토큰 발급
+- GET  /uapi/overseas-price/v1/quotations/price                현재가 (HHDFS00000300)
+- POST /uapi/overseas-stock/v1/trading/order                   매수/매도 주문 (TTTT1002U/TTTT1006U)
+- GET  /uapi/overseas-stock/v1/trading/inquire-ccnl            체결 내역 (TTTS3035R, 연속 조회 지원)
+- GET  /uapi/overseas-stock/v1/trading/inquire-balance         잔고 (TTTS3012R)
+- GET  /uapi/overseas-stock/v1/trading/inquire-psamount        매수 가능 금액 (TTTS3007R)
+- GET  /uapi/overseas-stock/v1/trading/inquire-paymt-stdr-balance  결제기준 잔고 (CTRP6010R)
+
+장애 주입:
+- latency/jitter: 응답 지연
+- fill_delay/partial_ratio: 체결 지연 및 부분 체결
+- rate_limit: 초당 요청 한도 초과 시 EGW00201 (500)
+- token_ttl: 발급 후 N초가 지난 토큰은 EGW00123 (500) → 클라이언트 토큰 갱신 경로 실행
+- token_issue_interval: 토큰 재발급 간격 제한 위반 시 EGW00133 (403)
+- lost_response_ratio: 주문은 접수하고 응답만 500으로 유실 → 클라이언트 재전송/대조 경로 실행
+
+실행: python fake_kis_server.py [--port 9443] [--latency 0.05] [--fill-delay 0.3] ...
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+import pytz
+
+KST = pytz.timezone("Asia/Seoul")
+
+TOKEN_PATH = "/oauth2/tokenP"
+PRICE_PATH = "/uapi/overseas-price/v1/quotations/price"
+ORDER_PATH = "/uapi/overseas-stock/v1/trading/order"
+CCNL_PATH = "/uapi/overseas-stock/v1/trading/inquire-ccnl"
+BALANCE_PATH = "/uapi/overseas-stock/v1/trading/inquire-balance"
+PSAMOUNT_PATH = "/uapi/overseas-stock/v1/trading/inquire-psamount"
+PAYMT_BALANCE_PATH = "/uapi/overseas-stock/v1/trading/inquire-paymt-stdr-balance"
+SEARCH_INFO_PATH = "/uapi/overseas-price/v1/quotations/search-info"
+
+# 상품기본정보 상품유형코드 → 거래소 코드
+PRODUCT_TYPE_EXCHANGES = {"512": "NASD", "513": "NYSE", "529": "AMEX"}
+
+DEFAULT_PRICES = {"TQQQ": 52.33, "SOXL": 40.46, "LABU": 15.0, "QQQ": 400.0, "UPRO": 90.0}
+
+
+@dataclass
+class FakeKisConfig:
+    """대역 서버 동작 설정"""
+    latency: float = 0.0              # 기본 응답 지연 (초)
+    jitter: float = 0.0               # 추가 무작위 지연 상한 (초)
+    fill_delay: float = 0.3           # 주문 후 체결까지 걸리는 시간 (초)
+    partial_ratio: float = 1.0        # 첫 체결 시 체결 비율 (1.0이면 전량, 나머지는 fill_delay 후 추가 체결)
+    rate_limit: int = 0               # 초당 요청 한도 (0이면 제한 없음)
+    token_ttl: float = 0.0            # 서버 측 토큰 유효 시간 (초, 0이면 만료 없음)
+    token_issue_interval: float = 0.0  # 토큰 재발급 최소 간격 (초, 0이면 제한 없음)
+    lost_response_ratio: float = 0.0  # 주문 접수 후 응답을 500으로 돌려줄 비율 (0~1)
+    page_size: int = 100              # 체결 내역 1페이지 행 수
+    initial_cash: float = 100000.0    # 초기 주문 가능 금액 (USD)
+    prices: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_PRICES))
+    listings: Dict[str, str] = field(default_factory=dict)  # 종목 → 상장 거래소 (없으면 가격표 종목은 NASD)
+
+
+@dataclass
+class _FakeOrder:
+    odno: str
+    symbol: str
+    side: str          # "01" 매도, "02" 매수
+    qty: int
+    price: float
+    submitted_at: float
+    # 한투 서버 기준 주문 시각 (KST, dmst_ord_dt/thco_ord_tmd)
+    ordered_at: datetime = field(default_factory=lambda: datetime.now(KST))
+
+    def filled_qty(self, now: float, config: FakeKisConfig) -> int:
+        """현재 시각 기준 누적 체결 수량"""
+        elapsed = now - self.submitted_at
+        if elapsed < config.fill_delay:
+            return 0
+        if config.partial_ratio >= 1.0 or elapsed >= config.fill_delay * 2:
+            return self.qty
+        return max(1, int(self.qty * config.partial_ratio))
+
+
+class FakeKisState:
+    """대역 서버 상태 (토큰, 주문, 요청 통계)"""
+
+    def __init__(self, config: FakeKisConfig):
+        self.config = config
+        self.lock = threading.Lock()
+        self.tokens: Dict[str, float] = {}
+        self.last_token_issued = 0.0
+        self.orders: Dict[str, _FakeOrder] = {}
+        self.next_odno = 1
+        self.recent_requests = deque()
+        self.counts = Counter()
+
+    def count(self, key: str) -> None:
+        with self.lock:
+            self.counts[key] += 1
+
+    def is_rate_limited(self) -> bool:
+        """초당 요청 한도 초과 여부 (슬라이딩 1초 윈도우)"""
+        if self.config.rate_limit <= 0:
+            return False
+        now = time.monotonic()
+        with self.lock:
+            while self.recent_requests and now - self.recent_requests[0] >= 1.0:
+                self.recent_requests.popleft()
+            if len(self.recent_requests) >= self.config.rate_limit:
+                return True
+            self.recent_requests.append(now)
+            return False
+
+    def issue_token(self) -> Optional[str]:
+        now = time.monotonic()
+        with self.lock:
+            interval = self.config.token_issue_interval
+            if interval and self.last_token_issued and now - self.last_token_issued < interval:
+                return None
+            self.last_token_issued = now
+            token = f"FAKE-TOKEN-{len(self.tokens) + 1}"
+            self.tokens[token] = now
+            return token
+
+    def is_token_valid(self, token: str) -> bool:
+        with self.lock:
+            issued = self.tokens.get(token)
+        if issued is None:
+            return False
+        return not self.config.token_ttl or time.monotonic() - issued < self.config.token_ttl
+
+    def place_order(self, symbol: str, side: str, qty: int, price: float) -> str:
+        with self.lock:
+            odno = f"{self.next_odno:010d}"
+            self.next_odno += 1
+            self.orders[odno] = _FakeOrder(odno, symbol, side, qty, price, time.monotonic())
+            return odno
+
+    def positions(self):
+        """종목별 보유 수량과 남은 현금 (체결분 기준)"""
+        now = time.monotonic()
+        holdings = Counter()
+        cash = self.config.initial_cash
+        with self.lock:
+            orders = list(self.orders.values())
+        for order in orders:
+            filled = order.filled_qty(now, self.config)
+            if order.side == "02":
+                holdings[order.symbol] += filled
+                cash -= filled * order.price
+            else:
+                holdings[order.symbol] -= filled
+                cash += filled * order.price
+        return holdings, cash
+
+
+class FakeKisHandler(BaseHTTPRequestHandler):
+    """KIS 오픈API 흉내 핸들러"""
+    protocol_version = "HTTP/1.1"  # keep-alive 지원
+    state: FakeKisState = None
+
+    # ===== 라우팅 =====
+
+    def do_POST(self):
+        path = urlparse(self.path).path
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}") if length else {}
+        self._delay()
+
+        if path == TOKEN_PATH:
+            return self._token()
+        if not self._check_common():
+            return
+        if path == ORDER_PATH:
+            return self._order(body)
+        self._send(404, {"rt_cd": "1", "msg_cd": "NOTFOUND", "msg1": path})
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        params = {k: v[0] for k, v in parse_qs(parsed.query, keep_blank_values=True).items()}
+        self._delay()
+
+        if not self._check_common():
+            return
+        handlers = {
+            PRICE_PATH: self._price,
+            CCNL_PATH: self._ccnl,
+            BALANCE_PATH: self._balance,
+            PSAMOUNT_PATH: self._psamount,
+            PAYMT_BALANCE_PATH: self._paymt_balance,
+            SEARCH_INFO_PATH: self._search_info,
+        }
+        handler = handlers.get(parsed.path)
+        if handler is None:
+            return self._send(404, {"rt_cd": "1", "msg_cd": "NOTFOUND", "msg1": parsed.path})
+        handler(params)
+
+    def log_message(self, format, *args):
+        pass
+
+    # ===== 공통 처리 =====
+
+    def _delay(self):
+        config = self.state.config
+        wait = config.latency + (random.uniform(0, config.jitter) if config.jitter else 0)
+        if wait > 0:
+            time.sleep(wait)
+
+    def _check_common(self) -> bool:
+        """속도 제한/토큰 검사 (실패 시 에러 응답 후 False)"""
+        self.state.count(self.headers.get("tr_id") or "unknown")
+
+        if self.state.is_rate_limited():
+            self.state.count("EGW00201")
+            self._send(500, {"rt_cd": "1", "msg_cd": "EGW00201", "msg1": "초당 거래건수를 초과하였습니다."})
+            return False
+
+        token = (self.headers.get("authorization") or "").replace("Bearer ", "")
+        if not self.state.is_token_valid(token):
+            self.state.count("EGW00123")
+            self._send(500, {"rt_cd": "1", "msg_cd": "EGW00123", "msg1": "기간이 만료된 token 입니다."})
+            return False
+        return True
+
+    def _send(self, status: int, payload: dict, headers: Optional[Dict[str, str]] = None):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    @staticmethod
+    def _ok(**payload) -> dict:
+        return {"rt_cd": "0", "msg_cd": "MCA00000", "msg1": "정상처리 되었습니다.", **payload}
+
+    def _price_of(self, symbol: str) -> float:
+        return self.state.config.prices.get(symbol, 100.0)
+
+    # ===== 엔드포인트 =====
+
+    def _token(self):
+        self.state.count("tokenP")
+        token = self.state.issue_token()
+        if token is None:
+            return self._send(403, {"error_code": "EGW00133", "error_description": "접근토큰 발급 잠시 후 다시 시도하세요(1분당 1회)"})
+        expired = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S")
+        self._send(200, {
+            "access_token": token,
+            "token_type": "Bearer",
+            "expires_in": 86400,
+            "access_token_token_expired": expired,
+        })
+
+    def _price(self, params: dict):
+        symbol = params.get("SYMB", "")
+        last = self._price_of(symbol)
+        base = round(last * 1.01, 2)
+        self._send(200, self._ok(output={
+            "rsym": f"D{params.get('EXCD', 'NAS')}{symbol}", "zdiv": "4", "base": f"{base}",
+            "pvol": "0", "last": f"{last}", "sign": "5", "diff": f"{base - last:.2f}",
+            "rate": "-0.99", "tvol": "0", "tamt": "0", "ordy": "매수가능"
+        }))
+
+    def _order(self, body: dict):
+        side = "02" if self.headers.get("tr_id") == "TTTT1002U" else "01"
+        odno = self.state.place_order(
+            symbol=body.get("PDNO", ""),
+            side=side,
+            qty=int(body.get("ORD_QTY") or 0),
+            price=float(body.get("OVRS_ORD_UNPR") or 0) or self._price_of(body.get("PDNO", ""))
+        )
+        if random.random() < self.state.config.lost_response_ratio:
+            # 접수는 되었지만 응답이 유실된 상황 (게이트웨이 오류)
+            self.state.count("lost_response")
+            return self._send(500, {"rt_cd": "1", "msg_cd": "EGW00500", "msg1": "시스템 오류입니다."})
+        self._send(200, self._ok(output={"KRX_FWDG_ORD_ORGNO": "01790", "ODNO": odno, "ORD_TMD": datetime.now().strftime("%H%M%S")}))
+
+    def _ccnl(self, params: dict):
+        config = self.state.config
+        symbol = params.get("PDNO", "%")
+        side = params.get("SLL_BUY_DVSN", "00")
+        # "00": 전체 주문(미체결 포함), 그 외: 체결된 주문만
+        include_open = params.get("CCLD_NCCS_DVSN") == "00"
+        now = time.monotonic()
+        with self.state.lock:
+            orders = sorted(self.state.orders.values(), key=lambda o: o.odno, reverse=True)
+
+        rows = []
+        for order in orders:
+            if symbol not in ("%", "", order.symbol) or side not in ("00", "", order.side):
+                continue
+            filled = order.filled_qty(now, config)
+            if filled <= 0 and not include_open:
+                continue
+            rows.append(self._ccnl_row(order, filled))
+
+        offset = int(params.get("CTX_AREA_NK200") or 0)
+        page = rows[offset:offset + config.page_size]
+        has_more = offset + config.page_size < len(rows)
+        next_key = str(offset + config.page_size) if has_more else ""
+        self._send(
+            200,
+            self._ok(ctx_area_nk200=next_key, ctx_area_fk200=next_key, output=page),
+            headers={"tr_cont": "M" if has_more else "D"}
+        )
+
+    @staticmethod
+    def _ccnl_row(order: _FakeOrder, filled: int) -> dict:
+        today = datetime.now().strftime("%Y%m%d")
+        ordered_date, ordered_time = order.ordered_at.strftime("%Y%m%d"), order.ordered_at.strftime("%H%M%S")
+        return {
+            "ord_dt": today, "ord_gno_brno": "01790", "odno": order.odno, "orgn_odno": "",
+            "sll_buy_dvsn_cd": order.side, "sll_buy_dvsn_cd_name": "매수" if order.side == "02" else "매도",
+            "rvse_cncl_dvsn": "00", "rvse_cncl_dvsn_name": "", "pdno": order.symbol, "prdt_name": order.symbol,
+            "ft_ord_qty": str(order.qty), "ft_ord_unpr3": f"{order.price}",
+            "ft_ccld_qty": str(filled), "ft_ccld_unpr3": f"{order.price if filled else 0}",
+            "ft_ccld_amt3": f"{filled * order.price:.2f}", "nccs_qty": str(order.qty - filled),
+            "prcs_stat_name": "완료" if filled == order.qty else ("부분체결" if filled else "접수"), "rjct_rson": "", "rjct_rson_name": "",
+            "ord_tmd": "000000", "tr_mket_name": "나스닥", "tr_crcy_cd": "USD", "tr_natn": "840",
+            "ovrs_excg_cd": "NASD", "tr_natn_name": "미국", "dmst_ord_dt": ordered_date, "thco_ord_tmd": ordered_time,
+            "loan_type_cd": "10", "loan_dt": "", "mdia_dvsn_name": "OpenAPI", "usa_amk_exts_rqst_yn": "N",
+            "splt_buy_attr_name": ""
+        }
+
+    def _balance(self, params: dict):
+        holdings, _ = self.state.positions()
+        output1 = []
+        for symbol, qty in holdings.items():
+            if qty <= 0:
+                continue
+            price = self._price_of(symbol)
+            output1.append({
+                "cano": "00000000", "acnt_prdt_cd": "01", "prdt_type_cd": "512", "ovrs_pdno": symbol,
+                "ovrs_item_name": symbol, "frcr_evlu_pfls_amt": "0", "evlu_pfls_rt": "0",
+                "pchs_avg_pric": f"{price}", "ovrs_cblc_qty": str(qty), "ord_psbl_qty": str(qty),
+                "frcr_pchs_amt1": f"{qty * price:.2f}", "ovrs_stck_evlu_amt": f"{qty * price:.2f}",
+                "now_pric2": f"{price}", "tr_crcy_cd": "USD", "ovrs_excg_cd": "NASD",
+                "loan_type_cd": "10", "loan_dt": "", "expd_dt": ""
+            })
+        output2 = {key: "0" for key in (
+            "frcr_pchs_amt1", "ovrs_rlzt_pfls_amt", "ovrs_tot_pfls", "rlzt_erng_rt", "tot_evlu_pfls_amt",
+            "tot_pftrt", "frcr_buy_amt_smtl1", "ovrs_rlzt_pfls_amt2", "frcr_buy_amt_smtl2"
+        )}
+        self._send(200, self._ok(ctx_area_fk200="", ctx_area_nk200="", output1=output1, output2=output2))
+
+    def _psamount(self, params: dict):
+        _, cash = self.state.positions()
+        price = float(params.get("OVRS_ORD_UNPR") or 1) or 1.0
+        qty = str(int(cash // price))
+        self._send(200, self._ok(output={
+            "tr_crcy_cd": "USD", "ord_psbl_frcr_amt": f"{cash:.2f}", "sll_ruse_psbl_amt": "0",
+            "ovrs_ord_psbl_amt": f"{cash:.2f}", "max_ord_psbl_qty": qty, "echm_af_ord_psbl_amt": "0",
+            "echm_af_ord_psbl_qty": "0", "ord_psbl_qty": qty, "exrt": "1400.0",
+            "frcr_ord_psbl_amt1": f"{cash:.2f}", "ovrs_max_ord_psbl_qty": qty
+        }))
+
+    def _paymt_balance(self, params: dict):
+        holdings, cash = self.state.positions()
+        output1 = []
+        for symbol, qty in holdings.items():
+            if qty <= 0:
+                continue
+            price = self._price_of(symbol)
+            output1.append({
+                "pdno": symbol, "prdt_name": symbol, "cblc_qty13": str(qty), "ord_psbl_qty1": str(qty),
+                "avg_unpr3": f"{price}", "ovrs_now_pric1": f"{price}", "frcr_pchs_amt": f"{qty * price:.2f}",
+                "frcr_evlu_amt2": f"{qty * price:.2f}", "evlu_pfls_amt2": "0", "bass_exrt": "1400.0",
+                "oprt_dtl_dtime": "", "buy_crcy_cd": "USD", "thdt_sll_ccld_qty1": "0",
+                "thdt_buy_ccld_qty1": "0", "evlu_pfls_rt1": "0", "tr_mket_name": "나스닥",
+                "natn_kor_name": "미국", "std_pdno": symbol, "mgge_qty": "0", "loan_rmnd": "0",
+                "prdt_type_cd": "512", "ovrs_excg_cd": "NASD", "scts_dvsn_name": "", "ldng_cblc_qty": "0"
+            })
+        output2 = [{
+            "crcy_cd": "USD", "crcy_cd_name": "미국 달러", "frcr_dncl_amt_2": f"{cash:.2f}",
+            "frst_bltn_exrt": "1400.0", "frcr_evlu_amt2": f"{cash:.2f}"
+        }]
+        output3 = {key: "0" for key in (
+            "pchs_amt_smtl_amt", "tot_evlu_pfls_amt", "evlu_erng_rt1", "tot_dncl_amt", "wcrc_evlu_amt_smtl",
+            "tot_asst_amt2", "frcr_cblc_wcrc_evlu_amt_smtl", "tot_loan_amt", "tot_ldng_evlu_amt"
+        )}
+        self._send(200, self._ok(output1=output1, output2=output2, output3=output3))
+
+    def _search_info(self, params: dict):
+        symbol = params.get("PDNO", "")
+        config = self.state.config
+        listed = config.listings.get(symbol) or ("NASD" if symbol in config.prices else None)
+        if listed is None or PRODUCT_TYPE_EXCHANGES.get(params.get("PRDT_TYPE_CD")) != listed:
+            return self._send(200, self._ok(output={}))
+        self._send(200, self._ok(output={
+            "std_pdno": symbol, "prdt_eng_name": symbol, "natn_cd": "840", "ovrs_excg_cd": listed,
+            "tr_crcy_cd": "USD", "prdt_type_cd": params.get("PRDT_TYPE_CD"), "lstg_yn": "Y"
+        }))
+
+
+class FakeKisServer:
+    """백그라운드 스레드에서 동작하는 대역 서버"""
+
+    def __init__(self, config: Optional[FakeKisConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        """
+        Args:
+            config: 동작 설정 (None이면 기본값)
+            host: 바인드 주소
+            port: 포트 (0이면 빈 포트 자동 할당)
+        """
+        self.state = FakeKisState(config or FakeKisConfig())
+        handler = type("BoundFakeKisHandler", (FakeKisHandler,), {"state": self.state})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """HANTOO_API_URL로 사용할 서버 주소"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeKisServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-kis", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def stats(self) -> Dict[str, int]:
+        """tr_id/에러 코드별 요청 수"""
+        with self.state.lock:
+            return dict(self.state.counts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="한투(KIS) 오픈API 로컬 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9443)
+    parser.add_argument("--latency", type=float, default=0.0, help="기본 응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="추가 무작위 지연 상한 (초)")
+    parser.add_argument("--fill-delay", type=float, default=0.3, help="체결 지연 (초)")
+    parser.add_argument("--partial-ratio", type=float, default=1.0, help="첫 체결 비율 (0~1)")
+    parser.add_argument("--rate-limit", type=int, default=0, help="초당 요청 한도 (0이면 제한 없음)")
+    parser.add_argument("--token-ttl", type=float, default=0.0, help="서버 측 토큰 유효 시간 (초)")
+    parser.add_argument("--token-issue-interval", type=float, default=0.0, help="토큰 재발급 최소 간격 (초)")
+    parser.add_argument("--lost-response-ratio", type=float, default=0.0, help="주문 응답 유실 비율 (0~1)")
+    args = parser.parse_args()
+
+    config = FakeKisConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        fill_delay=args.fill_delay,
+        partial_ratio=args.partial_ratio,
+        rate_limit=args.rate_limit,
+        token_ttl=args.token_ttl,
+        token_issue_interval=args.token_issue_interval,
+        lost_response_ratio=args.lost_response_ratio,
+    )
+    server = FakeKisServer(config, host=args.host, port=args.port)
+    print(f"🧪 KIS 대역 서버 실행: {server.url} (Ctrl+C로 종료)")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+        print(f"📊 요청 통계: {server.stats()}")
+
+
+if __name__ == '__main__':
+    main()
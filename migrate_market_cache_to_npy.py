@@ -0,0 +1,42 @@
+"""
+Migration: data/market_cache/{ticker}.csv → 컬럼 저장소 ({ticker}/*.npy)
+
+MarketDataClient는 CSV만 남아 있는 티커를 처음 읽을 때 자동 변환하지만,
+이 스크립트로 한 번에 미리 변환할 수 있다. 변환된 CSV는 {ticker}.csv.migrated로 이름이 바뀐다.
+
+실행: python migrate_market_cache_to_npy.py
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from data.external.market_data.market_bar_store import MarketBarStore
+from data.external.market_data.market_data_client import DATA_DIR
+
+
+def main():
+    print(f"📂 경로: {DATA_DIR}")
+    csv_files = sorted(name for name in os.listdir(DATA_DIR) if name.endswith(".csv"))
+    if not csv_files:
+        print("✅ 변환할 CSV 파일이 없습니다.")
+        return
+
+    store = MarketBarStore(DATA_DIR)
+    converted = 0
+    for name in csv_files:
+        ticker = name[:-len(".csv")]
+        # 웹/스케줄러가 실행 중이어도 같은 티커를 동시에 쓰지 않도록 잠금
+        with store.lock(ticker):
+            ok = store.convert_csv(ticker, os.path.join(DATA_DIR, name))
+        if ok:
+            print(f"  ✅ {ticker}")
+            converted += 1
+        else:
+            print(f"  ❌ {ticker} 변환 실패")
+
+    print(f"\n🎉 변환 완료: {converted}/{len(csv_files)}")
+
+
+if __name__ == '__main__':
+    main()
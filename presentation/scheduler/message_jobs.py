@@ -184,18 +184,48 @@ class MessageJobs:
             import traceback
             traceback.print_exc()
 
+    def send_recent_fill_message(self) -> None:
+        """
+        최근 체결 요약을 텔레그램으로 전송 (체결 원장 기준)
+        """
+        print("📨 체결 요약 메시지 전송...")
+
+        try:
+            fill_data = self.portfolio_usecase.get_recent_fills()
+
+            if not fill_data["count"]:
+                print("⚠️ 최근 체결 없음")
+                return
+
+            details_msg = ""
+            for summary in fill_data["symbols"]:
+                details_msg += (
+                    f"[{summary['symbol']}] "
+                    f"매수 {summary['buy_qty']:,.0f}주(${summary['buy_amount']:,.2f}) / "
+                    f"매도 {summary['sell_qty']:,.0f}주(${summary['sell_amount']:,.2f})\n"
+                )
+
+            self.message_repo.send_message(f"🧾 최근 체결 {fill_data['count']}건\n\n{details_msg}")
+            print(f"✅ 체결 요약 메시지 전송 완료 ({fill_data['count']}건)")
+
+        except Exception as e:
+            print(f"❌ 체결 요약 메시지 전송 실패: {str(e)}")
+            import traceback
+            traceback.print_exc()
+
     # ========================================
     # 통합 메서드
     # ========================================
 
     def send_all_status(self) -> None:
         """
-        모든 상태 메시지 전송 (거래 상태 + 포트폴리오 요약 + 오늘 수익)
+        모든 상태 메시지 전송 (거래 상태 + 포트폴리오 요약 + 오늘 수익 + 체결 요약)
         """
         print("📨 모든 상태 메시지 전송...")
         self.send_trade_status_message()
         self.send_portfolio_summary_message()
         self.send_today_profit_message()
+        self.send_recent_fill_message()
         print("✅ 모든 상태 메시지 전송 완료")
 
     def daily_job(self) -> None:
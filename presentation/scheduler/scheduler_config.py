@@ -12,7 +12,7 @@ from apscheduler.triggers.cron import CronTrigger
 import pytz
 
 from config import item
-from config.util import get_schedule_times, is_trade_date
+from config.util import get_schedule_times, get_warmup_times, is_trade_date
 from config.dependencies import get_dependencies
 from presentation.scheduler.trading_jobs import TradingJobs
 from presentation.scheduler.message_jobs import MessageJobs
@@ -21,6 +21,7 @@ from usecase.trading_usecase import TradingUsecase
 from usecase.portfolio_status_usecase import PortfolioStatusUsecase
 from usecase.bot_management_usecase import BotManagementUsecase
 from usecase.market_usecase import MarketUsecase
+from usecase.warmup_usecase import WarmupUsecase
 
 # KST 시간대 명시 (서버 다른 프로그램과 충돌 방지)
 KST = pytz.timezone('Asia/Seoul')
@@ -73,6 +74,13 @@ def _initialize_dependencies() -> tuple[TradingJobs, MessageJobs]:
         market_usecase=market_usecase,
     )
 
+    warmup_usecase = WarmupUsecase(
+        bot_info_repo=deps.bot_info_repo,
+        trade_repo=deps.trade_repo,
+        order_repo=deps.order_repo,
+        exchange_repo=deps.exchange_repo,
+    )
+
     # TradingJobs 초기화
     trading_jobs = TradingJobs(
         order_usecase=order_usecase,
@@ -81,6 +89,9 @@ def _initialize_dependencies() -> tuple[TradingJobs, MessageJobs]:
         bot_info_repo=deps.bot_info_repo,
         order_repo=deps.order_repo,
         message_repo=deps.message_repo,
+        exchange_repo=deps.exchange_repo,
+        warmup_usecase=warmup_usecase,
+        market_usecase=market_usecase,
     )
 
     # MessageJobs 초기화
@@ -89,6 +100,7 @@ def _initialize_dependencies() -> tuple[TradingJobs, MessageJobs]:
         trade_repo=deps.trade_repo,
         history_repo=deps.history_repo,
         exchange_repo=deps.exchange_repo,
+        fill_ledger_repo=deps.fill_ledger_repo,
     )
 
     message_jobs = MessageJobs(
@@ -123,6 +135,44 @@ def _create_make_order_job(trading_jobs: TradingJobs):
     return make_order_job_impl
 
 
+def _create_warmup_job(trading_jobs: TradingJobs):
+    """사전 준비 작업 팩토리 (클로저)"""
+
+    def warmup_job_impl():
+        deps = get_dependencies()
+        print(f"\n🔥 warmup_job() called at {datetime.now()}")
+
+        try:
+            # 거래일 확인은 사전 준비 단계(calendar)에서 수행 (캘린더 첫 로딩 시간 측정)
+            trading_jobs.warmup_job()
+        except Exception as e:
+            # 사전 준비 실패는 거래에 영향이 없으므로 알림만 보내고 스케줄러는 유지
+            deps.message_repo.send_message(f"⚠️ [warmup_job] 사전 준비 중 문제가 발생하였습니다.\n{e}")
+
+        print(f"✅ warmup_job() completed at {datetime.now()}\n")
+
+    return warmup_job_impl
+
+
+def _create_market_prefetch_job(trading_jobs: TradingJobs):
+    """시세 일괄 갱신 작업 팩토리 (클로저)"""
+
+    def market_prefetch_job_impl():
+        deps = get_dependencies()
+        print(f"\n📈 market_prefetch_job() called at {datetime.now()}")
+
+        try:
+            if is_trade_date():
+                trading_jobs.market_prefetch_job()
+        except Exception as e:
+            # 갱신 실패 시 조회 시점에 개별 다운로드되므로 알림만 보내고 스케줄러는 유지
+            deps.message_repo.send_message(f"⚠️ [market_prefetch_job] 시세 일괄 갱신 중 문제가 발생하였습니다.\n{e}")
+
+        print(f"✅ market_prefetch_job() completed at {datetime.now()}\n")
+
+    return market_prefetch_job_impl
+
+
 def _create_twap_job(trading_jobs: TradingJobs):
     """TWAP 거래 작업 팩토리 (클로저)"""
 
@@ -229,6 +279,9 @@ def start_scheduler():
 
     # 스케줄 시간 설정 (매번 새로 읽음)
     job_times, msg_times, twap_times, closing_buy_times = get_schedule_times()
+    warmup_times = get_warmup_times(job_times, item.WARMUP_LEAD_MINUTES)
+    # 거래 시간이 이르면 둘 다 00:00으로 당겨지므로 시장 데이터 선조회는 사전 준비와 다른 시간으로 미룸
+    market_prefetch_times = get_warmup_times(job_times, item.MARKET_PREFETCH_LEAD_MINUTES, avoid_times=warmup_times)
 
     # APScheduler 생성 (첫 호출에만)
     if _scheduler is None:
@@ -237,6 +290,8 @@ def start_scheduler():
     # 기존 작업 제거 후 재등록
     _scheduler.remove_all_jobs()
     _register_jobs(_create_msg_job(_message_jobs), msg_times, 'msg_job')
+    _register_jobs(_create_market_prefetch_job(_trading_jobs), market_prefetch_times, 'market_prefetch_job')
+    _register_jobs(_create_warmup_job(_trading_jobs), warmup_times, 'warmup_job')
     _register_jobs(_create_make_order_job(_trading_jobs), job_times, 'trade_job')
     _register_jobs(_create_twap_job(_trading_jobs), twap_times, 'twap_job')
     _register_jobs(_create_closing_buy_job(_trading_jobs), closing_buy_times, 'closing_buy_job')
@@ -4,16 +4,49 @@ egg/main.py의 job(), twap_job() 이관
 - job() → trade_job(): 매매 조건 판단 + 주문서 생성
 - twap_job() → twap_job(): TWAP 주문 실행
 """
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import date
+from typing import Dict, List
 
 from config import item
 from config.util import is_trade_date
 from domain.entities.bot_info import BotInfo
-from domain.repositories import BotInfoRepository, OrderRepository, MessageRepository
+from domain.entities.order import Order
+from domain.repositories import BotInfoRepository, OrderRepository, MessageRepository, ExchangeRepository
 from usecase.bot_management_usecase import BotManagementUsecase
+from usecase.market_usecase import MarketUsecase
 from usecase.order_usecase import OrderUsecase
 from usecase.trading_usecase import TradingUsecase
+from usecase.warmup_usecase import WarmupUsecase
+
+
+class _TwapSlice:
+    """TWAP 1회 실행 단위 (봇 1개의 이번 회차 주문)"""
+
+    __slots__ = ("name", "symbol", "order", "bot_lock", "submitted_at", "started_at", "finished_at", "succeeded")
+
+    def __init__(self, order: Order, bot_lock: threading.Lock, submitted_at: float):
+        self.name = order.name
+        self.symbol = order.symbol
+        self.order = order
+        self.bot_lock = bot_lock
+        self.submitted_at = submitted_at
+        self.started_at = None
+        self.finished_at = None
+        self.succeeded = False
+
+    def describe(self) -> str:
+        """소요 시간 문자열 (종목 락 대기 + 주문 실행)"""
+        queued = self.started_at - self.submitted_at
+        elapsed = self.finished_at - self.started_at
+        return f"[{self.name}] {self.symbol}: 대기 {queued:.1f}s + 실행 {elapsed:.1f}s"
+
+    def batch_key(self) -> tuple:
+        """묶음 주문 기준 (같은 종목 + 같은 매수/매도)"""
+        return self.symbol, self.order.is_buy_order()
 
 
 class TradingJobs:
@@ -30,7 +63,10 @@ class TradingJobs:
         bot_management_usecase: BotManagementUsecase,
         bot_info_repo: BotInfoRepository,
         order_repo: OrderRepository,
-        message_repo: MessageRepository
+        message_repo: MessageRepository,
+        exchange_repo: ExchangeRepository,
+        warmup_usecase: WarmupUsecase,
+        market_usecase: MarketUsecase
     ):
         """
         Args:
@@ -40,6 +76,9 @@ class TradingJobs:
             bot_info_repo: BotInfo 저장소
             order_repo: Order 저장소
             message_repo: 메시지 발송 리포지토리
+            exchange_repo: 증권사 API 리포지토리 (장애 차단 상태 확인용)
+            warmup_usecase: 거래 전 사전 준비 Usecase
+            market_usecase: 시장 데이터 Usecase (시세 일괄 갱신용)
         """
         self.order_usecase = order_usecase
         self.trading_usecase = trading_usecase
@@ -47,6 +86,23 @@ class TradingJobs:
         self.bot_info_repo = bot_info_repo
         self.order_repo = order_repo
         self.message_repo = message_repo
+        self.exchange_repo = exchange_repo
+        self.warmup_usecase = warmup_usecase
+        self.market_usecase = market_usecase
+        # 차단 알림 중복 방지 (차단 중 1회만 발송)
+        self._unavailable_notified = False
+
+        # TWAP 동시 실행: 증권사 호출만 워커 스레드에서 실행, DB 저장은 작업 스레드에서 수행
+        self._twap_executor = ThreadPoolExecutor(
+            max_workers=item.TWAP_MAX_WORKERS, thread_name_prefix="twap-slice"
+        )
+        self._locks_guard = threading.Lock()
+        # 봇별 락: 실행 중(저장 전)인 봇은 다음 회차에서 건너뜀
+        self._bot_locks: Dict[str, threading.Lock] = {}
+        # 종목별 락: 같은 종목 주문은 한 번에 하나씩 (시세/잔고 일관성)
+        self._symbol_locks: Dict[str, threading.Lock] = {}
+        # 기한 내에 끝나지 않아 다음 작업에서 저장할 회차
+        self._late_slices = deque()
 
     def make_order_job(self) -> None:
         """
@@ -59,6 +115,9 @@ class TradingJobs:
         참고: egg/main.py의 job() (121-143번 줄)
         """
 
+        # 이전 TWAP 작업에서 기한을 넘겨 끝난 회차 저장
+        self._persist_late_slices()
+
         # 오래된 주문서 삭제 (전날 미완료 주문 등)
         self._check_and_cleanup_remaining_orders()
 
@@ -175,6 +234,12 @@ class TradingJobs:
         모든 활성 봇에 대해 전일 종가 대비 큰 하락 여부를 체크하고,
         조건 충족 시 단일 매수를 실행합니다.
         """
+        if not self._check_exchange_available("장마감 급락 매수"):
+            return
+
+        # 마지막 TWAP 회차가 기한을 넘겨 끝났다면 여기서 저장
+        self._persist_late_slices()
+
         for bot_info in self.bot_info_repo.find_all():
             if not bot_info.active:
                 continue
@@ -188,25 +253,202 @@ class TradingJobs:
                     f"❌ [{bot_info.name}] 장마감 급락 매수 중 오류: {e}"
                 )
 
+    def warmup_job(self) -> None:
+        """
+        사전 준비 작업 (TRADE_TIME 몇 분 전 실행)
+
+        - 토큰 갱신, 커넥션 연결, 시세 조회, DB 테이블 조회를 미리 수행
+        - 단계별 소요 시간을 출력하고, 실패했거나 느린(WARMUP_SLOW_STEP_MS 초과) 단계가 있을 때만 메시지로 보고
+        """
+        if not self._check_exchange_available("사전 준비"):
+            return
+
+        timings = self.warmup_usecase.warm_up()
+        report = self.warmup_usecase.format_report(timings)
+        print(report)
+
+        problems = self.warmup_usecase.find_problems(timings, item.WARMUP_SLOW_STEP_MS)
+        if problems:
+            self.message_repo.send_message(f"⚠️ 사전 준비 점검 필요: {', '.join(problems)}\n{report}")
+
+    def market_prefetch_job(self) -> None:
+        """
+        시세 일괄 갱신 작업 (TRADE_TIME 몇 분 전 실행)
+
+        - 기본 티커(TQQQ, SOXL, ^VIX) + 활성 봇 종목의 만료된 시세를 yfinance 1회 호출로 갱신
+        - 이후 대시보드/거래 작업의 지표 조회는 캐시에서 바로 응답
+        """
+        symbols = {bot_info.symbol for bot_info in self.bot_info_repo.find_all() if bot_info.active and bot_info.symbol}
+
+        started = time.perf_counter()
+        results = self.market_usecase.prefetch_market_data(symbols)
+        elapsed = time.perf_counter() - started
+
+        failed = [ticker for ticker, ok in results.items() if not ok]
+        print(f"📈 시세 일괄 갱신: {len(results) - len(failed)}/{len(results)}개 준비 ({elapsed:.1f}초)")
+        if failed:
+            self.message_repo.send_message(f"⚠️ 시세 갱신 실패: {', '.join(failed)}")
+
     def twap_job(self) -> None:
         """
         TWAP 거래 작업 (egg/main.py의 twap_job() 이관)
 
-        - 거래일 체크
-        - 활성화된 봇 중 주문서가 있는 봇만 TWAP 실행
+        - 활성화된 봇 중 주문서가 있는 봇의 이번 회차를 워커 풀에서 동시에 실행
+        - 같은 종목/같은 방향 회차는 증권사 주문 1건으로 묶고 체결을 요청 수량 비율로 배분 (TWAP_AGGREGATE)
+        - 같은 종목 주문은 종목 락으로 순서대로 실행, 이전 회차가 아직 실행 중인 봇은 건너뜀
+        - TWAP_JOB_DEADLINE까지 기다린 뒤 끝난 회차를 저장하고 봇별 소요 시간을 출력 (실패/기한 초과 시에만 메시지)
+        - 기한을 넘긴 회차는 끝나는 대로 다음 작업(TWAP/거래/장마감 매수)에서 저장
 
         참고: egg/main.py의 twap_job() (145-162번 줄)
         """
 
+        # 증권사 API 장애로 차단 중이면 이번 회차는 건너뜀 (스레드가 대기 상태로 쌓이지 않도록)
+        if not self._check_exchange_available("TWAP"):
+            return
+
+        # 이전 작업에서 기한을 넘겨 끝난 회차 저장 (주문서 조회 전에 반영)
+        self._persist_late_slices()
+
         # 오래된 주문서 삭제 (전날 미완료 주문 등)
         self._check_and_cleanup_remaining_orders()
 
-        # 활성화된 봇 중 주문서가 있는 봇만 처리
+        # 활성화된 봇 중 주문서가 있는 봇만 처리 (DB 조회는 작업 스레드에서)
+        slices = self._prepare_twap_slices()
+        if not slices:
+            return
+
+        started = time.monotonic()
+        futures: Dict[Future, List[_TwapSlice]] = {
+            self._twap_executor.submit(self._run_twap_batch, batch): batch
+            for batch in self._group_twap_slices(slices)
+        }
+        done, not_done = wait(futures, timeout=item.TWAP_JOB_DEADLINE)
+
+        # 기한 내에 끝난 회차 저장 (실행 순서대로)
+        finished = sorted(
+            (twap_slice for future in done for twap_slice in futures[future]), key=lambda s: s.finished_at
+        )
+        for twap_slice in finished:
+            self._finish_twap_slice(twap_slice)
+
+        # 기한을 넘긴 회차는 끝나면 대기열에 넣어 다음 작업에서 저장
+        late = [twap_slice for future in not_done for twap_slice in futures[future]]
+        for future in not_done:
+            future.add_done_callback(lambda f, batch=futures[future]: self._late_slices.extend(batch))
+
+        self._report_twap_slices(finished, late, time.monotonic() - started)
+
+    def _prepare_twap_slices(self) -> List[_TwapSlice]:
+        """이번 회차를 실행할 봇 선정 + 봇 락 획득 (저장 완료 시 해제)"""
+        slices = []
         for bot_info in self.bot_info_repo.find_all():
             if not bot_info.active:
                 continue
 
-            order = self.order_repo.find_by_name(bot_info.name)
-            if order:
-                # TradingUsecase를 통해 TWAP 주문 1회 실행
-                self.trading_usecase.execute_twap(bot_info)
+            bot_lock = self._get_lock(self._bot_locks, bot_info.name)
+            if not bot_lock.acquire(blocking=False):
+                self.message_repo.send_message(
+                    f"⏳ [{bot_info.name}] 이전 TWAP 회차가 아직 실행 중입니다 - 이번 회차는 건너뜁니다"
+                )
+                continue
+
+            order = None
+            try:
+                # TradingUsecase를 통해 주문서 조회 + 주문 가능 여부 확인
+                order = self.trading_usecase.prepare_twap(bot_info)
+            except Exception as e:
+                self.message_repo.send_message(f"❌ [{bot_info.name}] TWAP 준비 중 오류: {e}")
+            finally:
+                if order is None:
+                    bot_lock.release()
+
+            if order is not None:
+                slices.append(_TwapSlice(order, bot_lock, time.monotonic()))
+        return slices
+
+    @staticmethod
+    def _group_twap_slices(slices: List[_TwapSlice]) -> List[List[_TwapSlice]]:
+        """같은 종목/같은 방향 회차 묶기 (TWAP_AGGREGATE가 꺼져 있으면 회차별 단건)"""
+        if not item.TWAP_AGGREGATE:
+            return [[twap_slice] for twap_slice in slices]
+
+        batches: Dict[tuple, List[_TwapSlice]] = {}
+        for twap_slice in slices:
+            batches.setdefault(twap_slice.batch_key(), []).append(twap_slice)
+        return list(batches.values())
+
+    def _run_twap_batch(self, batch: List[_TwapSlice]) -> None:
+        """워커 스레드: 종목 락을 잡고 묶음 회차를 증권사 주문 1건으로 실행 (DB 접근 없음)"""
+        with self._get_lock(self._symbol_locks, batch[0].symbol):
+            started_at = time.monotonic()
+            succeeded = False
+            try:
+                succeeded = self.trading_usecase.run_aggregated_twap_slice([s.order for s in batch])
+            finally:
+                finished_at = time.monotonic()
+                for twap_slice in batch:
+                    twap_slice.started_at = started_at
+                    twap_slice.finished_at = finished_at
+                    twap_slice.succeeded = succeeded
+
+    def _finish_twap_slice(self, twap_slice: _TwapSlice) -> None:
+        """작업 스레드: 회차 결과 저장 후 봇 락 해제"""
+        try:
+            self.trading_usecase.finish_twap(twap_slice.order, twap_slice.succeeded)
+        except Exception as e:
+            self.message_repo.send_message(f"❌ [{twap_slice.name}] TWAP 결과 저장 중 오류: {e}")
+        finally:
+            twap_slice.bot_lock.release()
+
+    def _persist_late_slices(self) -> None:
+        """기한을 넘겨 끝난 TWAP 회차 저장"""
+        while self._late_slices:
+            twap_slice = self._late_slices.popleft()
+            print(f"🧾 기한 초과 TWAP 회차 저장: {twap_slice.describe()}")
+            self._finish_twap_slice(twap_slice)
+
+    def _report_twap_slices(self, finished: List[_TwapSlice], late: List[_TwapSlice], elapsed: float) -> None:
+        """봇별 회차 소요 시간 출력 (실패/기한 초과 회차가 있을 때만 메시지 전송)"""
+        header = f"⏱️ TWAP 회차 완료 {len(finished)}/{len(finished) + len(late)} (총 {elapsed:.1f}s)"
+        late_lines = [
+            f"  - [{twap_slice.name}] {twap_slice.symbol}: ⌛ 기한({item.TWAP_JOB_DEADLINE:.0f}s) 초과 - 완료 후 다음 작업에서 저장"
+            for twap_slice in late
+        ]
+        print("\n".join([header] + [f"  - {twap_slice.describe()}" for twap_slice in finished] + late_lines))
+
+        failed = [twap_slice for twap_slice in finished if not twap_slice.succeeded]
+        if failed or late:
+            lines = [header] + [f"  - ❌ {twap_slice.describe()}" for twap_slice in failed] + late_lines
+            self.message_repo.send_message("\n".join(lines))
+
+    def _get_lock(self, locks: Dict[str, threading.Lock], key: str) -> threading.Lock:
+        with self._locks_guard:
+            lock = locks.get(key)
+            if lock is None:
+                lock = locks[key] = threading.Lock()
+            return lock
+
+    def _check_exchange_available(self, job_name: str) -> bool:
+        """
+        증권사 API 호출 가능 여부 확인 (차단 중이면 1회만 알림)
+
+        Args:
+            job_name: 작업 이름 (알림 메시지용)
+
+        Returns:
+            bool: 호출 가능 여부
+        """
+        if self.exchange_repo.is_available():
+            if self._unavailable_notified:
+                self.message_repo.send_message("✅ 한투 API 복구 - 작업을 재개합니다")
+                self._unavailable_notified = False
+            return True
+
+        print(f"🚫 한투 API 차단 중 - {job_name} 작업 건너뜀")
+        if not self._unavailable_notified:
+            self.message_repo.send_message(
+                f"🚫 한투 API 연속 실패로 호출 차단 중\n"
+                f"  → {job_name} 작업을 건너뜁니다 (복구 후 자동 재개)"
+            )
+            self._unavailable_notified = True
+        return False
@@ -7,6 +7,7 @@ Overview 서버에서 데이터 Pull용
 """
 from flask import Blueprint, jsonify, request
 
+from config import item
 from config.dependencies import get_dependencies
 from usecase.market_usecase import MarketUsecase
 from usecase.portfolio_status_usecase import PortfolioStatusUsecase
@@ -46,25 +47,31 @@ def _get_balance_data(bot_info_repo, trade_repo, exchange_repo) -> dict:
     total_seed = 0.0
 
     # 각 봇의 거래 정보 수집
+    holdings = []
     for bot_info in bot_info_list:
         # active인 봇의 seed 합산
         if bot_info.active:
             total_seed += bot_info.seed
         trade = trade_repo.find_by_name(bot_info.name)
         if trade and trade.amount > 0:
-            # 현재가 조회
-            current_price = exchange_repo.get_price(trade.symbol)
-
-            stock_items.append({
-                "name": bot_info.name,
-                "ticker": trade.symbol,
-                "amount": trade.amount,
-                "price": trade.purchase_price,
-                "total_price": trade.total_price,
-                "current_price": current_price,
-                "days_until_next": None,
-                "pool": None
-            })
+            holdings.append((bot_info, trade))
+
+    # 현재가 일괄 조회
+    prices = exchange_repo.get_prices(
+        [trade.symbol for _, trade in holdings],
+        max_age=item.DASHBOARD_QUOTE_MAX_AGE
+    )
+    for bot_info, trade in holdings:
+        stock_items.append({
+            "name": bot_info.name,
+            "ticker": trade.symbol,
+            "amount": trade.amount,
+            "price": trade.purchase_price,
+            "total_price": trade.total_price,
+            "current_price": prices.get(trade.symbol),
+            "days_until_next": None,
+            "pool": None
+        })
 
     # RP 추가 (현재가 = 구매가)
     rp_trade = trade_repo.find_by_name("RP")
@@ -0,0 +1,86 @@
+"""HantooFillTracker 부분 체결 처리 검증 (python test_fill_tracker.py 또는 pytest)"""
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from data.external.hantoo.hantoo_fill_tracker import HantooFillTracker
+from domain.entities.fill import Fill
+
+
+def _fill(odno: str, filled: float, unfilled: float) -> Fill:
+    return Fill(
+        ord_dt="20240102", odno=odno, symbol="TQQQ", is_buy=True,
+        order_qty=filled + unfilled, filled_qty=filled, filled_price=50.0,
+        filled_amount=filled * 50.0, unfilled_qty=unfilled, order_time="093000",
+        synced_at=datetime.now()
+    )
+
+
+class _SequencedFetch:
+    """호출할 때마다 정해진 체결 상태를 차례로 반환 (마지막 상태 유지)"""
+
+    def __init__(self, odno: str, states):
+        self.odno = odno
+        self.states = list(states)
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, odnos):
+        with self._lock:
+            state = self.states[min(self.calls, len(self.states) - 1)]
+            self.calls += 1
+        if state is None or self.odno not in odnos:
+            return {}
+        return {self.odno: _fill(self.odno, *state)}
+
+
+def test_partial_then_full_fill():
+    """부분 체결(3/10) 후 전량 체결(10/10)되면 전량 체결로 완료"""
+    fetch = _SequencedFetch("0001", [(3, 7), (10, 0)])
+    tracker = HantooFillTracker(fetch, schedule=(0.01,), max_interval=0.01, timeout=5.0)
+    fill = tracker.track("0001", "TQQQ").result(timeout=5.0)
+    assert fill.filled_qty == 10 and fill.unfilled_qty == 0, fill
+    assert fetch.calls == 2
+
+
+def test_partial_at_first_poll_with_default_schedule():
+    """기본 간격(0.5 → 1 → 2)처럼 첫 확인 시점에 아직 체결 중이어도 전량 체결까지 기다림"""
+    fetch = _SequencedFetch("0002", [None, (4, 6), (8, 2), (10, 0)])
+    tracker = HantooFillTracker(fetch, schedule=(0.01, 0.02, 0.04), max_interval=0.05, timeout=5.0)
+    fill = tracker.track("0002", "TQQQ").result(timeout=5.0)
+    assert fill.filled_qty == 10, fill
+    assert tracker.fill_time_stats()["TQQQ"]["count"] == 1
+
+
+def test_deadline_returns_last_partial_fill():
+    """제한 시간 안에 전량 체결되지 않으면 마지막 부분 체결로 완료 (None이 아님)"""
+    fetch = _SequencedFetch("0003", [(2, 8), (5, 5)])
+    tracker = HantooFillTracker(fetch, schedule=(0.01,), max_interval=0.01, timeout=0.1)
+    fill = tracker.track("0003", "TQQQ").result(timeout=5.0)
+    assert fill is not None and fill.filled_qty == 5 and fill.unfilled_qty == 5, fill
+    assert tracker.pending_count() == 0
+
+
+def test_deadline_without_fill_returns_none():
+    """체결 내역이 한 번도 없으면 None으로 완료"""
+    fetch = _SequencedFetch("0004", [None])
+    tracker = HantooFillTracker(fetch, schedule=(0.01,), max_interval=0.01, timeout=0.05)
+    assert tracker.track("0004", "TQQQ").result(timeout=5.0) is None
+
+
+if __name__ == "__main__":
+    failed = 0
+    for name, test in list(globals().items()):
+        if not name.startswith("test_") or not callable(test):
+            continue
+        try:
+            test()
+            print(f"✅ {name}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {name}: {e}")
+    sys.exit(1 if failed else 0)
@@ -4,11 +4,13 @@ from usecase.bot_management_usecase import BotManagementUsecase
 from usecase.order_usecase import OrderUsecase
 from usecase.trading_usecase import TradingUsecase
 from usecase.market_usecase import MarketUsecase
+from usecase.warmup_usecase import WarmupUsecase
 
 __all__ = [
     'PortfolioStatusUsecase',
     'BotManagementUsecase',
     'OrderUsecase',
     'TradingUsecase',
-    'MarketUsecase'
+    'MarketUsecase',
+    'WarmupUsecase'
 ]
@@ -2,6 +2,7 @@
 from datetime import datetime
 from typing import Dict, Any, Optional, Set, List, TYPE_CHECKING
 
+from config.item import DASHBOARD_QUOTE_MAX_AGE
 from domain.repositories.market_indicator_repository import MarketIndicatorRepository
 from domain.repositories import ExchangeRepository
 from domain.value_objects.indicator_level import IndicatorLevel
@@ -63,7 +64,9 @@ class MarketUsecase:
 
             # 현재가 (ExchangeRepository가 있으면 실시간, 없으면 yf 데이터 사용)
             if self.exchange_repo:
-                current_price = self.exchange_repo.get_price(ticker.upper())
+                current_price = self.exchange_repo.get_price(
+                    ticker.upper(), max_age=DASHBOARD_QUOTE_MAX_AGE
+                )
                 current_date = datetime.now().strftime("%Y-%m-%d")
                 if current_price is None:
                     # 실시간 조회 실패 시 yf 데이터 사용
@@ -121,6 +124,9 @@ class MarketUsecase:
             days = 90
             result = {}
 
+            # 만료된 티커는 개별 순차 다운로드 대신 한 번에 일괄 갱신
+            self.prefetch_market_data(tickers)
+
             # VIX 히스토리 조회
             vix_history = self.market_indicator_repo.get_price_history(ticker="^VIX", days=days)
             if vix_history:
@@ -180,6 +186,20 @@ class MarketUsecase:
             traceback.print_exc()
             return None
 
+    def prefetch_market_data(self, tickers: Optional[Set[str]] = None) -> Dict[str, bool]:
+        """
+        대시보드/거래 작업이 사용할 시세 캐시를 미리 일괄 갱신
+
+        Args:
+            tickers: 추가로 갱신할 티커 Set (기본값 {'TQQQ', 'SOXL', '^VIX'}에 합쳐짐)
+
+        Returns:
+            Dict[str, bool]: 티커 → 캐시 준비 여부
+        """
+        default_tickers = {'TQQQ', 'SOXL', '^VIX'}
+        target_tickers = default_tickers.union(tickers) if tickers else default_tickers
+        return self.market_indicator_repo.prefetch(sorted(target_tickers))
+
     def refresh_market_data(self, tickers: Optional[Set[str]] = None) -> Dict[str, Any]:
         """
         시장 데이터 캐시 삭제 후 재조회
@@ -175,17 +175,19 @@ class OrderUsecase:
             self.message_repo.send_message(f"❌ [{bot_info.name}] 장마감 급락 체크: T최대치 초과 T : {t:,.2f}")
             return None
 
-        prev_price = self.exchange_repo.get_prev_price(bot_info.symbol)
+        # 전일 종가 + 현재가를 1회 호출로 조회
+        quote = self.exchange_repo.get_quote(bot_info.symbol)
+        prev_price = quote.base if quote else None
         if not prev_price:
             self.message_repo.send_message(f"[{bot_info.name}] 장마감 급락 체크: 전일 종가 조회 실패")
             return None
 
-        cur_price = self.exchange_repo.get_price(bot_info.symbol)
+        cur_price = quote.last
         if not cur_price:
             self.message_repo.send_message(f"[{bot_info.name}] 장마감 급락 체크: 현재가 조회 실패")
             return None
 
-        drop_ratio = (prev_price - cur_price) / prev_price
+        drop_ratio = quote.drop_ratio
 
         matched = bot_info.get_matching_closing_condition(drop_ratio)
 
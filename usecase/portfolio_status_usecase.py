@@ -2,12 +2,13 @@
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
-from config import util
+from config import util, item
 from domain.repositories import (
     BotInfoRepository,
     TradeRepository,
     HistoryRepository,
     ExchangeRepository,
+    FillLedgerRepository,
 )
 from domain.value_objects.trade_type import TradeType
 
@@ -20,7 +21,8 @@ class PortfolioStatusUsecase:
             bot_info_repo: BotInfoRepository,
             trade_repo: TradeRepository,
             history_repo: HistoryRepository,
-            exchange_repo: ExchangeRepository
+            exchange_repo: ExchangeRepository,
+            fill_ledger_repo: Optional[FillLedgerRepository] = None
     ):
         """
         포트폴리오 상태 Usecase 초기화
@@ -30,11 +32,13 @@ class PortfolioStatusUsecase:
             trade_repo: Trade 리포지토리
             history_repo: History 리포지토리
             exchange_repo: 증권사 API 리포지토리
+            fill_ledger_repo: 체결 원장 리포지토리 (선택, 체결 요약 리포트용)
         """
         self.bot_info_repo = bot_info_repo
         self.trade_repo = trade_repo
         self.history_repo = history_repo
         self.exchange_repo = exchange_repo
+        self.fill_ledger_repo = fill_ledger_repo
 
     # ===== 조회 메서드 (Dict 반환) =====
 
@@ -79,7 +83,7 @@ class PortfolioStatusUsecase:
                 return None
 
             # 현재가, 손익, 수익률
-            cur_price = self.exchange_repo.get_price(bot_info.symbol)
+            cur_price = self.exchange_repo.get_price(bot_info.symbol, max_age=item.DASHBOARD_QUOTE_MAX_AGE)
             if cur_price is None:
                 cur_price = cur_trade.purchase_price
 
@@ -148,6 +152,7 @@ class PortfolioStatusUsecase:
             seed_per_tier = 0.0  # 활성 봇의 1티어 시드 합계
 
             bot_info_list = self.bot_info_repo.find_all()
+            holdings = []
             for bot_info in bot_info_list:
                 total_max_seed += bot_info.seed * bot_info.max_tier
 
@@ -160,8 +165,15 @@ class PortfolioStatusUsecase:
 
                 # 보유 중인 봇의 1티어 시드 누적
                 seed_per_tier += bot_info.seed
+                holdings.append((bot_info, trade))
 
-                price = self.exchange_repo.get_price(bot_info.symbol)
+            # 보유 종목 현재가 일괄 조회
+            prices = self.exchange_repo.get_prices(
+                [bot_info.symbol for bot_info, _ in holdings],
+                max_age=item.DASHBOARD_QUOTE_MAX_AGE
+            )
+            for bot_info, trade in holdings:
+                price = prices.get(bot_info.symbol)
                 if price is None:
                     price = trade.purchase_price
                 invest += trade.amount * price
@@ -226,6 +238,7 @@ class PortfolioStatusUsecase:
             seed_per_tier = 0.0
             max_seed = 0.0
 
+            holdings = []
             for bot_info in bot_info_list:
                 total_max_seed += bot_info.max_tier * bot_info.seed
                 if not bot_info.active:
@@ -240,11 +253,19 @@ class PortfolioStatusUsecase:
                 if trade.amount > 0:
                     seed_per_tier += bot_info.seed
                     max_seed += bot_info.seed * bot_info.max_tier
-                    price = self.exchange_repo.get_price(bot_info.symbol)
-                    if price is None:
-                        price = trade.purchase_price
-                    invest += trade.amount * price
-                    total_buy += trade.total_price
+                    holdings.append((bot_info, trade))
+
+            # 보유 종목 현재가 일괄 조회
+            prices = self.exchange_repo.get_prices(
+                [bot_info.symbol for bot_info, _ in holdings],
+                max_age=item.DASHBOARD_QUOTE_MAX_AGE
+            )
+            for bot_info, trade in holdings:
+                price = prices.get(bot_info.symbol)
+                if price is None:
+                    price = trade.purchase_price
+                invest += trade.amount * price
+                total_buy += trade.total_price
 
             rp = self._get_rp()
             total_profit = self.history_repo.get_total_sell_profit()
@@ -342,6 +363,49 @@ class PortfolioStatusUsecase:
                 "has_profit": False
             }
 
+    def get_recent_fills(self) -> Dict[str, Any]:
+        """
+        최근 체결 요약 조회 (체결 원장 기준, 전일~금일 주문)
+
+        증권사 체결 내역은 증분 동기화 후 로컬 원장에서 집계
+
+        Returns:
+            Dict: 체결 요약
+                {
+                    "count": int,
+                    "symbols": [
+                        {
+                            "symbol": str,
+                            "buy_qty": float,
+                            "buy_amount": float,
+                            "sell_qty": float,
+                            "sell_amount": float
+                        },
+                        ...
+                    ]
+                }
+        """
+        if self.fill_ledger_repo is None:
+            return {"count": 0, "symbols": []}
+
+        try:
+            self.exchange_repo.sync_fills()
+        except Exception as e:
+            print(f"⚠️ 체결 원장 동기화 실패 (기존 원장으로 집계): {str(e)}")
+
+        fills = self.fill_ledger_repo.find_since(util.get_previous_date(1))
+
+        by_symbol = {}
+        for fill in fills:
+            summary = by_symbol.setdefault(fill.symbol, {
+                "symbol": fill.symbol, "buy_qty": 0.0, "buy_amount": 0.0, "sell_qty": 0.0, "sell_amount": 0.0
+            })
+            side = "buy" if fill.is_buy else "sell"
+            summary[f"{side}_qty"] += fill.filled_qty
+            summary[f"{side}_amount"] += fill.filled_amount
+
+        return {"count": len(fills), "symbols": list(by_symbol.values())}
+
     def get_profit_summary(self) -> str:
         """
         연도별/월별 수익 요약 조회
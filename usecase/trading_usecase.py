@@ -165,32 +165,150 @@ class TradingUsecase:
 
         egg/order_module.py의 check_order_request() 이관 (97-115번 줄)
         """
+        order = self.prepare_twap(bot_info)
+        if order is None:
+            return
+
+        succeeded = self.run_twap_slice(order)
+        self.finish_twap(order, succeeded)
+
+    def prepare_twap(self, bot_info: BotInfo) -> Optional[Order]:
+        """
+        TWAP 1회 실행 준비 (주문서 조회 + 주문 가능 여부 확인, DB 접근)
+
+        Args:
+            bot_info: 봇 정보
+
+        Returns:
+            Order: 이번 회차를 실행할 주문서, 실행할 주문이 없으면 None
+        """
         order = self.order_repo.find_by_name(bot_info.name)
         if not order:
-            return
+            return None
 
         current_num = order.total_count - order.trade_count + 1
         print(f"{order.name}의 {current_num}/{order.total_count} 주문검사를 시작합니다")
 
-        if self._is_order_available(order):
-            try:
-                if self._is_buy(order):
-                    order = self._execute_single_buy(order)
-                else:
-                    order = self._execute_single_sell(order)
-                self.order_repo.save(order)
-            except Exception as e:
-                self.message_repo.send_message(
-                    f"⚠️ [{order.name}] TWAP {current_num}/{order.total_count} 실행 중 오류 발생: {e}\n"
-                    f"  → 다음 TWAP 시간에 계속 진행합니다"
+        if not self._is_order_available(order):
+            return None
+        return order
+
+    def run_twap_slice(self, order: Order) -> bool:
+        """
+        TWAP 1회 주문 실행 (증권사 호출만 수행, DB 접근 없음 - 워커 스레드에서 호출 가능)
+
+        주문서(order)는 메모리에서만 갱신되며 저장은 finish_twap()에서 수행
+
+        Args:
+            order: prepare_twap()이 반환한 주문서
+
+        Returns:
+            bool: 주문 처리 완료 여부 (예외 발생 시 False)
+        """
+        current_num = order.total_count - order.trade_count + 1
+        try:
+            if self._is_buy(order):
+                self._execute_single_buy(order)
+            else:
+                self._execute_single_sell(order)
+            return True
+        except Exception as e:
+            self.message_repo.send_message(
+                f"⚠️ [{order.name}] TWAP {current_num}/{order.total_count} 실행 중 오류 발생: {e}\n"
+                f"  → 다음 TWAP 시간에 계속 진행합니다"
+            )
+            # 예외 발생 시에도 order는 이미 업데이트된 상태 (None이 추가되고 trade_count 감소)
+            return False
+
+    def run_aggregated_twap_slice(self, orders: List[Order]) -> bool:
+        """
+        같은 종목/같은 방향의 TWAP 회차 묶음을 증권사 주문 1건으로 실행 (DB 접근 없음)
+
+        봇별 요청 수량을 합쳐 1회 주문/1회 체결 확인하고, 체결 수량을 요청 수량 비율로
+        각 주문서에 나눠 반영한다. 주문서 저장은 봇별로 finish_twap()에서 수행.
+
+        Args:
+            orders: prepare_twap()이 반환한 주문서 목록 (같은 종목, 모두 매수 또는 모두 매도)
+
+        Returns:
+            bool: 주문 처리 완료 여부 (예외 발생 시 False)
+        """
+        if len(orders) == 1:
+            return self.run_twap_slice(orders[0])
+
+        symbol = orders[0].symbol
+        is_buy = self._is_buy(orders[0])
+        if any(order.symbol != symbol or self._is_buy(order) != is_buy for order in orders):
+            raise ValueError("같은 종목, 같은 방향의 주문서만 묶을 수 있습니다.")
+
+        names = ", ".join(order.name for order in orders)
+        try:
+            # 주문가 1회 조회
+            if is_buy:
+                request_price = self.exchange_repo.get_available_buy(symbol)
+            else:
+                request_price = self.exchange_repo.get_available_sell(symbol)
+            if not request_price:
+                self.message_repo.send_message(f"❌ [{names}] 현재가 조회 실패")
+                for order in orders:
+                    self._apply_slice_result(order, None)
+                return True
+
+            # 봇별 요청 수량 (개별 실행과 같은 계산)
+            if is_buy:
+                amounts = [
+                    util.get_buy_amount(int(order.remain_value * (1 / order.trade_count)), request_price)
+                    for order in orders
+                ]
+            else:
+                amounts = [int(order.remain_value * (1 / order.trade_count)) for order in orders]
+            total_amount = sum(amounts)
+
+            print(f"[{symbol}] {'구매' if is_buy else '판매'} 주문 {len(orders)}건을 묶어 요청합니다\n"
+                  f"  📊 요청 정보:\n"
+                  + "".join(f"    - {order.name}: {amount}\n" for order, amount in zip(orders, amounts))
+                  + f"    - 합계 수량: {total_amount}")
+
+            trade_result = None
+            if total_amount > 0:
+                # 묶음 키는 구성 회차 키로 결정 (재시도해도 같은 키 → 중복 주문 방지)
+                client_key = "+".join(order.get_slice_key() for order in orders)
+                request = self.exchange_repo.buy if is_buy else self.exchange_repo.sell
+                trade_result = request(
+                    symbol=symbol,
+                    amount=total_amount,
+                    request_price=request_price,
+                    client_key=client_key
                 )
-                # 예외 발생 시에도 order는 이미 업데이트된 상태 (None이 추가되고 trade_count 감소)
 
-            # 주문 완료 시 DB 저장
-            # 조건 1: trade_count가 0
-            # 조건 2: 마지막 TWAP 시간이 지났고 유효한 거래가 있는 경우
-            if order.trade_count == 0 or self._is_last_twap_passed(order):
-                self._complete_trade(order)
+            if trade_result is None and total_amount > 0:
+                self._notify_if_unconfirmed(names, client_key)
+            for order, allocation in zip(orders, self._allocate_fill(trade_result, amounts)):
+                self._apply_slice_result(order, allocation)
+            return True
+        except Exception as e:
+            self.message_repo.send_message(
+                f"⚠️ [{names}] {symbol} 묶음 TWAP 실행 중 오류 발생: {e}\n"
+                f"  → 다음 TWAP 시간에 계속 진행합니다"
+            )
+            return False
+
+    def finish_twap(self, order: Order, succeeded: bool = True) -> None:
+        """
+        TWAP 1회 결과 저장 + 완료 처리 (DB 접근)
+
+        Args:
+            order: run_twap_slice()로 갱신된 주문서
+            succeeded: run_twap_slice() 결과 (False면 주문서 저장 생략)
+        """
+        if succeeded:
+            self.order_repo.save(order)
+
+        # 주문 완료 시 DB 저장
+        # 조건 1: trade_count가 0
+        # 조건 2: 마지막 TWAP 시간이 지났고 유효한 거래가 있는 경우
+        if order.trade_count == 0 or self._is_last_twap_passed(order):
+            self._complete_trade(order)
 
     def execute_netting(self, netting_pair: NettingPair) -> None:
         """
@@ -608,41 +726,17 @@ class TradingUsecase:
               f"    - 총액: ${request_seed:,.0f}")
 
         # 주문 실행
+        client_key = order.get_slice_key()
         trade_result = self.exchange_repo.buy(
             symbol=order.symbol,
             amount=request_amount,
-            request_price=request_price
+            request_price=request_price,
+            client_key=client_key
         )
+        if trade_result is None:
+            self._notify_if_unconfirmed(order.name, client_key)
 
-        if order.trade_result_list is None:
-            order.trade_result_list = []
-
-        # 거래 결과 저장
-        if trade_result:
-            trade_result.trade_type = TradeType(order.order_type.value)
-            trade_result_dict = {
-                'trade_type': trade_result.trade_type.value,
-                'amount': trade_result.amount,
-                'unit_price': trade_result.unit_price,
-                'total_price': trade_result.total_price
-            }
-            order.trade_result_list.append(trade_result_dict)
-            order.remain_value -= trade_result.total_price
-        else:
-            order.trade_result_list.append(None)
-
-        # 현재 거래 횟수 계산
-        current_trade_num = order.total_count - order.trade_count + 1
-        order.trade_count -= 1
-
-        # 결과 출력
-        if trade_result:
-            print(f"✅ [{order.name}] 개별 거래 결과 ({current_trade_num}/{order.total_count})\n"
-                  f"  - 거래유형: {trade_result.trade_type.value}\n"
-                  f"  - 체결개수: {trade_result.amount}\n"
-                  f"  - 체결가: ${trade_result.unit_price:,.2f}")
-        else:
-            print(f"✅ [{order.name}] 거래 결과: 거래 실패 or 거래가 없습니다 ({current_trade_num}/{order.total_count})")
+        self._apply_slice_result(order, trade_result)
 
         return order
 
@@ -680,12 +774,28 @@ class TradingUsecase:
             order.trade_count -= 1
             return order
 
+        client_key = order.get_slice_key()
         trade_result = self.exchange_repo.sell(
             symbol=order.symbol,
             amount=request_amount,
-            request_price=request_price
+            request_price=request_price,
+            client_key=client_key
         )
+        if trade_result is None:
+            self._notify_if_unconfirmed(order.name, client_key)
 
+        self._apply_slice_result(order, trade_result)
+
+        return order
+
+    def _apply_slice_result(self, order: Order, trade_result: Optional[TradeResult]) -> None:
+        """
+        TWAP 1회 결과를 주문서에 반영 (메모리 갱신만)
+
+        Args:
+            order: 주문 정보
+            trade_result: 체결 결과 (실패/미체결이면 None)
+        """
         if order.trade_result_list is None:
             order.trade_result_list = []
 
@@ -699,7 +809,10 @@ class TradingUsecase:
                 'total_price': trade_result.total_price
             }
             order.trade_result_list.append(trade_result_dict)
-            order.remain_value -= trade_result.amount  # 판매는 수량을 차감
+            if self._is_buy(order):
+                order.remain_value -= trade_result.total_price
+            else:
+                order.remain_value -= trade_result.amount  # 판매는 수량을 차감
         else:
             order.trade_result_list.append(None)
 
@@ -716,7 +829,55 @@ class TradingUsecase:
         else:
             print(f"✅ [{order.name}] 거래 결과: 거래 실패 or 거래가 없습니다 ({current_trade_num}/{order.total_count})")
 
-        return order
+    def _notify_if_unconfirmed(self, names: str, client_key: str) -> None:
+        """
+        접수 여부 불명 주문 알림 (회차는 결과 없음으로 넘어가므로 수동 확인 필요)
+
+        Args:
+            names: 봇 이름 (묶음 주문이면 쉼표로 연결)
+            client_key: 클라이언트 주문 키
+        """
+        if not self.exchange_repo.is_order_unconfirmed(client_key):
+            return
+        self.message_repo.send_message(
+            f"⚠️ [{names}] 주문 응답을 받지 못했고 주문 내역에서도 확인되지 않았습니다 ({client_key})\n"
+            f"  → 이 회차는 결과 없음으로 넘어갑니다. 나중에 접수/체결되어도 봇에 반영되지 않으니 증권사 주문 내역을 확인하세요"
+        )
+
+    @staticmethod
+    def _allocate_fill(trade_result: Optional[TradeResult], amounts: List[int]) -> List[Optional[TradeResult]]:
+        """
+        묶음 주문 체결을 요청 수량 비율로 배분 (1주 단위, 최대 잔여 방식)
+
+        각 주문의 배분 수량은 요청 수량을 넘지 않으며, 배분 합계는 체결 수량과 같다.
+        체결 단가는 모두 동일하고 체결 금액은 배분 수량 비율로 나눈다.
+
+        Args:
+            trade_result: 묶음 주문 체결 결과 (없으면 전부 None)
+            amounts: 주문별 요청 수량
+
+        Returns:
+            List[Optional[TradeResult]]: 주문별 배분 결과 (배분 수량 0이면 None)
+        """
+        total = sum(amounts)
+        if not trade_result or trade_result.amount <= 0 or total <= 0:
+            return [None] * len(amounts)
+
+        filled = min(int(round(trade_result.amount)), total)
+        shares = [filled * amount // total for amount in amounts]
+        # 나머지 주식은 버림으로 잘린 몫이 큰 주문부터 1주씩 (동률이면 앞 주문 우선)
+        by_remainder = sorted(range(len(amounts)), key=lambda i: (-(filled * amounts[i] % total), i))
+        for i in by_remainder[:filled - sum(shares)]:
+            shares[i] += 1
+
+        return [
+            TradeResult(
+                amount=share,
+                unit_price=trade_result.unit_price,
+                total_price=trade_result.total_price * share / filled
+            ) if share > 0 else None
+            for share in shares
+        ]
 
     def _complete_trade(self, order: Order) -> None:
         """
@@ -0,0 +1,121 @@
+"""Warmup Usecase - 거래 시작 전 사전 준비"""
+import time
+from typing import Callable, Dict, List, Optional
+
+from config.util import is_trade_date
+from domain.repositories import (
+    BotInfoRepository,
+    TradeRepository,
+    OrderRepository,
+    ExchangeRepository,
+)
+
+
+class WarmupUsecase:
+    """
+    사전 준비 Usecase
+
+    첫 trade_job/twap_job이 토큰 갱신, DNS/TLS 연결, DB 첫 조회, 모듈 첫 import 비용을
+    떠안지 않도록 거래 시작 몇 분 전에 같은 경로를 미리 실행하고 단계별 소요 시간을 기록
+    """
+
+    def __init__(
+        self,
+        bot_info_repo: BotInfoRepository,
+        trade_repo: TradeRepository,
+        order_repo: OrderRepository,
+        exchange_repo: ExchangeRepository,
+    ):
+        """
+        Args:
+            bot_info_repo: BotInfo 저장소
+            trade_repo: Trade 저장소
+            order_repo: Order 저장소
+            exchange_repo: 증권사 API 리포지토리
+        """
+        self.bot_info_repo = bot_info_repo
+        self.trade_repo = trade_repo
+        self.order_repo = order_repo
+        self.exchange_repo = exchange_repo
+
+    def warm_up(self) -> Dict[str, Optional[float]]:
+        """
+        사전 준비 실행
+
+        - calendar: 거래일 캘린더 (pandas_market_calendars 첫 import 포함), 휴장일이면 여기서 종료
+        - db:*: 거래 작업이 읽는 테이블 조회 (커넥션/페이지 캐시 적재)
+        - 증권사: 토큰/커넥션/시세/체결 원장 (ExchangeRepository.warm_up)
+
+        각 단계는 실패해도 다음 단계를 계속 진행한다.
+
+        Returns:
+            Dict[str, Optional[float]]: 단계 이름 → 소요 시간 (ms, 실패한 단계는 None), 실행 순서 유지
+        """
+        timings: Dict[str, Optional[float]] = {}
+
+        trade_date = self._timed(timings, "calendar", is_trade_date)
+        if trade_date is False:
+            print("📅 휴장일 - 사전 준비를 건너뜁니다")
+            return timings
+
+        bot_infos = self._timed(timings, "db:bot_info", self.bot_info_repo.find_all) or []
+        orders = self._timed(timings, "db:order", self.order_repo.find_all) or []
+        self._timed(timings, "db:trade", self.trade_repo.find_all)
+
+        symbols = [bot_info.symbol for bot_info in bot_infos if bot_info.active]
+        symbols += [order.symbol for order in orders]
+        exchange_timings = self._timed(timings, "exchange", lambda: self.exchange_repo.warm_up(symbols)) or {}
+        timings.update({f"exchange:{step}": elapsed for step, elapsed in exchange_timings.items()})
+
+        return timings
+
+    @staticmethod
+    def find_problems(timings: Dict[str, Optional[float]], slow_ms: float) -> List[str]:
+        """
+        실패했거나 느린 단계 조회 (이 단계들이 있을 때만 메시지로 보고)
+
+        Args:
+            timings: warm_up() 결과
+            slow_ms: 느린 단계 기준 (ms)
+
+        Returns:
+            List[str]: 문제 단계 이름 목록
+        """
+        # exchange는 하위 단계(exchange:*)의 합계이므로 실패 여부만 확인
+        return [
+            step for step, elapsed in timings.items()
+            if elapsed is None or (step != "exchange" and elapsed > slow_ms)
+        ]
+
+    @staticmethod
+    def format_report(timings: Dict[str, Optional[float]]) -> str:
+        """
+        단계별 소요 시간 메시지 생성
+
+        Args:
+            timings: warm_up() 결과
+
+        Returns:
+            str: 메시지 문자열
+        """
+        # exchange는 하위 단계(exchange:*)의 합계이므로 총합에서 제외
+        total = sum(elapsed or 0.0 for step, elapsed in timings.items() if not step.startswith("exchange:"))
+        lines = [f"🔥 사전 준비 완료 (총 {total:,.0f}ms)"]
+        lines += [
+            f"  - {step}: ❌ 실패" if elapsed is None else f"  - {step}: {elapsed:,.1f}ms"
+            for step, elapsed in timings.items()
+        ]
+        return "\n".join(lines)
+
+    @staticmethod
+    def _timed(timings: Dict[str, Optional[float]], step: str, func: Callable):
+        """단계 실행 + 소요 시간 기록 (실패 시 소요 시간 None 기록 후 None 반환)"""
+        started = time.perf_counter()
+        try:
+            result = func()
+        except Exception as e:
+            print(f"⚠️ 사전 준비 실패 ({step}): {e}")
+            timings[step] = None
+            return None
+        timings[step] = round((time.perf_counter() - started) * 1000, 1)
+        return result